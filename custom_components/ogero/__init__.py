@@ -6,21 +6,29 @@ from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
 from . import api
 from .const import CONF_DISABLED_ACCOUNTS, DOMAIN
-from .data import OgeroData
+from .data import OgeroData, get_domain_data
+from .history import OgeroHistoryStore
 from .migrate import async_migrate_entry as async_migrate_entry
 from .platform_helpers import (
     async_setup_account_coordinators,
     get_disabled_account_serials,
+    get_request_budget,
     get_update_interval,
 )
+from .services import async_setup_services
+from .shared_cache import create_shared_cache
+from .tracing import create_tracer
+from .view import OgeroMetricsView
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import OgeroConfigEntry
 
@@ -29,6 +37,15 @@ PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up Ogero service actions and the metrics view."""
+    async_setup_services(hass)
+    hass.http.register_view(OgeroMetricsView())
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: OgeroConfigEntry) -> bool:
     """Set up Ogero from a config entry."""
@@ -37,28 +54,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: OgeroConfigEntry) -> boo
     if runtime is not None:
         old_coordinator_keys = set(runtime.coordinators)
 
-    client = api.create_api_client(
-        hass,
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-    )
-
-    entry.runtime_data = OgeroData(
-        client=client,
-        integration=async_get_loaded_integration(hass, entry.domain),
-    )
-    entry.runtime_data.coordinators.clear()
-    await async_setup_account_coordinators(hass, entry, get_update_interval(entry))
-
-    new_keys = set(entry.runtime_data.coordinators)
-    if (
-        entry.state == ConfigEntryState.LOADED
-        and old_coordinator_keys
-        and new_keys != old_coordinator_keys
-    ):
-        hass.config_entries.async_schedule_reload(entry.entry_id)
+    tracer = create_tracer(hass, entry.entry_id, entry.options)
+    with tracer.span("setup_entry", entry_id=entry.entry_id):
+        client = api.create_api_client(
+            hass,
+            username=entry.data[CONF_USERNAME],
+            password=entry.data[CONF_PASSWORD],
+        )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        history = OgeroHistoryStore(hass, entry.entry_id)
+        await history.async_load()
+        entry.runtime_data = OgeroData(
+            client=client,
+            integration=async_get_loaded_integration(hass, entry.domain),
+            history=history,
+            tracer=tracer,
+            shared_cache=create_shared_cache(hass, entry),
+        )
+        entry.runtime_data.coordinators.clear()
+        get_domain_data(hass).budget.register_login(
+            entry.entry_id, get_request_budget(entry)
+        )
+        await async_setup_account_coordinators(hass, entry, get_update_interval(entry))
+
+        new_keys = set(entry.runtime_data.coordinators)
+        history.retain(new_keys)
+        if (
+            entry.state == ConfigEntryState.LOADED
+            and old_coordinator_keys
+            and new_keys != old_coordinator_keys
+        ):
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
@@ -67,10 +95,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: OgeroConfigEntry) -> bo
     """Unload a config entry."""
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
+        if entry.runtime_data.profiler is not None:
+            entry.runtime_data.profiler.async_cancel()
+        await entry.runtime_data.history.async_save()
+        get_domain_data(hass).budget.unregister_login(entry.entry_id)
+        await entry.runtime_data.client.async_close()
         entry.runtime_data = None
     return bool(unloaded)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: OgeroConfigEntry) -> None:
+    """Delete the stored consumption history and bills of a removed login."""
+    await OgeroHistoryStore(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, entry: OgeroConfigEntry, device: dr.DeviceEntry
 ) -> bool:
@@ -81,6 +119,9 @@ async def async_remove_config_entry_device(
         if identifier[0] != DOMAIN:
             continue
         account_serial = identifier[1]
+        if account_serial == entry.entry_id:
+            # The login device holds the totals; it goes with the entry.
+            return False
         disabled = sorted(get_disabled_account_serials(entry))
         if account_serial in disabled:
             return False
@@ -0,0 +1,111 @@
+"""Running totals across the lines of one Ogero login."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+if TYPE_CHECKING:
+    from .coordinator import OgeroCoordinatorData
+
+
+class _LineContribution(NamedTuple):
+    """What one line adds to the login totals."""
+
+    outstanding_balance: int
+    total_consumption: float
+    over_quota: int
+    unpaid_bills: int
+
+
+_EMPTY = _LineContribution(0, 0.0, 0, 0)
+
+
+class OgeroLoginTotals:
+    """
+    Login-wide totals updated one line at a time.
+
+    Each line update subtracts that line's previous contribution and adds the
+    new one, so the cost does not grow with the number of lines.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._lines: dict[str, _LineContribution] = {}
+        self._totals = _EMPTY
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @property
+    def lines(self) -> int:
+        """Return how many lines have data."""
+        return len(self._lines)
+
+    @property
+    def outstanding_balance(self) -> int:
+        """Return the summed outstanding balance."""
+        return self._totals.outstanding_balance
+
+    @property
+    def total_consumption(self) -> float:
+        """Return the summed consumption (rounded to hide float drift)."""
+        return round(self._totals.total_consumption, 3)
+
+    @property
+    def lines_over_quota(self) -> int:
+        """Return how many lines have extra consumption."""
+        return self._totals.over_quota
+
+    @property
+    def lines_with_unpaid_bills(self) -> int:
+        """Return how many lines have unpaid bills."""
+        return self._totals.unpaid_bills
+
+    @callback
+    def async_update_line(self, line: str, data: OgeroCoordinatorData | None) -> None:
+        """Replace a line's contribution; notify listeners if totals changed."""
+        new = (
+            _EMPTY
+            if data is None
+            else _LineContribution(
+                data.outstanding_balance,
+                data.total_consumption,
+                int(data.has_extra_consumption),
+                int(data.has_unpaid_bills),
+            )
+        )
+        old = self._lines.get(line)
+        if data is None:
+            self._lines.pop(line, None)
+        else:
+            self._lines[line] = new
+        if old == new or (old is None and data is None):
+            return
+        self._apply(old or _EMPTY, new)
+
+    @callback
+    def async_remove_line(self, line: str) -> None:
+        """Drop a line that is no longer polled."""
+        self.async_update_line(line, None)
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback when the totals change; return a remover."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _apply(self, old: _LineContribution, new: _LineContribution) -> None:
+        t = self._totals
+        self._totals = _LineContribution(
+            t.outstanding_balance + new.outstanding_balance - old.outstanding_balance,
+            t.total_consumption + new.total_consumption - old.total_consumption,
+            t.over_quota + new.over_quota - old.over_quota,
+            t.unpaid_bills + new.unpaid_bills - old.unpaid_bills,
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
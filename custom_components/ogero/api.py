@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from pyogero.asyncio import Account as OgeroAccount
 from pyogero.asyncio import AuthenticationException, BillInfo, ConsumptionInfo, Ogero
 from pyogero.exceptions import OgeroCommunicationError, OgeroParseError
 
-from .const import LOGGER
+from .cassette import (
+    Cassette,
+    Interaction,
+    bill_info_from_dict,
+    bill_info_to_dict,
+    consumption_from_dict,
+    consumption_to_dict,
+)
+from .const import (
+    CASSETTE_RECORD,
+    CASSETTE_REPLAY,
+    CASSETTE_SAVE_DELAY,
+    DEFAULT_CASSETTE_FILE,
+    ENV_CASSETTE_LATENCY,
+    ENV_CASSETTE_MODE,
+    ENV_CASSETTE_PATH,
+    LOGGER,
+)
+from .data import get_domain_data
+from .timeline import received_bytes_trace_config
 
 if TYPE_CHECKING:
-    import aiohttp
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
 
 
@@ -25,21 +50,37 @@ class OgeroApiClientCommunicationError(OgeroApiClientError):
     """Exception to indicate a communication error."""
 
 
+class OgeroApiClientConnectionError(OgeroApiClientCommunicationError):
+    """Exception to indicate that the portal could not be reached at all."""
+
+
 class OgeroApiClientAuthenticationError(OgeroApiClientError):
     """Exception to indicate an authentication error."""
 
 
-@dataclass
+def _communication_error(
+    error: OgeroCommunicationError,
+) -> OgeroApiClientCommunicationError:
+    """Wrap a pyogero communication error, singling out unreachable portals."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, (aiohttp.ClientConnectionError, TimeoutError)):
+            return OgeroApiClientConnectionError(str(error))
+        cause = cause.__cause__ or cause.__context__
+    return OgeroApiClientCommunicationError(str(error))
+
+
+@dataclass(frozen=True, slots=True)
 class Account:
     """Account class."""
 
     internet: str
     phone: str
+    serial: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def serial(self) -> str:
-        """Serial value from account."""
-        return f"{self.internet}|{self.phone}"
+    def __post_init__(self) -> None:
+        """Build the serial once; it keys coordinators, devices and options."""
+        object.__setattr__(self, "serial", f"{self.internet}|{self.phone}")
 
     @staticmethod
     def deserialize(serial: str) -> Account:
@@ -79,16 +120,48 @@ class AccountMapper:
         return Account(internet=account.internet, phone=account.phone)
 
 
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """
+    Return the aiohttp session shared by all Ogero logins.
+
+    It is separate from Home Assistant's shared session so that the bytes of
+    each response can be counted for the poll timeline.
+    """
+    domain_data = get_domain_data(hass)
+    if domain_data.session is None:
+        domain_data.session = async_create_clientsession(
+            hass, trace_configs=[received_bytes_trace_config()]
+        )
+    return domain_data.session
+
+
 def create_api_client(
     hass: HomeAssistant,
     username: str,
     password: str,
 ) -> OgeroApiClient:
-    """Create an API client using the Home Assistant aiohttp session."""
+    """
+    Create an API client using the Ogero aiohttp session.
+
+    For development, OGERO_CASSETTE_MODE=record saves every API result to a
+    cassette file and OGERO_CASSETTE_MODE=replay serves results from it
+    without any network access.
+    """
+    mode = os.environ.get(ENV_CASSETTE_MODE)
+    if mode in (CASSETTE_RECORD, CASSETTE_REPLAY):
+        path = os.environ.get(ENV_CASSETTE_PATH) or hass.config.path(
+            DEFAULT_CASSETTE_FILE
+        )
+        LOGGER.warning("Ogero API cassette %s mode is on (%s)", mode, path)
+        if mode == CASSETTE_REPLAY:
+            return ReplayOgeroApiClient(
+                hass, path, _replay_latency(os.environ.get(ENV_CASSETTE_LATENCY))
+            )
+        return RecordingOgeroApiClient(hass, path, username=username, password=password)
     return OgeroApiClient(
         username=username,
         password=password,
-        session=async_get_clientsession(hass),
+        session=async_get_session(hass),
     )
 
 
@@ -112,7 +185,7 @@ class OgeroApiClient:
             LOGGER.error("Login failed")
             raise OgeroApiClientAuthenticationError(auth_ex.args) from auth_ex
         except OgeroCommunicationError as ex:
-            raise OgeroApiClientCommunicationError(str(ex)) from ex
+            raise _communication_error(ex) from ex
         except OgeroParseError as ex:
             raise OgeroApiClientError(str(ex)) from ex
 
@@ -123,7 +196,7 @@ class OgeroApiClient:
         except AuthenticationException as auth_ex:
             raise OgeroApiClientAuthenticationError(auth_ex.args) from auth_ex
         except OgeroCommunicationError as ex:
-            raise OgeroApiClientCommunicationError(str(ex)) from ex
+            raise _communication_error(ex) from ex
         except OgeroParseError as ex:
             raise OgeroApiClientError(str(ex)) from ex
 
@@ -137,7 +210,7 @@ class OgeroApiClient:
         except AuthenticationException as auth_ex:
             raise OgeroApiClientAuthenticationError(auth_ex.args) from auth_ex
         except OgeroCommunicationError as ex:
-            raise OgeroApiClientCommunicationError(str(ex)) from ex
+            raise _communication_error(ex) from ex
         except OgeroParseError as ex:
             raise OgeroApiClientError(str(ex)) from ex
 
@@ -151,8 +224,184 @@ class OgeroApiClient:
         except AuthenticationException as auth_ex:
             raise OgeroApiClientAuthenticationError(auth_ex.args) from auth_ex
         except OgeroCommunicationError as ex:
-            raise OgeroApiClientCommunicationError(str(ex)) from ex
+            raise _communication_error(ex) from ex
         except OgeroParseError as ex:
             raise OgeroApiClientError(str(ex)) from ex
 
         return consumption_info
+
+    async def async_close(self) -> None:
+        """Release what the client holds when its login unloads."""
+
+
+def _replay_latency(value: str | None) -> float | None:
+    """Return a fixed replay latency in seconds, or None for the recorded one."""
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
+
+
+_REPLAY_ERRORS: dict[str, type[OgeroApiClientError]] = {
+    error.__name__: error
+    for error in (
+        OgeroApiClientError,
+        OgeroApiClientCommunicationError,
+        OgeroApiClientConnectionError,
+        OgeroApiClientAuthenticationError,
+    )
+}
+
+
+class RecordingOgeroApiClient(OgeroApiClient):
+    """
+    Ogero API client that saves every result to a cassette file.
+
+    Results are recorded after pyogero has parsed them, together with how
+    long each call took; errors are recorded by type and message. The file
+    is rewritten at most every CASSETTE_SAVE_DELAY seconds, and once more
+    when the login unloads; it never holds the credentials.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: str, *, username: str, password: str
+    ) -> None:
+        """Initialize the client."""
+        super().__init__(username, password, async_get_session(hass))
+        self._hass = hass
+        self.path = path
+        self.cassette = Cassette()
+        self._save_lock = asyncio.Lock()
+        self._saver = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=CASSETTE_SAVE_DELAY,
+            immediate=True,
+            function=self._async_write,
+        )
+
+    async def _async_record[T](
+        self,
+        method: str,
+        account: Account | None,
+        call: Awaitable[T],
+        encode: Callable[[T], Any],
+    ) -> T:
+        account_key = account.serial if account else None
+        started = time.monotonic()
+        try:
+            result = await call
+        except OgeroApiClientError as err:
+            await self._async_save(
+                Interaction(
+                    method,
+                    account_key,
+                    time.monotonic() - started,
+                    error={"type": type(err).__name__, "message": str(err)},
+                )
+            )
+            raise
+        await self._async_save(
+            Interaction(method, account_key, time.monotonic() - started, encode(result))
+        )
+        return result
+
+    async def _async_save(self, interaction: Interaction) -> None:
+        async with self._save_lock:
+            self.cassette.interactions.append(interaction)
+        await self._saver.async_call()
+
+    async def _async_write(self) -> None:
+        # The executor writes a copy, so calls recorded meanwhile are safe.
+        async with self._save_lock:
+            cassette = Cassette(list(self.cassette.interactions))
+            await self._hass.async_add_executor_job(cassette.save, self.path)
+
+    async def async_close(self) -> None:
+        """Write the calls recorded since the last save."""
+        self._saver.async_cancel()
+        await self._async_write()
+
+    async def async_login(self) -> bool:
+        """Login to the API and record the result."""
+        return await self._async_record("login", None, super().async_login(), bool)
+
+    async def async_get_accounts(self) -> list[Account]:
+        """Get user linked accounts and record them."""
+        return await self._async_record(
+            "get_accounts",
+            None,
+            super().async_get_accounts(),
+            lambda accounts: [account.serial for account in accounts],
+        )
+
+    async def async_get_bills(self, account: Account) -> BillInfo:
+        """Get account bills and record them."""
+        return await self._async_record(
+            "get_bills", account, super().async_get_bills(account), bill_info_to_dict
+        )
+
+    async def async_get_consumption(self, account: Account) -> ConsumptionInfo:
+        """Get account consumption and record it."""
+        return await self._async_record(
+            "get_consumption",
+            account,
+            super().async_get_consumption(account),
+            consumption_to_dict,
+        )
+
+
+class ReplayOgeroApiClient(OgeroApiClient):
+    """
+    Ogero API client that serves results from a cassette file.
+
+    Each call waits for its recorded latency, or for a fixed latency when
+    one is given, so polls keep a realistic shape without touching the
+    network.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: str, latency: float | None = None
+    ) -> None:
+        """Initialize the client."""
+        self._hass = hass
+        self.path = path
+        self.latency = latency
+        self.cassette: Cassette | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def _async_replay(self, method: str, account: Account | None) -> Any:
+        async with self._load_lock:
+            if self.cassette is None:
+                self.cassette = await self._hass.async_add_executor_job(
+                    Cassette.load, self.path
+                )
+        interaction = self.cassette.next_for(
+            method, account.serial if account else None
+        )
+        await asyncio.sleep(
+            interaction.latency if self.latency is None else self.latency
+        )
+        if interaction.error is not None:
+            error = _REPLAY_ERRORS.get(interaction.error["type"], OgeroApiClientError)
+            raise error(interaction.error["message"])
+        return interaction.response
+
+    async def async_login(self) -> bool:
+        """Replay a login."""
+        return bool(await self._async_replay("login", None))
+
+    async def async_get_accounts(self) -> list[Account]:
+        """Replay the linked accounts."""
+        serials = await self._async_replay("get_accounts", None)
+        return [Account.deserialize(serial) for serial in serials]
+
+    async def async_get_bills(self, account: Account) -> BillInfo:
+        """Replay account bills."""
+        return bill_info_from_dict(await self._async_replay("get_bills", account))
+
+    async def async_get_consumption(self, account: Account) -> ConsumptionInfo:
+        """Replay account consumption."""
+        return consumption_from_dict(
+            await self._async_replay("get_consumption", account)
+        )
@@ -0,0 +1,105 @@
+"""Compact bill records and the per-line bill index used for change events."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pyogero.types import BillStatus
+
+from .const import EVENT_BALANCE_CHANGED, EVENT_BILL_ISSUED, EVENT_BILL_PAID
+
+if TYPE_CHECKING:
+    from pyogero.asyncio import BillInfo
+    from pyogero.types import Bill
+
+
+@dataclass(frozen=True, slots=True)
+class OgeroBill:
+    """One bill of a line."""
+
+    period: str
+    amount: str
+    status: str
+
+    @classmethod
+    def from_pyogero(cls, bill: Bill) -> OgeroBill:
+        """Map a pyogero bill to a compact record."""
+        return cls(
+            period=bill.date.strftime("%Y-%m"),
+            amount=f"{bill.amount.currency} {int(bill.amount.amount)}",
+            status=bill.status.name,
+        )
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the bill as a state attribute / diagnostics mapping."""
+        return {"period": self.period, "amount": self.amount, "status": self.status}
+
+
+class OgeroBillIndex:
+    """
+    Bills of one line keyed by period, compared against each new poll.
+
+    The index is stored with the line's consumption history, so a restart or
+    reload compares the next poll against the bills seen before it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._bills: dict[str, OgeroBill] | None = None
+        self._balance: int | None = None
+
+    def as_dict(self) -> dict[str, Any] | None:
+        """Return the last seen bills and balance for storage, if any."""
+        if self._bills is None or self._balance is None:
+            return None
+        return {
+            "balance": self._balance,
+            "bills": [bill.as_dict() for bill in self._bills.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, stored: dict[str, Any]) -> OgeroBillIndex:
+        """Rebuild an index from stored bills."""
+        index = cls()
+        bills = [OgeroBill(**bill) for bill in stored["bills"]]
+        index._bills = {bill.period: bill for bill in bills}
+        index._balance = int(stored["balance"])
+        return index
+
+    def update(self, bill_info: BillInfo) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Store the latest bills and return (event type, data) for each change.
+
+        The first update only builds the index. After that, a new period is an
+        issued bill, a status change to paid is a paid bill, and any change of
+        the outstanding total is a balance change.
+        """
+        bills = {
+            bill.period: bill
+            for bill in (OgeroBill.from_pyogero(bill) for bill in bill_info.bills)
+        }
+        balance = int(bill_info.total_outstanding.amount)
+        previous_bills, self._bills = self._bills, bills
+        previous_balance, self._balance = self._balance, balance
+        if previous_bills is None or previous_balance is None:
+            return []
+
+        changes: list[tuple[str, dict[str, Any]]] = []
+        for period, bill in bills.items():
+            previous = previous_bills.get(period)
+            if previous is None:
+                changes.append((EVENT_BILL_ISSUED, {"bill": bill.as_dict()}))
+            elif previous.status != bill.status and bill.status == BillStatus.PAID.name:
+                changes.append((EVENT_BILL_PAID, {"bill": bill.as_dict()}))
+        if balance != previous_balance:
+            changes.append(
+                (
+                    EVENT_BALANCE_CHANGED,
+                    {
+                        "previous_balance": previous_balance,
+                        "outstanding_balance": balance,
+                    },
+                )
+            )
+        return changes
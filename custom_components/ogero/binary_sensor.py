@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -15,26 +16,43 @@ from .entity import OgeroEntity
 PARALLEL_UPDATES = 0
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .api import Account
-    from .coordinator import OgeroDataUpdateCoordinator
+    from .coordinator import OgeroCoordinatorData, OgeroDataUpdateCoordinator
     from .data import OgeroConfigEntry
 
 UNPAID_BILLS = "unpaid_bills"
 OVER_QUOTA = "over_quota"
 
-BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
-    BinarySensorEntityDescription(
+
+def _no_attributes(_data: OgeroCoordinatorData) -> None:
+    return None
+
+
+@dataclass(frozen=True, kw_only=True)
+class OgeroBinarySensorEntityDescription(BinarySensorEntityDescription):  # type: ignore[misc]
+    """Binary sensor description with its state and attribute accessors."""
+
+    value_fn: Callable[[OgeroCoordinatorData], bool]
+    attrs_fn: Callable[[OgeroCoordinatorData], dict[str, Any] | None] = _no_attributes
+
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[OgeroBinarySensorEntityDescription, ...] = (
+    OgeroBinarySensorEntityDescription(
         key=UNPAID_BILLS,
         translation_key=UNPAID_BILLS,
         device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda data: data.has_unpaid_bills,
     ),
-    BinarySensorEntityDescription(
+    OgeroBinarySensorEntityDescription(
         key=OVER_QUOTA,
         translation_key=OVER_QUOTA,
         device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda data: data.has_extra_consumption,
     ),
 )
 
@@ -60,13 +78,13 @@ class OgeroBinarySensor(
 ):
     """Ogero binary sensor."""
 
-    entity_description: BinarySensorEntityDescription
+    entity_description: OgeroBinarySensorEntityDescription
 
     def __init__(
         self,
         coordinator: OgeroDataUpdateCoordinator,
         account: Account,
-        entity_description: BinarySensorEntityDescription,
+        entity_description: OgeroBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator, account, entity_description.key)
@@ -78,8 +96,12 @@ class OgeroBinarySensor(
         data = self.coordinator.data
         if data is None:
             return None
-        if self.entity_description.key == UNPAID_BILLS:
-            return bool(data.has_unpaid_bills)
-        if self.entity_description.key == OVER_QUOTA:
-            return bool(data.has_extra_consumption)
-        return None
+        return self.entity_description.value_fn(data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra state attributes."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        return self.entity_description.attrs_fn(data)
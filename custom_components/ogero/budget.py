@@ -0,0 +1,119 @@
+"""Domain-wide Ogero request budget shared by every login and line."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from typing import TYPE_CHECKING
+
+from .const import DEFAULT_REQUEST_BUDGET, REQUEST_BUDGET_WINDOW
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class OgeroRequestBudget:
+    """
+    Cap Ogero requests per hour across all config entries.
+
+    Each login gets an equal share of the hourly allowance, split between its
+    lines by priority weight. A line that has used its share may still borrow
+    capacity that no other line has a claim on.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._limits: dict[str, int] = {}
+        self._lines: dict[str, dict[str, float]] = {}
+        self._requests: deque[tuple[datetime, str, str]] = deque()
+        self._used: Counter[tuple[str, str]] = Counter()
+
+    @property
+    def capacity(self) -> int:
+        """Return the hourly allowance (the strictest login setting wins)."""
+        return min(self._limits.values(), default=DEFAULT_REQUEST_BUDGET)
+
+    @property
+    def used(self) -> int:
+        """Return requests made in the current window."""
+        return len(self._requests)
+
+    def register_login(self, login: str, capacity: int) -> None:
+        """Add or update a login and its configured hourly allowance."""
+        self._limits[login] = capacity
+
+    def unregister_login(self, login: str) -> None:
+        """Forget a login and all of its lines."""
+        self._limits.pop(login, None)
+        self._lines.pop(login, None)
+
+    def register_line(self, login: str, line: str, weight: float) -> None:
+        """Add or update a line with its priority weight."""
+        self._lines.setdefault(login, {})[line] = weight
+
+    def unregister_line(self, login: str, line: str) -> None:
+        """Forget a line; drop the login's line table when it is empty."""
+        lines = self._lines.get(login)
+        if lines is None:
+            return
+        lines.pop(line, None)
+        if not lines:
+            del self._lines[login]
+
+    def share(self, login: str, line: str) -> float:
+        """Return the fair number of requests per window reserved for a line."""
+        lines = self._lines.get(login)
+        if not lines or line not in lines:
+            return 0.0
+        return self.capacity / len(self._lines) * lines[line] / sum(lines.values())
+
+    def usage(self, login: str, line: str) -> int:
+        """Return requests a line made in the current window."""
+        return self._used[(login, line)]
+
+    def try_acquire(
+        self, login: str, line: str, now: datetime, *, force: bool = False
+    ) -> bool:
+        """
+        Take one request slot for a line; return False when it must wait.
+
+        Forced requests (setup and lines without any data yet) always proceed
+        but still count against the budget.
+        """
+        self._expire(now)
+        key = (login, line)
+        if not force and not self._has_slot(key):
+            return False
+        self._requests.append((now, login, line))
+        self._used[key] += 1
+        return True
+
+    def next_slot(self, now: datetime) -> datetime:
+        """Return when the oldest request in the window frees its slot."""
+        self._expire(now)
+        if not self._requests:
+            return now
+        return self._requests[0][0] + REQUEST_BUDGET_WINDOW
+
+    def _has_slot(self, key: tuple[str, str]) -> bool:
+        total = len(self._requests)
+        capacity = self.capacity
+        if total >= capacity:
+            return False
+        if self._used[key] < self.share(*key):
+            return True
+        reserved = sum(
+            max(0.0, self.share(login, line) - self._used[(login, line)])
+            for login, lines in self._lines.items()
+            for line in lines
+            if (login, line) != key
+        )
+        return total + reserved + 1 <= capacity
+
+    def _expire(self, now: datetime) -> None:
+        cutoff = now - REQUEST_BUDGET_WINDOW
+        while self._requests and self._requests[0][0] <= cutoff:
+            _, login, line = self._requests.popleft()
+            key = (login, line)
+            self._used[key] -= 1
+            if self._used[key] <= 0:
+                del self._used[key]
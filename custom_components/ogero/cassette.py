@@ -0,0 +1,144 @@
+"""
+Cassettes of Ogero API results for offline record and replay.
+
+Results are stored as plain JSON, so the same serialization also backs
+anything else that needs pyogero results on disk.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pyogero.types import Bill, BillAmount, BillInfo, BillStatus, ConsumptionInfo
+
+CASSETTE_VERSION = 1
+REDACTED = "**REDACTED**"
+
+
+def _amount_to_dict(amount: BillAmount) -> dict[str, Any]:
+    return {"amount": amount.amount, "currency": amount.currency}
+
+
+def _amount_from_dict(data: dict[str, Any]) -> BillAmount:
+    return BillAmount(amount=data["amount"], currency=data["currency"])
+
+
+def consumption_to_dict(info: ConsumptionInfo) -> dict[str, Any]:
+    """Return consumption info as JSON-ready data."""
+    return {
+        "speed": info.speed,
+        "quota": info.quota,
+        "total_consumption": info.total_consumption,
+        "extra_consumption": info.extra_consumption,
+        "last_update": info.last_update.isoformat() if info.last_update else None,
+    }
+
+
+def consumption_from_dict(data: dict[str, Any]) -> ConsumptionInfo:
+    """Rebuild consumption info from consumption_to_dict() output."""
+    return ConsumptionInfo(
+        speed=data["speed"],
+        quota=data["quota"],
+        total_consumption=data["total_consumption"],
+        extra_consumption=data["extra_consumption"],
+        last_update=(
+            datetime.fromisoformat(data["last_update"]) if data["last_update"] else None
+        ),
+    )
+
+
+def bill_info_to_dict(info: BillInfo) -> dict[str, Any]:
+    """Return bill info as JSON-ready data."""
+    return {
+        "total_outstanding": _amount_to_dict(info.total_outstanding),
+        "bills": [
+            {
+                "date": bill.date.isoformat(),
+                "amount": _amount_to_dict(bill.amount),
+                "status": bill.status.name,
+            }
+            for bill in info.bills
+        ],
+    }
+
+
+def bill_info_from_dict(data: dict[str, Any]) -> BillInfo:
+    """Rebuild bill info from bill_info_to_dict() output."""
+    return BillInfo(
+        total_outstanding=_amount_from_dict(data["total_outstanding"]),
+        bills=[
+            Bill(
+                date=datetime.fromisoformat(bill["date"]),
+                amount=_amount_from_dict(bill["amount"]),
+                status=BillStatus[bill["status"]],
+            )
+            for bill in data["bills"]
+        ],
+    )
+
+
+@dataclass(slots=True)
+class Interaction:
+    """One recorded API call: its result or error, and how long it took."""
+
+    method: str
+    account: str | None
+    latency: float
+    response: Any = None
+    error: dict[str, str] | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return JSON-ready data."""
+        return {
+            "method": self.method,
+            "account": self.account,
+            "latency": round(self.latency, 4),
+            "response": self.response,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class Cassette:
+    """
+    Recorded interactions, replayed in order per (method, account).
+
+    When a key runs out of interactions, replay starts over from its first
+    one, so a short recording can drive any number of polls.
+    """
+
+    interactions: list[Interaction] = field(default_factory=list)
+    _cursor: dict[tuple[str, str | None], int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> Cassette:
+        """Read a cassette file (blocking)."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls([Interaction(**item) for item in data["interactions"]])
+
+    def save(self, path: str) -> None:
+        """Write the cassette file (blocking); credentials are never stored."""
+        data = {
+            "version": CASSETTE_VERSION,
+            "credentials": {"username": REDACTED, "password": REDACTED},
+            "interactions": [item.as_dict() for item in self.interactions],
+        }
+        Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def next_for(self, method: str, account: str | None) -> Interaction:
+        """Return the next interaction recorded for this call."""
+        matches = [
+            item
+            for item in self.interactions
+            if item.method == method and item.account == account
+        ]
+        if not matches:
+            msg = f"No recorded {method} for {account or 'the login'}"
+            raise LookupError(msg)
+        position = self._cursor.get((method, account), 0)
+        self._cursor[method, account] = position + 1
+        return matches[position % len(matches)]
@@ -15,8 +15,17 @@ from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import selector
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     DurationSelector,
     DurationSelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
 )
 from homeassistant.util import slugify
 
@@ -28,14 +37,37 @@ from .api import (
     OgeroApiClientError,
 )
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_CONFIGURE_LINE,
+    CONF_LINE_OPTIONS,
+    CONF_LOOP_WATCHDOG_THRESHOLD,
+    CONF_MAX_DATA_AGE,
+    CONF_POLL_SCHEDULE,
+    CONF_PRIORITY,
+    CONF_QUOTA_THRESHOLDS,
+    CONF_REQUEST_BUDGET,
     CONF_SCAN_INTERVAL,
+    CONF_SHARED_CACHE,
+    CONF_TRACE_EXPORT,
     CONFIG_ENTRY_VERSION,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_REQUEST_BUDGET,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     LOGGER,
+    MAX_DATA_AGE_HOURS,
+    MAX_LOOP_WATCHDOG_THRESHOLD,
+    MAX_REQUEST_BUDGET,
     MAX_SCAN_INTERVAL,
+    MIN_REQUEST_BUDGET,
     MIN_SCAN_INTERVAL,
+    PRIORITY_NORMAL,
+    PRIORITY_WEIGHTS,
+    TRACE_EXPORT_OFF,
+    TRACE_EXPORTS,
 )
+from .schedule import PollSchedule
+from .thresholds import get_quota_thresholds, parse_quota_thresholds
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -69,6 +101,42 @@ def _clamp_scan_interval_seconds(seconds: int) -> int:
     return max(lo, min(seconds, hi))
 
 
+def _poll_schedule_errors(user_input: dict[str, Any] | None) -> dict[str, str]:
+    """Validate the optional poll schedule field of an options form."""
+    raw = (user_input or {}).get(CONF_POLL_SCHEDULE)
+    if not raw:
+        return {}
+    try:
+        PollSchedule.parse(raw)
+    except ValueError:
+        return {CONF_POLL_SCHEDULE: "invalid_poll_schedule"}
+    return {}
+
+
+def _quota_threshold_errors(user_input: dict[str, Any] | None) -> dict[str, str]:
+    """Validate the quota thresholds field of the options form."""
+    raw = (user_input or {}).get(CONF_QUOTA_THRESHOLDS)
+    if raw is None:
+        return {}
+    try:
+        parse_quota_thresholds(raw)
+    except ValueError:
+        return {CONF_QUOTA_THRESHOLDS: "invalid_quota_thresholds"}
+    return {}
+
+
+def _set_poll_schedule(
+    options: dict[str, Any], user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Store the poll schedule from a form; an empty field removes it."""
+    raw = (user_input.get(CONF_POLL_SCHEDULE) or "").strip()
+    if raw:
+        options[CONF_POLL_SCHEDULE] = raw
+    else:
+        options.pop(CONF_POLL_SCHEDULE, None)
+    return options
+
+
 class OgeroFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg,misc]
     """Handle a config flow for Ogero."""
 
@@ -210,13 +278,36 @@ class OgeroFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg,misc
 class OgeroOptionsFlowHandler(OptionsFlowWithReload):  # type: ignore[misc]
     """Handle Ogero options."""
 
+    def __init__(self) -> None:
+        """Initialize."""
+        self._options: dict[str, Any] = {}
+        self._line: str | None = None
+
+    def _line_labels(self) -> dict[str, str]:
+        """Return active line serials with a readable label."""
+        runtime = getattr(self.config_entry, "runtime_data", None)
+        if runtime is None:
+            return {}
+        return {
+            serial: str(coordinator.account)
+            for serial, coordinator in runtime.coordinators.items()
+        }
+
     async def async_step_init(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
         """Manage options."""
-        if user_input is not None:
-            new_options = {**dict(self.config_entry.options)}
+        lines = self._line_labels()
+        errors = _poll_schedule_errors(user_input) | _quota_threshold_errors(user_input)
+        if user_input is not None and not errors:
+            new_options = _set_poll_schedule(
+                {**dict(self.config_entry.options)}, user_input
+            )
+            if CONF_QUOTA_THRESHOLDS in user_input:
+                new_options[CONF_QUOTA_THRESHOLDS] = list(
+                    parse_quota_thresholds(user_input[CONF_QUOTA_THRESHOLDS])
+                )
             if (
                 CONF_SCAN_INTERVAL in user_input
                 and user_input[CONF_SCAN_INTERVAL] is not None
@@ -225,6 +316,30 @@ class OgeroOptionsFlowHandler(OptionsFlowWithReload):  # type: ignore[misc]
                 interval_td = cv.positive_time_period_dict(raw)
                 seconds = _clamp_scan_interval_seconds(int(interval_td.total_seconds()))
                 new_options[CONF_SCAN_INTERVAL] = seconds
+            if CONF_ADAPTIVE_POLLING in user_input:
+                new_options[CONF_ADAPTIVE_POLLING] = bool(
+                    user_input[CONF_ADAPTIVE_POLLING]
+                )
+            if user_input.get(CONF_REQUEST_BUDGET) is not None:
+                new_options[CONF_REQUEST_BUDGET] = int(user_input[CONF_REQUEST_BUDGET])
+            if user_input.get(CONF_MAX_DATA_AGE) is not None:
+                new_options[CONF_MAX_DATA_AGE] = int(user_input[CONF_MAX_DATA_AGE])
+            shared_cache = (user_input.get(CONF_SHARED_CACHE) or "").strip()
+            if shared_cache:
+                new_options[CONF_SHARED_CACHE] = shared_cache
+            else:
+                new_options.pop(CONF_SHARED_CACHE, None)
+            if user_input.get(CONF_LOOP_WATCHDOG_THRESHOLD) is not None:
+                new_options[CONF_LOOP_WATCHDOG_THRESHOLD] = int(
+                    user_input[CONF_LOOP_WATCHDOG_THRESHOLD]
+                )
+            if CONF_TRACE_EXPORT in user_input:
+                new_options[CONF_TRACE_EXPORT] = user_input[CONF_TRACE_EXPORT]
+            line = user_input.get(CONF_CONFIGURE_LINE)
+            if line in lines:
+                self._options = new_options
+                self._line = line
+                return await self.async_step_line()
             return self.async_create_entry(data=new_options)
 
         default_seconds = _clamp_scan_interval_seconds(
@@ -237,19 +352,174 @@ class OgeroOptionsFlowHandler(OptionsFlowWithReload):  # type: ignore[misc]
         )
         default_duration = _seconds_to_duration_dict(default_seconds)
 
+        schema: dict[vol.Marker, Any] = {
+            vol.Optional(
+                CONF_SCAN_INTERVAL,
+                default=default_duration,
+            ): DurationSelector(
+                DurationSelectorConfig(
+                    enable_day=False,
+                    enable_millisecond=False,
+                ),
+            ),
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING,
+                default=self.config_entry.options.get(
+                    CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                ),
+            ): BooleanSelector(),
+            vol.Optional(
+                CONF_REQUEST_BUDGET,
+                default=self.config_entry.options.get(
+                    CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=MIN_REQUEST_BUDGET,
+                    max=MAX_REQUEST_BUDGET,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement="requests/h",
+                ),
+            ),
+            vol.Optional(
+                CONF_POLL_SCHEDULE,
+                description={
+                    "suggested_value": self.config_entry.options.get(CONF_POLL_SCHEDULE)
+                },
+            ): TextSelector(),
+            vol.Optional(
+                CONF_QUOTA_THRESHOLDS,
+                default=", ".join(
+                    str(threshold)
+                    for threshold in get_quota_thresholds(self.config_entry.options)
+                ),
+            ): TextSelector(),
+            vol.Optional(
+                CONF_MAX_DATA_AGE,
+                default=self.config_entry.options.get(CONF_MAX_DATA_AGE, 0),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=MAX_DATA_AGE_HOURS,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement="h",
+                ),
+            ),
+            vol.Optional(
+                CONF_SHARED_CACHE,
+                description={
+                    "suggested_value": self.config_entry.options.get(CONF_SHARED_CACHE)
+                },
+            ): TextSelector(),
+            vol.Optional(
+                CONF_LOOP_WATCHDOG_THRESHOLD,
+                default=self.config_entry.options.get(CONF_LOOP_WATCHDOG_THRESHOLD, 0),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=MAX_LOOP_WATCHDOG_THRESHOLD,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement="ms",
+                ),
+            ),
+            vol.Optional(
+                CONF_TRACE_EXPORT,
+                default=self.config_entry.options.get(
+                    CONF_TRACE_EXPORT, TRACE_EXPORT_OFF
+                ),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=list(TRACE_EXPORTS),
+                    translation_key=CONF_TRACE_EXPORT,
+                    mode=SelectSelectorMode.DROPDOWN,
+                ),
+            ),
+        }
+        if lines:
+            schema[vol.Optional(CONF_CONFIGURE_LINE)] = SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        SelectOptionDict(value=serial, label=label)
+                        for serial, label in lines.items()
+                    ],
+                    mode=SelectSelectorMode.DROPDOWN,
+                ),
+            )
+
+        return self.async_show_form(
+            step_id="init", data_schema=vol.Schema(schema), errors=errors
+        )
+
+    async def async_step_line(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Override poll interval and priority for one line."""
+        line = cast("str", self._line)
+        all_line_options = {
+            serial: dict(values)
+            for serial, values in dict(
+                self._options.get(CONF_LINE_OPTIONS) or {}
+            ).items()
+        }
+        current = all_line_options.get(line, {})
+        errors = _poll_schedule_errors(user_input)
+        if user_input is not None and not errors:
+            line_options = _set_poll_schedule(
+                {CONF_PRIORITY: user_input.get(CONF_PRIORITY, PRIORITY_NORMAL)},
+                user_input,
+            )
+            if user_input.get(CONF_SCAN_INTERVAL):
+                interval_td = cv.positive_time_period_dict(
+                    user_input[CONF_SCAN_INTERVAL]
+                )
+                line_options[CONF_SCAN_INTERVAL] = _clamp_scan_interval_seconds(
+                    int(interval_td.total_seconds())
+                )
+            all_line_options[line] = line_options
+            return self.async_create_entry(
+                data={**self._options, CONF_LINE_OPTIONS: all_line_options}
+            )
+
+        suggested_interval = (
+            _seconds_to_duration_dict(int(current[CONF_SCAN_INTERVAL]))
+            if CONF_SCAN_INTERVAL in current
+            else None
+        )
         return self.async_show_form(
-            step_id="init",
+            step_id="line",
             data_schema=vol.Schema(
                 {
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
-                        default=default_duration,
+                        description={"suggested_value": suggested_interval},
                     ): DurationSelector(
                         DurationSelectorConfig(
                             enable_day=False,
                             enable_millisecond=False,
                         ),
                     ),
+                    vol.Required(
+                        CONF_PRIORITY,
+                        default=current.get(CONF_PRIORITY, PRIORITY_NORMAL),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=list(PRIORITY_WEIGHTS),
+                            translation_key=CONF_PRIORITY,
+                            mode=SelectSelectorMode.LIST,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_POLL_SCHEDULE,
+                        description={
+                            "suggested_value": current.get(CONF_POLL_SCHEDULE)
+                        },
+                    ): TextSelector(),
                 }
             ),
+            errors=errors,
+            description_placeholders={"line": self._line_labels().get(line, line)},
         )
@@ -9,6 +9,17 @@ from typing import TypedDict
 CONF_ACCOUNT = "account"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_DISABLED_ACCOUNTS = "disabled_accounts"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_REQUEST_BUDGET = "request_budget"
+CONF_LINE_OPTIONS = "line_options"
+CONF_PRIORITY = "priority"
+CONF_CONFIGURE_LINE = "configure_line"
+CONF_POLL_SCHEDULE = "poll_schedule"
+CONF_QUOTA_THRESHOLDS = "quota_thresholds"
+CONF_LOOP_WATCHDOG_THRESHOLD = "loop_watchdog_threshold"
+CONF_TRACE_EXPORT = "trace_export"
+CONF_MAX_DATA_AGE = "max_data_age"
+CONF_SHARED_CACHE = "shared_cache"
 
 SUBENTRY_TYPE_ACCOUNT = "account"
 CONFIG_ENTRY_VERSION = 3
@@ -19,6 +30,95 @@ DEFAULT_SCAN_INTERVAL = timedelta(hours=1)
 MIN_SCAN_INTERVAL = timedelta(minutes=15)
 MAX_SCAN_INTERVAL = timedelta(hours=24)
 
+DEFAULT_ADAPTIVE_POLLING = True
+# Upstream refresh gaps needed before the cadence is trusted.
+CADENCE_MIN_INTERVALS = 3
+CADENCE_MAX_SAMPLES = 16
+# Poll this long after Ogero is expected to publish new usage.
+CADENCE_GRACE = timedelta(minutes=5)
+
+ENDPOINT_CONSUMPTION = "consumption"
+ENDPOINT_BILLS = "bills"
+ENDPOINTS = (ENDPOINT_CONSUMPTION, ENDPOINT_BILLS)
+
+# Retry a failed endpoint on its own exponential backoff.
+RETRY_BACKOFF_BASE = timedelta(minutes=15)
+RETRY_BACKOFF_MAX = timedelta(hours=6)
+# While the portal is unreachable, every line waits on one shared retry. It
+# backs off up to the poll interval of the line probing, and never beyond this.
+OUTAGE_BACKOFF_MAX = timedelta(hours=12)
+# Lines whose calls must fail before errors short of a connection failure
+# are taken for an outage.
+OUTAGE_MIN_LINES = 2
+# Hours after which cached data is shown as unavailable; 0 (the default)
+# keeps serving it.
+MAX_DATA_AGE_HOURS = 720
+# Instances sharing a cache directory wait this long for the one fetching a
+# line before trying themselves.
+SHARED_CACHE_LEASE = timedelta(minutes=2)
+# How often a manual refresh re-reads the cache while another instance fetches.
+SHARED_CACHE_WAIT = timedelta(seconds=5)
+SHARED_CACHE_VERSION = 1
+# Ogero requests per window shared by every login in this instance.
+DEFAULT_REQUEST_BUDGET = 120
+MIN_REQUEST_BUDGET = 10
+MAX_REQUEST_BUDGET = 1000
+REQUEST_BUDGET_WINDOW = timedelta(hours=1)
+
+PRIORITY_LOW = "low"
+PRIORITY_NORMAL = "normal"
+PRIORITY_HIGH = "high"
+PRIORITY_WEIGHTS = {PRIORITY_LOW: 1.0, PRIORITY_NORMAL: 2.0, PRIORITY_HIGH: 4.0}
+
+# Usage percentages of the quota that fire EVENT_QUOTA_THRESHOLD.
+DEFAULT_QUOTA_THRESHOLDS = (50, 80, 100)
+MAX_QUOTA_THRESHOLD = 1000
+EVENT_QUOTA_THRESHOLD = "ogero_quota_threshold"
+EVENT_BILL_ISSUED = "ogero_bill_issued"
+EVENT_BILL_PAID = "ogero_bill_paid"
+EVENT_BALANCE_CHANGED = "ogero_balance_changed"
+
+# Consumption samples kept per line (about a month of hourly changes).
+HISTORY_CAPACITY = 720
+HISTORY_STORAGE_VERSION = 1
+HISTORY_SAVE_DELAY = 60
+
+# Poll attempts kept per line for diagnostics.
+POLL_TIMELINE_SIZE = 20
+
+# Loop watchdog warning threshold in milliseconds; 0 (the default) turns it off.
+MAX_LOOP_WATCHDOG_THRESHOLD = 10000
+
+# Record or replay Ogero API results (development and benchmarks only).
+ENV_CASSETTE_MODE = "OGERO_CASSETTE_MODE"
+ENV_CASSETTE_PATH = "OGERO_CASSETTE"
+ENV_CASSETTE_LATENCY = "OGERO_CASSETTE_LATENCY"
+CASSETTE_RECORD = "record"
+CASSETTE_REPLAY = "replay"
+DEFAULT_CASSETTE_FILE = "ogero_cassette.json"
+# Seconds to gather recorded calls before the cassette file is rewritten.
+CASSETTE_SAVE_DELAY = 5
+
+# Upper bounds (seconds) of the poll duration histogram buckets.
+POLL_DURATION_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Where tracing spans go; off by default.
+TRACE_EXPORT_OFF = "off"
+TRACE_EXPORT_FILE = "file"
+TRACE_EXPORT_MEMORY = "memory"
+TRACE_EXPORTS = (TRACE_EXPORT_OFF, TRACE_EXPORT_FILE, TRACE_EXPORT_MEMORY)
+# Finished spans kept by the in-memory collector (shown in diagnostics).
+TRACE_COLLECTOR_SIZE = 500
+
+# Upper bound for the profile action's cycles field.
+MAX_PROFILE_CYCLES = 20
+
+# Lines refreshed at the same time by the refresh action.
+REFRESH_CONCURRENCY = 4
+
+# Timers may fire slightly early; treat endpoints this close to due as due.
+ENDPOINT_DUE_SLACK = timedelta(seconds=30)
+
 
 class Manifest(TypedDict):
     """Manifest."""
@@ -2,25 +2,60 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pyogero.types import BillStatus
 
-from .api import Account, OgeroApiClientAuthenticationError, OgeroApiClientError
-from .const import DOMAIN, LOGGER
+from .api import (
+    Account,
+    OgeroApiClientAuthenticationError,
+    OgeroApiClientCommunicationError,
+    OgeroApiClientConnectionError,
+    OgeroApiClientError,
+)
+from .bills import OgeroBill
+from .const import (
+    DOMAIN,
+    ENDPOINT_BILLS,
+    ENDPOINT_CONSUMPTION,
+    ENDPOINT_DUE_SLACK,
+    EVENT_QUOTA_THRESHOLD,
+    LOGGER,
+    PRIORITY_WEIGHTS,
+    SHARED_CACHE_LEASE,
+    SHARED_CACHE_WAIT,
+)
+from .data import get_domain_data
+from .forecast import CycleForecast
+from .scheduler import EndpointState, get_max_data_age
+from .shared_cache import SharedLookup
+from .thresholds import get_quota_thresholds, reached_threshold
+from .timeline import EndpointAttempt, PollAttempt, PollTimeline, count_received_bytes
+from .watchdog import LoopWatchdog, get_loop_watchdog_threshold
 
 if TYPE_CHECKING:
-    from datetime import datetime, timedelta
+    from collections.abc import Awaitable, Callable, Iterable
+    from datetime import datetime
 
     from homeassistant.core import HomeAssistant
+    from pyogero.asyncio import BillInfo, ConsumptionInfo
 
     from .data import OgeroConfigEntry
+    from .scheduler import PollScheduler
+    from .shared_cache import SharedResponseCache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OgeroCoordinatorData:
     """Data returned by the coordinator."""
 
@@ -30,9 +65,66 @@ class OgeroCoordinatorData:
     extra_consumption: float
     last_update: datetime | None
     outstanding_balance: int
-    unpaid_bills: list[dict[str, str]]
+    unpaid_bills: tuple[OgeroBill, ...]
     has_unpaid_bills: bool
     has_extra_consumption: bool
+    usage_percent: float | None
+    usage_today: float | None = None
+    usage_last_24h: float | None = None
+    average_daily_usage: float | None = None
+    forecast_consumption: float | None = None
+    forecast_extra_consumption: float | None = None
+    data_fetched: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready mapping for action responses and diagnostics."""
+        return {
+            "quota": self.quota,
+            "speed": self.speed,
+            "total_consumption": self.total_consumption,
+            "extra_consumption": self.extra_consumption,
+            "last_update": self.last_update.isoformat() if self.last_update else None,
+            "outstanding_balance": self.outstanding_balance,
+            "unpaid_bills": [bill.as_dict() for bill in self.unpaid_bills],
+            "has_unpaid_bills": self.has_unpaid_bills,
+            "has_extra_consumption": self.has_extra_consumption,
+            "usage_percent": self.usage_percent,
+            "usage_today": self.usage_today,
+            "usage_last_24h": self.usage_last_24h,
+            "average_daily_usage": self.average_daily_usage,
+            "forecast_consumption": self.forecast_consumption,
+            "forecast_extra_consumption": self.forecast_extra_consumption,
+            "data_fetched": (
+                self.data_fetched.isoformat() if self.data_fetched else None
+            ),
+        }
+
+
+def build_coordinator_data(
+    consumption: ConsumptionInfo, bill_info: BillInfo
+) -> OgeroCoordinatorData:
+    """Map pyogero consumption and bill results to coordinator data."""
+    unpaid_bills = tuple(
+        OgeroBill.from_pyogero(bill)
+        for bill in bill_info.bills
+        if bill.status == BillStatus.UNPAID
+    )
+    extra_consumption = consumption.extra_consumption
+    quota = consumption.quota
+    return OgeroCoordinatorData(
+        quota=quota,
+        last_update=consumption.last_update,
+        speed=consumption.speed,
+        total_consumption=consumption.total_consumption,
+        extra_consumption=extra_consumption,
+        outstanding_balance=int(bill_info.total_outstanding.amount),
+        unpaid_bills=unpaid_bills,
+        has_unpaid_bills=bool(unpaid_bills),
+        has_extra_consumption=extra_consumption > 0,
+        usage_percent=(
+            round(consumption.total_consumption / quota * 100, 1) if quota else None
+        ),
+    )
 
 
 class OgeroDataUpdateCoordinator(DataUpdateCoordinator[OgeroCoordinatorData]):  # type: ignore[misc]
@@ -47,56 +139,557 @@ class OgeroDataUpdateCoordinator(DataUpdateCoordinator[OgeroCoordinatorData]):
         account: Account,
         account_key: str,
         *,
-        update_interval: timedelta,
+        scheduler: PollScheduler,
     ) -> None:
         """Initialize."""
         super().__init__(
             hass,
             LOGGER,
             name=f"{DOMAIN}_{account_key}",
-            update_interval=update_interval,
+            update_interval=scheduler.current_interval(dt_util.utcnow()),
             config_entry=config_entry,
         )
         self.account = account
         self.account_key = account_key
+        self.scheduler = scheduler
+        get_domain_data(hass).budget.register_line(
+            config_entry.entry_id,
+            account_key,
+            PRIORITY_WEIGHTS[scheduler.priority],
+        )
+        self.consumption: EndpointState[ConsumptionInfo] = EndpointState()
+        self.bills: EndpointState[BillInfo] = EndpointState()
+        self.endpoints: dict[str, EndpointState[Any]] = {
+            ENDPOINT_CONSUMPTION: self.consumption,
+            ENDPOINT_BILLS: self.bills,
+        }
+        self.bill_index = config_entry.runtime_data.history.bill_index(account_key)
+        self.history = config_entry.runtime_data.history.line(account_key)
+        self.forecast = CycleForecast.from_samples(self.history)
+        # Stored samples are stamped with Ogero's last_update, so the cadence
+        # learned before a restart or reload is not lost.
+        for timestamp, _total in self.history:
+            scheduler.cadence.observe(dt_util.utc_from_timestamp(timestamp))
+        self.timeline = PollTimeline()
+        threshold = get_loop_watchdog_threshold(config_entry.options)
+        self.watchdog = (
+            LoopWatchdog(account_key, threshold) if threshold is not None else None
+        )
+        self.quota_thresholds = get_quota_thresholds(config_entry.options)
+        self.max_data_age = get_max_data_age(config_entry.options)
+        self._unsub_stale: Callable[[], None] | None = None
+        self._threshold_reached: int | None = None
+        self._requested: set[str] = set()
+        self._requested_refresh: asyncio.Task[None] | None = None
+        # Endpoints of the running ogero.refresh batch; they skip the budget
+        # and outage gates so the action never reports cached data as fresh.
+        self._forced: set[str] = set()
+        self._outage_deferred: set[str] = set()
+        self._polling = False
 
-    async def _async_update_data(self) -> OgeroCoordinatorData:
-        """Update data via the API client."""
+    async def async_shutdown(self) -> None:
+        """Release this line's budget share and its part of the login totals."""
+        domain_data = get_domain_data(self.hass)
+        domain_data.budget.unregister_line(self.config_entry.entry_id, self.account_key)
+        domain_data.outage.remove_waiter(self._async_outage_ended)
+        if (runtime := self.config_entry.runtime_data) is not None:
+            runtime.totals.async_remove_line(self.account_key)
+        if self._unsub_stale is not None:
+            self._unsub_stale()
+            self._unsub_stale = None
+        await super().async_shutdown()
+
+    def is_stale(self, now: datetime | None = None) -> bool:
+        """Return whether the cached data is older than the staleness policy."""
+        if self.max_data_age is None or self.data is None:
+            return False
+        fetched_at = self.data.data_fetched
+        if fetched_at is None:
+            return False
+        return (now or dt_util.utcnow()) - fetched_at >= self.max_data_age
+
+    @callback
+    def _async_schedule_stale_check(self) -> None:
+        """Update entities again when the cached data reaches the age limit."""
+        if self._unsub_stale is not None:
+            self._unsub_stale()
+            self._unsub_stale = None
+        if self.max_data_age is None or self.data is None:
+            return
+        if self.data.data_fetched is None:
+            return
+        stale_at = self.data.data_fetched + self.max_data_age
+        if stale_at > dt_util.utcnow():
+            self._unsub_stale = async_track_point_in_utc_time(
+                self.hass, self._async_data_went_stale, stale_at
+            )
+
+    @callback
+    def _async_data_went_stale(self, _now: datetime) -> None:
+        """Mark entities unavailable once the data is too old to show."""
+        self._unsub_stale = None
+        LOGGER.warning(
+            "Ogero data for %s is older than %s; its entities are unavailable "
+            "until a poll succeeds",
+            self.account_key,
+            self.max_data_age,
+        )
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Fold this line into the login totals before notifying entities."""
+        runtime = self.config_entry.runtime_data
+        if runtime is not None:
+            runtime.totals.async_update_line(self.account_key, self.data)
+        self._async_check_quota_threshold()
+        self._async_schedule_stale_check()
+        with (
+            runtime.tracer.span(
+                "update_entities",
+                line=self.account_key,
+                listeners=len(self._listeners),
+            )
+            if runtime is not None
+            else nullcontext()
+        ):
+            super().async_update_listeners()
+
+    @callback
+    def _async_fire_bill_changes(self, bill_info: BillInfo) -> None:
+        """Fire one event per bill or balance change since the last poll."""
+        changes = self.bill_index.update(bill_info)
+        self.config_entry.runtime_data.history.async_schedule_save()
+        for event_type, data in changes:
+            self.hass.bus.async_fire(
+                event_type,
+                {
+                    "config_entry_id": self.config_entry.entry_id,
+                    "line": self.account_key,
+                    "account": str(self.account),
+                    **data,
+                },
+            )
+
+    @callback
+    def _async_check_quota_threshold(self) -> None:
+        """Fire one event when usage climbs past a configured threshold."""
+        if self.data is None:
+            return
+        reached = reached_threshold(self.quota_thresholds, self.data.usage_percent)
+        previous, self._threshold_reached = self._threshold_reached, reached
+        # The first data only sets the baseline; a drop means a new cycle.
+        if previous is None or reached <= previous:
+            return
+        self.hass.bus.async_fire(
+            EVENT_QUOTA_THRESHOLD,
+            {
+                "config_entry_id": self.config_entry.entry_id,
+                "line": self.account_key,
+                "account": str(self.account),
+                "threshold": reached,
+                "usage_percent": self.data.usage_percent,
+                "quota": self.data.quota,
+                "total_consumption": self.data.total_consumption,
+            },
+        )
+
+    async def _async_refresh(self, *args: object, **kwargs: object) -> None:
+        """Refresh in a tracing span, under the login's profiler when armed."""
+        runtime = self.config_entry.runtime_data
+        profiler = runtime.profiler
+        with runtime.tracer.span("refresh", line=self.account_key) as span:
+            if profiler is not None:
+                profiler.async_start_cycle(self.account_key)
+            try:
+                await super()._async_refresh(*args, **kwargs)
+            finally:
+                if profiler is not None:
+                    profiler.async_end_cycle(self.account_key)
+            if span is not None and not self.last_update_success:
+                span.outcome = "failed"
+
+    async def async_refresh(self) -> None:
+        """Refresh every endpoint now (manual and entity update requests)."""
+        self._mark_due(self.endpoints)
+        await super().async_refresh()
+
+    async def async_refresh_endpoints(self, endpoints: Iterable[str]) -> None:
+        """
+        Refresh the given endpoints and wait until they are fresh.
+
+        Requests that arrive while a refresh is queued or running join it;
+        endpoints asked for after a batch started are fetched in one follow-up
+        batch. Batches wait for a domain-wide refresh slot.
+        """
+        self._requested.update(endpoints)
+        # The task starts eagerly and may finish before it is stored here.
+        if self._requested_refresh is None or self._requested_refresh.done():
+            self._requested_refresh = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_refresh_requested(),
+                f"{self.name} requested refresh",
+            )
+        await asyncio.shield(self._requested_refresh)
+
+    async def _async_refresh_requested(self) -> None:
+        """Fetch requested endpoints in batches until none are left."""
+        try:
+            async with get_domain_data(self.hass).refresh_slots:
+                while self._requested:
+                    batch, self._requested = self._requested, set()
+                    self._mark_due(batch)
+                    self._forced = batch
+                    try:
+                        await super().async_refresh()
+                    finally:
+                        self._forced = set()
+        finally:
+            self._requested_refresh = None
+
+    def _mark_due(self, endpoints: Iterable[str]) -> None:
+        """Make the given endpoints due on the next refresh."""
+        for endpoint in endpoints:
+            self.endpoints[endpoint].next_attempt = None
+
+    def _endpoint_fetchers(
+        self,
+    ) -> list[tuple[str, EndpointState[Any], Callable[[Account], Awaitable[Any]]]]:
+        """Return each endpoint with its state and API call."""
         client = self.config_entry.runtime_data.client
+        return [
+            (ENDPOINT_CONSUMPTION, self.consumption, client.async_get_consumption),
+            (ENDPOINT_BILLS, self.bills, client.async_get_bills),
+        ]
+
+    async def _async_fetch[T](
+        self,
+        endpoint: str,
+        state: EndpointState[T],
+        fetch: Callable[[Account], Awaitable[T]],
+        poll: PollAttempt,
+    ) -> bool:
+        """Fetch one endpoint; keep its cached result when the call fails."""
+        retry = state.failures
+        outcome = "error"
+        started = time.monotonic()
+        with (
+            count_received_bytes() as received,
+            self.config_entry.runtime_data.tracer.span(
+                "fetch", line=self.account_key, endpoint=endpoint
+            ) as span,
+        ):
+            try:
+                if self.watchdog is None:
+                    result = await fetch(self.account)
+                else:
+                    result = await self.watchdog.async_track(
+                        endpoint, fetch(self.account)
+                    )
+            except OgeroApiClientAuthenticationError as exception:
+                outcome = "auth_failed"
+                raise ConfigEntryAuthFailed(exception) from exception
+            except OgeroApiClientError as exception:
+                outcome = type(exception).__name__
+                state.record_failure(exception, poll.started)
+                outage = get_domain_data(self.hass).outage
+                if isinstance(exception, OgeroApiClientCommunicationError):
+                    outage.record_failure(
+                        poll.started,
+                        self.account_key,
+                        self.scheduler.current_interval(poll.started),
+                        connection=isinstance(exception, OgeroApiClientConnectionError),
+                    )
+                    if outage.retry_at is not None:
+                        # Retry with the shared probe, not on this endpoint's
+                        # longer backoff, so the line recovers with the portal.
+                        state.next_attempt = outage.retry_at
+                        self._await_outage(endpoint)
+                else:
+                    outage.record_success()
+                return False
+            else:
+                outcome = "ok"
+                state.record_success(result, poll.started)
+                get_domain_data(self.hass).outage.record_success()
+                return True
+            finally:
+                poll.endpoints.append(
+                    EndpointAttempt(
+                        endpoint,
+                        time.monotonic() - started,
+                        received[0],
+                        outcome,
+                        retry,
+                    )
+                )
+                if span is not None:
+                    span.outcome = outcome
+
+    async def _async_update_data(self) -> OgeroCoordinatorData:
+        """Poll and keep a record of the attempt."""
+        poll = PollAttempt(started=dt_util.utcnow())
+        started = time.monotonic()
+        self._polling = True
         try:
-            consumption = await client.async_get_consumption(self.account)
-            bill_info = await client.async_get_bills(self.account)
-        except OgeroApiClientAuthenticationError as exception:
-            raise ConfigEntryAuthFailed(exception) from exception
-        except OgeroApiClientError as exception:
+            if self.watchdog is None:
+                data = await self._async_poll(poll)
+            else:
+                data = await self.watchdog.async_track("update", self._async_poll(poll))
+        except Exception as exception:
+            self._finish_poll(
+                poll, time.monotonic() - started, type(exception).__name__
+            )
+            raise
+        finally:
+            self._polling = False
+        self._finish_poll(poll, time.monotonic() - started, "ok")
+        return data
+
+    def _finish_poll(self, poll: PollAttempt, duration: float, result: str) -> None:
+        """Keep the attempt in the timeline and count it in the metrics."""
+        self.timeline.record(poll, duration, result)
+        get_domain_data(self.hass).metrics.observe_poll(poll)
+
+    async def _async_poll(self, poll: PollAttempt) -> OgeroCoordinatorData:
+        """Fetch due endpoints and publish the newest result of each."""
+        now = poll.started
+        refreshed: list[EndpointState[Any]] = []
+        failed: list[str] = []
+
+        for endpoint, state, fetch in self._endpoint_fetchers():
+            if not state.is_due(now):
+                continue
+            fetched = await self._async_poll_endpoint(endpoint, state, fetch, poll)
+            if fetched:
+                refreshed.append(state)
+            elif fetched is not None:
+                failed.append(endpoint)
+
+        if self.consumption in refreshed and self.consumption.result is not None:
+            self._record_consumption(self.consumption.result, now)
+        if self.bills in refreshed and self.bills.result is not None:
+            self._async_fire_bill_changes(self.bills.result)
+        next_attempt = now + self.scheduler.next_delay(now)
+        for state in refreshed:
+            state.next_attempt = next_attempt
+        self._schedule_next_poll(now)
+
+        consumption = self.consumption.result
+        bill_info = self.bills.result
+        if consumption is None or bill_info is None or (failed and not refreshed):
+            errors = [self.endpoints[endpoint].error for endpoint in failed]
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="poll_failed",
-            ) from exception
+            ) from next((error for error in errors if error), None)
+        if failed:
+            LOGGER.warning(
+                "Ogero %s request failed for %s; keeping the cached result",
+                ", ".join(failed),
+                self.account_key,
+            )
+        data = (
+            self.data
+            if not refreshed and self.data is not None
+            else build_coordinator_data(consumption, bill_info)
+        )
+        data = replace(
+            data,
+            **self.history.derived(now),
+            **self.forecast.derived(now, data.quota),
+            data_fetched=min(
+                (
+                    state.fetched_at
+                    for state in self.endpoints.values()
+                    if state.fetched_at is not None
+                ),
+                default=None,
+            ),
+        )
+        # Keep the published snapshot when nothing in it changed.
+        return self.data if data == self.data else data
 
-        unpaid_bills = [
-            {
-                "period": bill.date.strftime("%Y-%m"),
-                "amount": f"{bill.amount.currency} {int(bill.amount.amount)}",
-                "status": bill.status.name,
-            }
-            for bill in bill_info.bills
-            if bill.status == BillStatus.UNPAID
-        ]
+    async def _async_poll_endpoint[T](
+        self,
+        endpoint: str,
+        state: EndpointState[T],
+        fetch: Callable[[Account], Awaitable[T]],
+        poll: PollAttempt,
+    ) -> bool | None:
+        """
+        Refresh one due endpoint; None when it is deferred.
+
+        With a shared cache, a result another instance fetched within the
+        current interval, and newer than the one held here, is used as is, so
+        instances polling out of phase take turns instead of all asking Ogero.
+        Only the instance holding the lease on the endpoint fetches it. A
+        manual refresh only accepts a result fetched after it was requested,
+        and waits for a fetch in progress elsewhere instead of being deferred.
+        """
+        cache = self.config_entry.runtime_data.shared_cache
+        if cache is None:
+            return await self._async_request(endpoint, state, fetch, poll)
+        now = poll.started
+        requested = state.next_attempt is None
+        if requested and state.result is not None:
+            not_before = now
+        else:
+            not_before = now - self.scheduler.current_interval(now)
+            if state.fetched_at is not None:
+                # Never this instance's own result again.
+                not_before = max(not_before, state.fetched_at + timedelta.resolution)
+        lookup = await cache.async_lookup(self.account_key, endpoint, now, not_before)
+        if requested:
+            lookup = await self._async_wait_for_lease(cache, endpoint, lookup)
+        if lookup.result is not None:
+            state.record_success(lookup.result, lookup.fetched_at or now)
+            poll.endpoints.append(
+                EndpointAttempt(endpoint, 0.0, 0, "shared_cache", state.failures)
+            )
+            return True
+        if not lookup.claimed:
+            LOGGER.debug(
+                "Another instance is fetching %s for %s; deferring until %s",
+                endpoint,
+                self.account_key,
+                lookup.retry_at,
+            )
+            self._defer(endpoint, state, poll, lookup.retry_at)
+            return None
+        fetched = None
+        try:
+            fetched = await self._async_request(endpoint, state, fetch, poll)
+        finally:
+            if fetched and state.result is not None:
+                await cache.async_store(self.account_key, endpoint, state.result, now)
+            else:
+                await cache.async_release(self.account_key, endpoint)
+        return fetched
+
+    async def _async_wait_for_lease(
+        self, cache: SharedResponseCache, endpoint: str, lookup: SharedLookup
+    ) -> SharedLookup:
+        """
+        Wait for another instance's fetch of an endpoint and return its result.
+
+        Gives up after one lease and claims the endpoint for this instance.
+        """
+        wait = SHARED_CACHE_WAIT.total_seconds()
+        for _ in range(int(SHARED_CACHE_LEASE / SHARED_CACHE_WAIT)):
+            if lookup.claimed or lookup.result is not None:
+                return lookup
+            # Accept what the fetch in progress brings back.
+            not_before = (
+                lookup.retry_at - SHARED_CACHE_LEASE
+                if lookup.retry_at is not None
+                else dt_util.utcnow()
+            )
+            await asyncio.sleep(wait)
+            lookup = await cache.async_lookup(
+                self.account_key, endpoint, dt_util.utcnow(), not_before
+            )
+        if lookup.claimed or lookup.result is not None:
+            return lookup
+        return SharedLookup(claimed=True)
+
+    async def _async_request[T](
+        self,
+        endpoint: str,
+        state: EndpointState[T],
+        fetch: Callable[[Account], Awaitable[T]],
+        poll: PollAttempt,
+    ) -> bool | None:
+        """
+        Fetch one endpoint unless Ogero is down or the budget is spent.
+
+        Endpoints requested through ogero.refresh are always fetched.
+        """
+        now = poll.started
+        forced = endpoint in self._forced
+        domain_data = get_domain_data(self.hass)
+        outage = domain_data.outage
+        if not forced and not outage.try_acquire(
+            now, self.scheduler.current_interval(now)
+        ):
+            LOGGER.debug(
+                "Ogero is unreachable; deferring %s for %s until %s",
+                endpoint,
+                self.account_key,
+                outage.retry_at,
+            )
+            self._defer(endpoint, state, poll, outage.retry_at)
+            self._await_outage(endpoint)
+            return None
+        budget = domain_data.budget
+        if not budget.try_acquire(
+            self.config_entry.entry_id,
+            self.account_key,
+            now,
+            force=forced or state.result is None,
+        ):
+            LOGGER.debug(
+                "Request budget exhausted; deferring %s for %s",
+                endpoint,
+                self.account_key,
+            )
+            self._defer(endpoint, state, poll, budget.next_slot(now))
+            return None
+        return await self._async_fetch(endpoint, state, fetch, poll)
+
+    def _await_outage(self, endpoint: str) -> None:
+        """Poll an endpoint held back by an outage as soon as it ends."""
+        self._outage_deferred.add(endpoint)
+        get_domain_data(self.hass).outage.add_waiter(self._async_outage_ended)
 
-        has_unpaid_bills = any(
-            bill.status == BillStatus.UNPAID for bill in bill_info.bills
+    @callback
+    def _async_outage_ended(self) -> None:
+        """Make the endpoints the outage held back due and refresh them."""
+        now = dt_util.utcnow()
+        for endpoint in self._outage_deferred:
+            self.endpoints[endpoint].next_attempt = now
+        self._outage_deferred.clear()
+        if self._polling:
+            # The running poll schedules the next one from the due times.
+            return
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_refresh_due(), f"{self.name} outage recovery"
         )
-        extra_consumption = consumption.extra_consumption
-
-        return OgeroCoordinatorData(
-            quota=consumption.quota,
-            last_update=consumption.last_update,
-            speed=consumption.speed,
-            total_consumption=consumption.total_consumption,
-            extra_consumption=extra_consumption,
-            outstanding_balance=int(bill_info.total_outstanding.amount),
-            unpaid_bills=unpaid_bills,
-            has_unpaid_bills=has_unpaid_bills,
-            has_extra_consumption=extra_consumption > 0,
+
+    async def _async_refresh_due(self) -> None:
+        """Refresh due endpoints in a domain-wide refresh slot."""
+        async with get_domain_data(self.hass).refresh_slots:
+            await super().async_refresh()
+
+    @staticmethod
+    def _defer(
+        endpoint: str,
+        state: EndpointState[Any],
+        poll: PollAttempt,
+        until: datetime | None,
+    ) -> None:
+        """Skip an endpoint in this poll and retry it at until."""
+        state.next_attempt = until
+        poll.endpoints.append(
+            EndpointAttempt(endpoint, 0.0, 0, "deferred", state.failures)
+        )
+
+    def _record_consumption(self, consumption: ConsumptionInfo, now: datetime) -> None:
+        """Feed a fresh consumption result to the cadence, history and forecast."""
+        self.scheduler.cadence.observe(consumption.last_update)
+        when = consumption.last_update or now
+        if self.history.append(when, consumption.total_consumption):
+            self.forecast.add(when, consumption.total_consumption)
+            self.config_entry.runtime_data.history.async_schedule_save()
+
+    def _schedule_next_poll(self, now: datetime) -> None:
+        """Wake up when the earliest endpoint is due."""
+        next_attempt = min(
+            (
+                state.next_attempt
+                for state in self.endpoints.values()
+                if state.next_attempt is not None
+            ),
+            default=now + self.scheduler.current_interval(now),
         )
+        self.update_interval = max(next_attempt - now, ENDPOINT_DUE_SLACK)
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from homeassistant.util.hass_dict import HassKey
+
+from .aggregate import OgeroLoginTotals
+from .budget import OgeroRequestBudget
+from .const import DOMAIN, REFRESH_CONCURRENCY
+from .metrics import OgeroMetrics
+from .scheduler import PortalOutage
+from .tracing import OgeroTracer
+
 if TYPE_CHECKING:
+    import aiohttp
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
     from homeassistant.loader import Integration
 
     from .api import OgeroApiClient
     from .coordinator import OgeroDataUpdateCoordinator
+    from .history import OgeroHistoryStore
+    from .profiler import OgeroProfiler
+    from .shared_cache import SharedResponseCache
 
 
 type OgeroConfigEntry = ConfigEntry[OgeroData]
@@ -22,4 +37,32 @@ class OgeroData:
 
     client: OgeroApiClient
     integration: Integration
+    history: OgeroHistoryStore
     coordinators: dict[str, OgeroDataUpdateCoordinator] = field(default_factory=dict)
+    totals: OgeroLoginTotals = field(default_factory=OgeroLoginTotals)
+    profiler: OgeroProfiler | None = None
+    tracer: OgeroTracer = field(default_factory=OgeroTracer)
+    shared_cache: SharedResponseCache | None = None
+
+
+@dataclass
+class OgeroDomainData:
+    """State shared by every Ogero config entry."""
+
+    budget: OgeroRequestBudget = field(default_factory=OgeroRequestBudget)
+    refresh_slots: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(REFRESH_CONCURRENCY)
+    )
+    metrics: OgeroMetrics = field(default_factory=OgeroMetrics)
+    outage: PortalOutage = field(default_factory=PortalOutage)
+    session: aiohttp.ClientSession | None = None
+
+
+DATA_OGERO: HassKey[OgeroDomainData] = HassKey(DOMAIN)
+
+
+def get_domain_data(hass: HomeAssistant) -> OgeroDomainData:
+    """Return state shared by all Ogero logins, creating it on first use."""
+    if DATA_OGERO not in hass.data:
+        hass.data[DATA_OGERO] = OgeroDomainData()
+    return hass.data[DATA_OGERO]
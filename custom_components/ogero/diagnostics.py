@@ -8,11 +8,13 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 
 from .const import DOMAIN, VERSION
+from .data import get_domain_data
+from .tracing import InMemoryCollector
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-    from .coordinator import OgeroCoordinatorData
+    from .coordinator import OgeroDataUpdateCoordinator
     from .data import OgeroConfigEntry
 
 TO_REDACT = {
@@ -28,6 +30,13 @@ class OgeroAccountDiagnostics(TypedDict, total=False):
     last_update_success: bool | None
     last_exception: str | None
     data: dict[str, object] | None
+    priority: str
+    requests_in_window: int
+    fair_share: float
+    polling: dict[str, object]
+    data_is_stale: bool
+    poll_timeline: list[dict[str, object]]
+    loop_watchdog: dict[str, object] | None
 
 
 class OgeroDiagnosticsPayload(TypedDict):
@@ -36,28 +45,43 @@ class OgeroDiagnosticsPayload(TypedDict):
     domain: str
     integration_version: str
     options: dict[str, object]
+    request_budget: dict[str, object]
+    portal_outage: dict[str, object]
     accounts: list[OgeroAccountDiagnostics]
+    traces: list[dict[str, object]] | None
 
 
-def _coordinator_data_dict(data: OgeroCoordinatorData) -> dict[str, object]:
+def _polling_dict(coordinator: OgeroDataUpdateCoordinator) -> dict[str, object]:
+    scheduler = coordinator.scheduler
+    period = scheduler.cadence.period
     return {
-        "quota": data.quota,
-        "speed": data.speed,
-        "total_consumption": data.total_consumption,
-        "extra_consumption": data.extra_consumption,
-        "last_update": data.last_update,
-        "outstanding_balance": data.outstanding_balance,
-        "unpaid_bills": data.unpaid_bills,
-        "has_unpaid_bills": data.has_unpaid_bills,
-        "has_extra_consumption": data.has_extra_consumption,
+        "adaptive": scheduler.adaptive,
+        "configured_interval_seconds": scheduler.interval.total_seconds(),
+        "current_interval_seconds": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval
+        else None,
+        "upstream_period_seconds": period.total_seconds() if period else None,
+        "expected_upstream_update": scheduler.cadence.expected_next,
+        "endpoints": {
+            name: {
+                "fetched_at": state.fetched_at,
+                "next_attempt": state.next_attempt,
+                "failures": state.failures,
+                "last_error": repr(state.error) if state.error else None,
+            }
+            for name, state in coordinator.endpoints.items()
+        },
     }
 
 
 async def async_get_config_entry_diagnostics(
-    _hass: HomeAssistant, entry: OgeroConfigEntry
+    hass: HomeAssistant, entry: OgeroConfigEntry
 ) -> OgeroDiagnosticsPayload:
     """Return diagnostics for a config entry."""
     runtime = entry.runtime_data
+    domain_data = get_domain_data(hass)
+    budget = domain_data.budget
+    exporter = runtime.tracer.exporter
     accounts: list[OgeroAccountDiagnostics] = []
 
     for account_key, coordinator in runtime.coordinators.items():
@@ -68,8 +92,15 @@ async def async_get_config_entry_diagnostics(
                 "last_exception": repr(coordinator.last_exception)
                 if coordinator.last_exception
                 else None,
-                "data": _coordinator_data_dict(coordinator.data)
-                if coordinator.data
+                "data": coordinator.data.as_dict() if coordinator.data else None,
+                "priority": coordinator.scheduler.priority,
+                "requests_in_window": budget.usage(entry.entry_id, account_key),
+                "fair_share": budget.share(entry.entry_id, account_key),
+                "polling": _polling_dict(coordinator),
+                "data_is_stale": coordinator.is_stale(),
+                "poll_timeline": coordinator.timeline.as_list(),
+                "loop_watchdog": coordinator.watchdog.as_dict()
+                if coordinator.watchdog
                 else None,
             }
         )
@@ -81,7 +112,15 @@ async def async_get_config_entry_diagnostics(
                 "domain": DOMAIN,
                 "integration_version": VERSION,
                 "options": dict(entry.options),
+                "request_budget": {
+                    "capacity": budget.capacity,
+                    "used": budget.used,
+                },
+                "portal_outage": domain_data.outage.as_dict(),
                 "accounts": accounts,
+                "traces": exporter.as_list()
+                if isinstance(exporter, InMemoryCollector)
+                else None,
             },
             TO_REDACT,
         ),
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN, NAME
@@ -12,6 +13,7 @@ from .coordinator import OgeroDataUpdateCoordinator
 
 if TYPE_CHECKING:
     from .api import Account
+    from .data import OgeroConfigEntry
 
 
 class OgeroEntity(CoordinatorEntity[OgeroDataUpdateCoordinator]):  # type: ignore[misc]
@@ -41,5 +43,38 @@ class OgeroEntity(CoordinatorEntity[OgeroDataUpdateCoordinator]):  # type: ignor
 
     @property
     def available(self) -> bool:
-        """Show last successful snapshot when a poll fails (UpdateFailed)."""
-        return self.coordinator.data is not None
+        """
+        Show last successful snapshot when a poll fails (UpdateFailed).
+
+        With a maximum data age set, the snapshot is hidden once it is older.
+        """
+        return self.coordinator.data is not None and not self.coordinator.is_stale()
+
+
+class OgeroLoginEntity(Entity):  # type: ignore[misc]
+    """Base entity for values that cover every line of a login."""
+
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, entry: OgeroConfigEntry, key: str) -> None:
+        """Initialize."""
+        self._totals = entry.runtime_data.totals
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer=NAME,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Update when any line changes the login totals."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._totals.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def available(self) -> bool:
+        """Available once at least one line has data."""
+        return self._totals.lines > 0
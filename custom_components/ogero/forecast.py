@@ -0,0 +1,106 @@
+"""End-of-cycle consumption forecast for one line."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_DAY_SECONDS = timedelta(days=1).total_seconds()
+# A trend over a shorter span is mostly noise.
+_MIN_FIT_SPAN = timedelta(hours=6).total_seconds()
+
+
+def _cycle_end(when: datetime) -> datetime:
+    """Return the local start of the month after when (the cycle end)."""
+    next_month = dt_util.as_local(when).replace(day=1) + timedelta(days=32)
+    return next_month.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+class CycleForecast:
+    """
+    Least-squares trend of total consumption over the current billing cycle.
+
+    Samples are folded into running sums, so each update costs the same no
+    matter how many samples the cycle has. The cycle is the local calendar
+    month; a drop in total consumption also starts a new one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._cycle_end: datetime | None = None
+        self._origin = 0.0
+        self._last_time = 0.0
+        self._last_value = 0.0
+        self._n = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[tuple[float, float]]) -> CycleForecast:
+        """Build a forecast from (epoch seconds, total consumption) samples."""
+        forecast = cls()
+        for timestamp, value in samples:
+            forecast.add(dt_util.utc_from_timestamp(timestamp), value)
+        return forecast
+
+    def add(self, when: datetime, total_consumption: float) -> None:
+        """Fold a sample into the fit, starting a new cycle when needed."""
+        timestamp = dt_util.as_utc(when).timestamp()
+        if self._n and timestamp <= self._last_time:
+            return
+        cycle_end = _cycle_end(when)
+        if cycle_end != self._cycle_end or total_consumption < self._last_value:
+            self._reset(cycle_end, timestamp)
+        # Days since the first sample of the cycle keep the sums well scaled.
+        x = (timestamp - self._origin) / _DAY_SECONDS
+        self._n += 1
+        self._sum_x += x
+        self._sum_y += total_consumption
+        self._sum_xx += x * x
+        self._sum_xy += x * total_consumption
+        self._last_time = timestamp
+        self._last_value = total_consumption
+
+    def consumption_at_cycle_end(self, now: datetime) -> float | None:
+        """Return the projected total consumption when the cycle ends."""
+        if (
+            self._cycle_end is None
+            or self._n < 2  # noqa: PLR2004
+            or (self._last_time - self._origin) < _MIN_FIT_SPAN
+            or now >= self._cycle_end
+        ):
+            return None
+        denominator = self._n * self._sum_xx - self._sum_x**2
+        if denominator <= 0:
+            return None
+        slope = (self._n * self._sum_xy - self._sum_x * self._sum_y) / denominator
+        intercept = (self._sum_y - slope * self._sum_x) / self._n
+        end = (self._cycle_end.timestamp() - self._origin) / _DAY_SECONDS
+        # Usage only grows within a cycle.
+        return round(max(intercept + max(slope, 0.0) * end, self._last_value), 3)
+
+    def derived(self, now: datetime, quota: int) -> dict[str, float | None]:
+        """Return the forecast values as coordinator data fields."""
+        forecast = self.consumption_at_cycle_end(now)
+        return {
+            "forecast_consumption": forecast,
+            "forecast_extra_consumption": (
+                round(max(forecast - quota, 0.0), 3)
+                if forecast is not None and quota
+                else None
+            ),
+        }
+
+    def _reset(self, cycle_end: datetime, origin: float) -> None:
+        """Forget the previous cycle."""
+        self._cycle_end = cycle_end
+        self._origin = origin
+        self._n = 0
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
@@ -0,0 +1,252 @@
+"""Per-line consumption history kept in a persisted ring buffer."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .bills import OgeroBillIndex
+from .const import (
+    DOMAIN,
+    HISTORY_CAPACITY,
+    HISTORY_SAVE_DELAY,
+    HISTORY_STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from homeassistant.core import HomeAssistant
+
+_DAY_SECONDS = timedelta(days=1).total_seconds()
+# Averages over shorter spans swing too much to be useful.
+_MIN_RATE_SPAN = timedelta(hours=6).total_seconds()
+
+
+class _StoredLine(TypedDict):
+    """Stored samples of one line, oldest first, and its last seen bills."""
+
+    times: list[float]
+    values: list[float]
+    deltas: list[float]
+    bills: NotRequired[dict[str, Any]]
+
+
+class ConsumptionHistory:
+    """
+    Ring buffer of (timestamp, total_consumption) samples for one line.
+
+    Samples live in flat ``array('d')`` buffers. Each sample also keeps the
+    usage since the previous one (a drop in total consumption is a new cycle,
+    so the whole new value counts), which lets usage today, usage over the
+    last 24 hours and the average daily rate be kept as running sums.
+    """
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY) -> None:
+        """Initialize."""
+        self._capacity = capacity
+        # Buffers grow up to capacity, then wrap around.
+        self._times = array("d")
+        self._values = array("d")
+        self._deltas = array("d")
+        # Sequence number of the next sample; slot is sequence % capacity.
+        self._count = 0
+        self._total = 0.0
+        self._window_start = 0
+        self._window_sum = 0.0
+        self._day: str | None = None
+        self._today = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of retained samples."""
+        return min(self._count, self._capacity)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Yield (epoch seconds, total consumption), oldest first."""
+        for slot in self._slots():
+            yield self._times[slot], self._values[slot]
+
+    def _slots(self) -> Iterator[int]:
+        """Yield the buffer slots of the retained samples, oldest first."""
+        for seq in range(self._count - len(self), self._count):
+            yield seq % self._capacity
+
+    @property
+    def newest(self) -> tuple[float, float] | None:
+        """Return the newest sample."""
+        if not self._count:
+            return None
+        slot = (self._count - 1) % self._capacity
+        return self._times[slot], self._values[slot]
+
+    def append(self, when: datetime, total_consumption: float) -> bool:
+        """Add a sample; ignore it unless it is newer than the newest one."""
+        timestamp = dt_util.as_utc(when).timestamp()
+        newest = self.newest
+        if newest is not None and timestamp <= newest[0]:
+            return False
+        if newest is None:
+            delta = 0.0
+        elif total_consumption >= newest[1]:
+            delta = total_consumption - newest[1]
+        else:
+            delta = total_consumption
+        self._push(timestamp, total_consumption, delta)
+        return True
+
+    def _push(self, timestamp: float, total_consumption: float, delta: float) -> None:
+        """Store a sample and add its usage to the running sums."""
+        if self._count < self._capacity:
+            self._times.append(timestamp)
+            self._values.append(total_consumption)
+            self._deltas.append(delta)
+        else:
+            self._evict(self._count - self._capacity)
+            slot = self._count % self._capacity
+            self._times[slot] = timestamp
+            self._values[slot] = total_consumption
+            self._deltas[slot] = delta
+        self._count += 1
+        self._total += delta
+        self._window_sum += delta
+
+        day = dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+        if day.isoformat() != self._day:
+            self._day = day.isoformat()
+            self._today = 0.0
+        self._today += delta
+
+    def usage_today(self, now: datetime) -> float | None:
+        """Return usage recorded since local midnight."""
+        if not self._count:
+            return None
+        if dt_util.as_local(now).date().isoformat() != self._day:
+            return 0.0
+        return round(self._today, 3)
+
+    def usage_last_24h(self, now: datetime) -> float | None:
+        """Return usage recorded in the 24 hours before now."""
+        if not self._count:
+            return None
+        cutoff = dt_util.as_utc(now).timestamp() - _DAY_SECONDS
+        while (
+            self._window_start < self._count
+            and self._times[self._window_start % self._capacity] <= cutoff
+        ):
+            self._window_sum -= self._deltas[self._window_start % self._capacity]
+            self._window_start += 1
+        return round(max(self._window_sum, 0.0), 3)
+
+    def average_daily_usage(self) -> float | None:
+        """Return the mean usage per day across the retained samples."""
+        if len(self) < 2:  # noqa: PLR2004
+            return None
+        oldest = self._times[(self._count - len(self)) % self._capacity]
+        newest = self._times[(self._count - 1) % self._capacity]
+        span = newest - oldest
+        if span < _MIN_RATE_SPAN:
+            return None
+        # The oldest sample's delta reaches back before the span; leave it out.
+        usage = self._total - self._deltas[(self._count - len(self)) % self._capacity]
+        return round(usage / span * _DAY_SECONDS, 3)
+
+    def derived(self, now: datetime) -> dict[str, float | None]:
+        """Return the derived usage values as coordinator data fields."""
+        return {
+            "usage_today": self.usage_today(now),
+            "usage_last_24h": self.usage_last_24h(now),
+            "average_daily_usage": self.average_daily_usage(),
+        }
+
+    def as_dict(self) -> _StoredLine:
+        """Return samples for storage."""
+        slots = list(self._slots())
+        return {
+            "times": [self._times[slot] for slot in slots],
+            "values": [self._values[slot] for slot in slots],
+            "deltas": [self._deltas[slot] for slot in slots],
+        }
+
+    @classmethod
+    def from_dict(cls, stored: _StoredLine) -> ConsumptionHistory:
+        """Rebuild a buffer (and its running sums) from stored samples."""
+        history = cls()
+        for timestamp, value, delta in zip(
+            stored["times"], stored["values"], stored["deltas"], strict=True
+        ):
+            history._push(float(timestamp), float(value), float(delta))
+        return history
+
+    def _evict(self, seq: int) -> None:
+        """Drop the sample with this sequence number from the running sums."""
+        slot = seq % self._capacity
+        self._total -= self._deltas[slot]
+        if seq >= self._window_start:
+            self._window_sum -= self._deltas[slot]
+            self._window_start = seq + 1
+
+
+class OgeroHistoryStore:
+    """Persist the consumption history and bill index of every line of a login."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, _StoredLine]] = Store(
+            hass, HISTORY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history"
+        )
+        self._lines: dict[str, ConsumptionHistory] = {}
+        self._bills: dict[str, OgeroBillIndex] = {}
+
+    async def async_load(self) -> None:
+        """Load stored samples and bills; unreadable lines start empty."""
+        stored = await self._store.async_load() or {}
+        for serial, line in stored.items():
+            try:
+                self._lines[serial] = ConsumptionHistory.from_dict(line)
+                if "bills" in line:
+                    self._bills[serial] = OgeroBillIndex.from_dict(line["bills"])
+            except KeyError, TypeError, ValueError:
+                continue
+
+    def line(self, serial: str) -> ConsumptionHistory:
+        """Return the history of a line, creating it when new."""
+        if serial not in self._lines:
+            self._lines[serial] = ConsumptionHistory()
+        return self._lines[serial]
+
+    def bill_index(self, serial: str) -> OgeroBillIndex:
+        """Return the bill index of a line, creating it when new."""
+        if serial not in self._bills:
+            self._bills[serial] = OgeroBillIndex()
+        return self._bills[serial]
+
+    def retain(self, serials: set[str]) -> None:
+        """Forget lines that are no longer polled."""
+        for serial in set(self._lines) - serials:
+            del self._lines[serial]
+        for serial in set(self._bills) - serials:
+            del self._bills[serial]
+
+    def async_schedule_save(self) -> None:
+        """Save soon, batching the writes of lines that poll together."""
+        self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save now, replacing a pending delayed save (the login unloads)."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the stored history (the login was removed)."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        data = {serial: line.as_dict() for serial, line in self._lines.items()}
+        for serial, index in self._bills.items():
+            bills = index.as_dict()
+            if bills is not None and serial in data:
+                data[serial]["bills"] = bills
+        return data
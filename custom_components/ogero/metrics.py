@@ -0,0 +1,163 @@
+"""Prometheus metrics for Ogero polls, kept as plain in-memory counters."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from .const import POLL_DURATION_BUCKETS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from .coordinator import OgeroDataUpdateCoordinator
+    from .scheduler import PortalOutage
+    from .timeline import PollAttempt
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(**labels: str) -> str:
+    """Format a Prometheus label set."""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class OgeroMetrics:
+    """
+    Counters and a poll latency histogram shared by all Ogero logins.
+
+    Polls update these as they finish; a scrape only formats them together
+    with per-line state the coordinators already hold, so it never causes a
+    request to Ogero.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_deferred = 0
+        self._buckets = [0] * len(POLL_DURATION_BUCKETS)
+        self._poll_count = 0
+        self._poll_sum = 0.0
+
+    def observe_poll(self, poll: PollAttempt) -> None:
+        """
+        Count a finished poll of a line.
+
+        Only endpoints the poll looked at count as cache lookups; one that was
+        not due yet is neither a hit nor a miss.
+        """
+        for attempt in poll.endpoints:
+            if attempt.result == "deferred":
+                self.cache_deferred += 1
+            elif attempt.result == "shared_cache":
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+                self.requests[attempt.endpoint, attempt.result] += 1
+        if poll.duration is not None:
+            self._poll_count += 1
+            self._poll_sum += poll.duration
+            index = bisect_left(POLL_DURATION_BUCKETS, poll.duration)
+            if index < len(self._buckets):
+                self._buckets[index] += 1
+
+    def render(
+        self,
+        coordinators: Iterable[OgeroDataUpdateCoordinator],
+        outage: PortalOutage,
+        now: datetime,
+    ) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP ogero_requests_total Ogero endpoint requests by result.",
+            "# TYPE ogero_requests_total counter",
+        ]
+        lines.extend(
+            f"ogero_requests_total{_labels(endpoint=endpoint, status=status)} {count}"
+            for (endpoint, status), count in sorted(self.requests.items())
+        )
+        lines += [
+            "# HELP ogero_poll_duration_seconds Time taken by line polls.",
+            "# TYPE ogero_poll_duration_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(POLL_DURATION_BUCKETS, self._buckets, strict=True):
+            cumulative += count
+            lines.append(
+                f"ogero_poll_duration_seconds_bucket{_labels(le=str(bound))} "
+                f"{cumulative}"
+            )
+        lines += [
+            f'ogero_poll_duration_seconds_bucket{{le="+Inf"}} {self._poll_count}',
+            f"ogero_poll_duration_seconds_sum {self._poll_sum}",
+            f"ogero_poll_duration_seconds_count {self._poll_count}",
+            "# HELP ogero_cache_lookups_total Due endpoints by whether a shared"
+            " result was used, Ogero was asked, or the fetch was held back.",
+            "# TYPE ogero_cache_lookups_total counter",
+            f'ogero_cache_lookups_total{{result="hit"}} {self.cache_hits}',
+            f'ogero_cache_lookups_total{{result="miss"}} {self.cache_misses}',
+            f'ogero_cache_lookups_total{{result="deferred"}} {self.cache_deferred}',
+            "# HELP ogero_portal_outage Whether the Ogero portal is treated as down.",
+            "# TYPE ogero_portal_outage gauge",
+            f"ogero_portal_outage {int(outage.retry_at is not None)}",
+            "# HELP ogero_portal_outage_failures Failed requests in the current"
+            " portal outage.",
+            "# TYPE ogero_portal_outage_failures gauge",
+            f"ogero_portal_outage_failures {outage.failures}",
+        ]
+        lines.extend(self._line_metrics(coordinators, now))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _line_metrics(
+        coordinators: Iterable[OgeroDataUpdateCoordinator], now: datetime
+    ) -> list[str]:
+        """Return per-line gauges read from coordinator state."""
+        success: list[str] = []
+        age: list[str] = []
+        failures: list[str] = []
+        backoff: list[str] = []
+        for coordinator in coordinators:
+            line = coordinator.account_key
+            success.append(
+                f"ogero_last_update_success{_labels(line=line)} "
+                f"{int(coordinator.last_update_success)}"
+            )
+            for endpoint, state in coordinator.endpoints.items():
+                labels = _labels(line=line, endpoint=endpoint)
+                if state.fetched_at is not None:
+                    seconds = (now - state.fetched_at).total_seconds()
+                    age.append(f"ogero_data_age_seconds{labels} {seconds}")
+                failures.append(f"ogero_endpoint_failures{labels} {state.failures}")
+                remaining = (
+                    max((state.next_attempt - now).total_seconds(), 0.0)
+                    if state.failures and state.next_attempt is not None
+                    else 0.0
+                )
+                backoff.append(f"ogero_backoff_remaining_seconds{labels} {remaining}")
+        return [
+            "# HELP ogero_last_update_success Whether the last poll of a line "
+            "succeeded.",
+            "# TYPE ogero_last_update_success gauge",
+            *success,
+            "# HELP ogero_data_age_seconds Seconds since an endpoint of a line was "
+            "last fetched.",
+            "# TYPE ogero_data_age_seconds gauge",
+            *age,
+            "# HELP ogero_endpoint_failures Consecutive failed fetches of an endpoint.",
+            "# TYPE ogero_endpoint_failures gauge",
+            *failures,
+            "# HELP ogero_backoff_remaining_seconds Seconds until a failing "
+            "endpoint is retried.",
+            "# TYPE ogero_backoff_remaining_seconds gauge",
+            *backoff,
+        ]
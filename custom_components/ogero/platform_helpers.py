@@ -3,16 +3,33 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_DISABLED_ACCOUNTS,
+    CONF_LINE_OPTIONS,
+    CONF_POLL_SCHEDULE,
+    CONF_PRIORITY,
+    CONF_REQUEST_BUDGET,
     CONF_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_REQUEST_BUDGET,
     DEFAULT_SCAN_INTERVAL,
+    LOGGER,
+    MAX_REQUEST_BUDGET,
     MAX_SCAN_INTERVAL,
+    MIN_REQUEST_BUDGET,
     MIN_SCAN_INTERVAL,
+    PRIORITY_NORMAL,
+    PRIORITY_WEIGHTS,
 )
 from .coordinator import OgeroDataUpdateCoordinator
+from .data import get_domain_data
+from .schedule import PollSchedule
+from .scheduler import PollScheduler
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -21,21 +38,93 @@ if TYPE_CHECKING:
     from .data import OgeroConfigEntry
 
 
-def get_update_interval(entry: OgeroConfigEntry) -> timedelta:
-    """Return the configured poll interval."""
-    if not entry.options or CONF_SCAN_INTERVAL not in entry.options:
-        return DEFAULT_SCAN_INTERVAL
-    raw = entry.options[CONF_SCAN_INTERVAL]
+def _clamp_update_interval(raw: Any, default: timedelta) -> timedelta:
+    """Parse stored seconds and clamp them to the allowed poll range."""
     try:
         seconds = int(raw)
     except TypeError, ValueError:
-        return DEFAULT_SCAN_INTERVAL
+        return default
     lo = int(MIN_SCAN_INTERVAL.total_seconds())
     hi = int(MAX_SCAN_INTERVAL.total_seconds())
     seconds = max(lo, min(seconds, hi))
     return timedelta(seconds=seconds)
 
 
+def get_update_interval(entry: OgeroConfigEntry) -> timedelta:
+    """Return the configured poll interval."""
+    if not entry.options or CONF_SCAN_INTERVAL not in entry.options:
+        return DEFAULT_SCAN_INTERVAL
+    return _clamp_update_interval(
+        entry.options[CONF_SCAN_INTERVAL], DEFAULT_SCAN_INTERVAL
+    )
+
+
+def get_adaptive_polling(entry: OgeroConfigEntry) -> bool:
+    """Return whether polls follow the learned upstream refresh cadence."""
+    return bool(entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING))
+
+
+def get_request_budget(entry: OgeroConfigEntry) -> int:
+    """Return the hourly request allowance this login asks for."""
+    try:
+        budget = int(entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET))
+    except TypeError, ValueError:
+        return DEFAULT_REQUEST_BUDGET
+    return max(MIN_REQUEST_BUDGET, min(budget, MAX_REQUEST_BUDGET))
+
+
+def get_line_options(entry: OgeroConfigEntry, account_serial: str) -> dict[str, Any]:
+    """Return the per-line overrides stored for an account serial."""
+    raw = entry.options.get(CONF_LINE_OPTIONS)
+    if not isinstance(raw, dict):
+        return {}
+    line_options = raw.get(account_serial)
+    return dict(line_options) if isinstance(line_options, dict) else {}
+
+
+def get_line_priority(entry: OgeroConfigEntry, account_serial: str) -> str:
+    """Return the priority tier of a line (normal unless overridden)."""
+    priority = get_line_options(entry, account_serial).get(CONF_PRIORITY)
+    return priority if priority in PRIORITY_WEIGHTS else PRIORITY_NORMAL
+
+
+def get_line_update_interval(
+    entry: OgeroConfigEntry, account_serial: str, default: timedelta
+) -> timedelta:
+    """Return a line's poll interval override, or the login interval."""
+    line_options = get_line_options(entry, account_serial)
+    if CONF_SCAN_INTERVAL not in line_options:
+        return default
+    return _clamp_update_interval(line_options[CONF_SCAN_INTERVAL], default)
+
+
+def get_poll_schedule(
+    entry: OgeroConfigEntry, account_serial: str
+) -> PollSchedule | None:
+    """Return a line's time-of-day poll rules, falling back to the login's."""
+    line_options = get_line_options(entry, account_serial)
+    raw = line_options.get(CONF_POLL_SCHEDULE) or entry.options.get(CONF_POLL_SCHEDULE)
+    if not raw or not isinstance(raw, str):
+        return None
+    try:
+        return PollSchedule.parse(raw)
+    except ValueError as exception:
+        LOGGER.warning("Ignoring poll schedule for %s: %s", account_serial, exception)
+        return None
+
+
+def build_poll_scheduler(
+    entry: OgeroConfigEntry, account_serial: str, update_interval: timedelta
+) -> PollScheduler:
+    """Return the poll scheduler for a line, honouring per-line overrides."""
+    return PollScheduler(
+        get_line_update_interval(entry, account_serial, update_interval),
+        adaptive=get_adaptive_polling(entry),
+        priority=get_line_priority(entry, account_serial),
+        schedule=get_poll_schedule(entry, account_serial),
+    )
+
+
 def get_disabled_account_serials(entry: OgeroConfigEntry) -> set[str]:
     """Return account serials the user removed (device delete) and do not recreate."""
     raw = entry.options.get(CONF_DISABLED_ACCOUNTS)
@@ -45,12 +134,23 @@ def get_disabled_account_serials(entry: OgeroConfigEntry) -> set[str]:
 
 
 async def async_fetch_accounts(
-    _hass: HomeAssistant, entry: OgeroConfigEntry
+    hass: HomeAssistant, entry: OgeroConfigEntry
 ) -> list[Account]:
     """Return all phone|internet lines for this login from the Ogero API."""
     client = entry.runtime_data.client
-    await client.async_login()
-    return cast("list[Account]", await client.async_get_accounts())
+    tracer = entry.runtime_data.tracer
+    budget = get_domain_data(hass).budget
+    with tracer.span("fetch_accounts") as span:
+        # Setup requests always run; they are only counted against the budget.
+        budget.try_acquire(entry.entry_id, "", dt_util.utcnow(), force=True)
+        with tracer.span("login"):
+            await client.async_login()
+        budget.try_acquire(entry.entry_id, "", dt_util.utcnow(), force=True)
+        with tracer.span("get_accounts"):
+            accounts = cast("list[Account]", await client.async_get_accounts())
+        if span is not None:
+            span.tags["lines"] = len(accounts)
+        return accounts
 
 
 async def async_setup_account_coordinators(
@@ -81,7 +181,7 @@ async def async_setup_account_coordinators(
             entry,
             account,
             account.serial,
-            update_interval=update_interval,
+            scheduler=build_poll_scheduler(entry, account.serial, update_interval),
         )
         await coordinator.async_config_entry_first_refresh()
         runtime.coordinators[account.serial] = coordinator
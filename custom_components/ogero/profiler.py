@@ -0,0 +1,85 @@
+"""On-demand cProfile capture of a login's poll cycles."""
+
+from __future__ import annotations
+
+import cProfile
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import OgeroConfigEntry
+
+
+class OgeroProfiler:
+    """
+    Profile the next few refresh cycles of one login and save the stats.
+
+    The profiler runs from the start of a line's refresh until its entities
+    have been written, so it covers network waits, pyogero parsing, building
+    coordinator data and state writes. Refreshes of several lines that
+    overlap are profiled together and count as one cycle.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: OgeroConfigEntry, path: str, cycles: int
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry = entry
+        self.path = path
+        self._remaining = cycles
+        self._profile = cProfile.Profile()
+        self._active: set[str] = set()
+
+    @callback
+    def async_start_cycle(self, line: str) -> None:
+        """Start profiling when the first line of a cycle begins refreshing."""
+        if not self._active:
+            try:
+                self._profile.enable()
+            except ValueError as err:
+                # Another profiler (for example Home Assistant's) is running.
+                LOGGER.warning("Cannot profile Ogero refreshes: %s", err)
+                self._detach()
+                return
+        self._active.add(line)
+
+    @callback
+    def async_end_cycle(self, line: str) -> None:
+        """Stop when the last line is done; save after the final cycle."""
+        if line not in self._active:
+            return
+        self._active.discard(line)
+        if self._active:
+            return
+        self._profile.disable()
+        self._remaining -= 1
+        if self._remaining > 0:
+            return
+        self._detach()
+        self._entry.async_create_background_task(
+            self._hass, self._async_save(), f"ogero profile {self.path}"
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop without saving (the login is unloading)."""
+        if self._active:
+            self._profile.disable()
+            self._active.clear()
+        self._detach()
+
+    def _detach(self) -> None:
+        """Stop receiving cycles from the login's coordinators."""
+        runtime = self._entry.runtime_data
+        if runtime is not None and runtime.profiler is self:
+            runtime.profiler = None
+
+    async def _async_save(self) -> None:
+        await self._hass.async_add_executor_job(self._profile.dump_stats, self.path)
+        LOGGER.info("Saved Ogero refresh profile to %s", self.path)
@@ -0,0 +1,110 @@
+"""Time-of-day polling rules such as "08:00-20:00=30m; *=6h"."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import MAX_SCAN_INTERVAL, MIN_SCAN_INTERVAL
+
+_RULE_RE = re.compile(
+    r"^(?:(?P<start>\d{1,2}:\d{2})\s*[-\u2013]\s*(?P<end>\d{1,2}:\d{2})|(?P<any>\*))"
+    r"\s*=\s*(?P<value>\d+)\s*(?P<unit>[mh])$",
+    re.IGNORECASE,
+)
+_UNITS = {"m": "minutes", "h": "hours"}
+
+
+def _parse_time(raw: str) -> time:
+    hour, minute = (int(part) for part in raw.split(":"))
+    try:
+        return time(hour, minute)
+    except ValueError as exception:
+        msg = f"Invalid time of day: {raw}"
+        raise ValueError(msg) from exception
+
+
+@dataclass(frozen=True, slots=True)
+class PollWindow:
+    """Poll interval that applies between two local times of day."""
+
+    start: time
+    end: time
+    interval: timedelta
+
+    def contains(self, moment: time) -> bool:
+        """Return whether a local time falls in this window (end exclusive)."""
+        if self.start < self.end:
+            return self.start <= moment < self.end
+        # The window wraps past midnight, e.g. 22:00-06:00.
+        return moment >= self.start or moment < self.end
+
+
+@dataclass(frozen=True, slots=True)
+class PollSchedule:
+    """Time windows with their own poll interval, plus an optional fallback."""
+
+    windows: tuple[PollWindow, ...]
+    default: timedelta | None = None
+
+    @classmethod
+    def parse(cls, text: str) -> PollSchedule:
+        """
+        Parse rules separated by ";" or new lines.
+
+        Each rule is ``HH:MM-HH:MM=<n>m|h``; ``*=<n>m|h`` sets the interval
+        outside every window. The first matching window wins. Raises
+        ValueError for malformed rules or intervals outside the allowed range.
+        """
+        windows: list[PollWindow] = []
+        default: timedelta | None = None
+        for raw_rule in re.split(r"[;\n]", text):
+            rule = raw_rule.strip()
+            if not rule:
+                continue
+            match = _RULE_RE.match(rule)
+            if match is None:
+                msg = f"Invalid poll schedule rule: {rule}"
+                raise ValueError(msg)
+            interval = timedelta(**{_UNITS[match["unit"].lower()]: int(match["value"])})
+            if not MIN_SCAN_INTERVAL <= interval <= MAX_SCAN_INTERVAL:
+                msg = f"Poll interval out of range: {rule}"
+                raise ValueError(msg)
+            if match["any"]:
+                if default is not None:
+                    msg = "Poll schedule has more than one '*' rule"
+                    raise ValueError(msg)
+                default = interval
+                continue
+            start = _parse_time(match["start"])
+            end = _parse_time(match["end"])
+            if start == end:
+                msg = f"Poll window is empty: {rule}"
+                raise ValueError(msg)
+            windows.append(PollWindow(start, end, interval))
+        if not windows and default is None:
+            msg = "Poll schedule has no rules"
+            raise ValueError(msg)
+        return cls(tuple(windows), default)
+
+    def interval_at(self, moment: datetime) -> timedelta | None:
+        """Return the interval for a moment, or None to use the configured one."""
+        local = dt_util.as_local(moment).time()
+        for window in self.windows:
+            if window.contains(local):
+                return window.interval
+        return self.default
+
+    def boundaries_after(self, moment: datetime) -> list[datetime]:
+        """Return the window starts and ends within the next day, in order."""
+        local = dt_util.as_local(moment)
+        edges = {edge for window in self.windows for edge in (window.start, window.end)}
+        boundaries = [
+            datetime.combine(local.date() + timedelta(days=day), edge, local.tzinfo)
+            for day in (0, 1)
+            for edge in edges
+        ]
+        return sorted(boundary for boundary in boundaries if boundary > local)
@@ -0,0 +1,266 @@
+"""Adaptive poll scheduling for Ogero lines."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import pairwise
+from statistics import median
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CADENCE_GRACE,
+    CADENCE_MAX_SAMPLES,
+    CADENCE_MIN_INTERVALS,
+    CONF_MAX_DATA_AGE,
+    ENDPOINT_DUE_SLACK,
+    MAX_DATA_AGE_HOURS,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    OUTAGE_BACKOFF_MAX,
+    OUTAGE_MIN_LINES,
+    PRIORITY_NORMAL,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from datetime import datetime
+
+    from .schedule import PollSchedule
+
+
+def retry_backoff(failures: int, maximum: timedelta = RETRY_BACKOFF_MAX) -> timedelta:
+    """Return the exponential retry delay after consecutive failures."""
+    exponent = min(max(0, failures - 1), 16)
+    return min(RETRY_BACKOFF_BASE * 2**exponent, maximum)
+
+
+def get_max_data_age(options: Mapping[str, Any]) -> timedelta | None:
+    """Return how old cached data may get before it is hidden, or None."""
+    try:
+        hours = int(options.get(CONF_MAX_DATA_AGE, 0))
+    except TypeError, ValueError:
+        return None
+    if hours <= 0:
+        return None
+    return timedelta(hours=min(hours, MAX_DATA_AGE_HOURS))
+
+
+@dataclass(eq=False)
+class EndpointState[T]:
+    """Newest result and retry state for one Ogero endpoint of a line."""
+
+    result: T | None = None
+    fetched_at: datetime | None = None
+    next_attempt: datetime | None = None
+    failures: int = 0
+    error: Exception | None = None
+
+    def is_due(self, now: datetime) -> bool:
+        """Return whether this endpoint should be fetched now."""
+        return (
+            self.next_attempt is None or now + ENDPOINT_DUE_SLACK >= self.next_attempt
+        )
+
+    def record_success(self, result: T, now: datetime) -> None:
+        """Store a fresh result and clear the retry state."""
+        self.result = result
+        self.fetched_at = now
+        self.failures = 0
+        self.error = None
+
+    def record_failure(self, error: Exception, now: datetime) -> None:
+        """Keep the cached result and back off before the next attempt."""
+        self.failures += 1
+        self.error = error
+        self.next_attempt = now + retry_backoff(self.failures)
+
+
+class PortalOutage:
+    """
+    Backoff shared by every line while the Ogero portal cannot be reached.
+
+    Without it, each endpoint of each line keeps retrying on its own during a
+    long outage. A connection failure opens the outage at once; other
+    communication errors only do once calls for OUTAGE_MIN_LINES different
+    lines have failed, so one line's broken page is left to that line's own
+    backoff. While the outage is open, lines wait for one shared probe,
+    backed off exponentially up to the probing line's poll interval (and
+    never beyond OUTAGE_BACKOFF_MAX). Any answer from the portal ends the
+    outage and wakes every line that was held back.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.failures = 0
+        self.since: datetime | None = None
+        self.retry_at: datetime | None = None
+        self._failing_lines: set[str] = set()
+        self._waiters: set[Callable[[], None]] = set()
+
+    def try_acquire(self, now: datetime, interval: timedelta) -> bool:
+        """
+        Return whether a request may go out now.
+
+        During an outage, the first request after the retry time probes the
+        portal; the retry time moves on right away, so everyone else waits
+        for the next one even if the probe never reports back.
+        """
+        if self.retry_at is None:
+            return True
+        if now + ENDPOINT_DUE_SLACK < self.retry_at:
+            return False
+        self.retry_at = now + self._backoff(self.failures + 1, interval)
+        return True
+
+    def record_failure(
+        self, now: datetime, line: str, interval: timedelta, *, connection: bool
+    ) -> None:
+        """Count a communication error and push the shared retry out."""
+        if self.retry_at is None and not connection:
+            self._failing_lines.add(line)
+            if len(self._failing_lines) < OUTAGE_MIN_LINES:
+                return
+        self.failures += 1
+        if self.since is None:
+            self.since = now
+        self.retry_at = now + self._backoff(self.failures, interval)
+
+    def record_success(self) -> None:
+        """End the outage and wake the lines that waited for it."""
+        self._failing_lines.clear()
+        if self.retry_at is None:
+            return
+        self.failures = 0
+        self.since = None
+        self.retry_at = None
+        waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            waiter()
+
+    def add_waiter(self, waiter: Callable[[], None]) -> None:
+        """Call waiter once the outage ends."""
+        self._waiters.add(waiter)
+
+    def remove_waiter(self, waiter: Callable[[], None]) -> None:
+        """Stop waiting for the outage to end."""
+        self._waiters.discard(waiter)
+
+    @staticmethod
+    def _backoff(failures: int, interval: timedelta) -> timedelta:
+        return min(retry_backoff(failures, OUTAGE_BACKOFF_MAX), interval)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the outage state for diagnostics."""
+        return {
+            "failures": self.failures,
+            "since": self.since,
+            "retry_at": self.retry_at,
+            "failing_lines": sorted(self._failing_lines),
+            "waiting": len(self._waiters),
+        }
+
+
+class UpstreamCadence:
+    """Learn how often Ogero refreshes a line from observed last_update values."""
+
+    def __init__(self, max_samples: int = CADENCE_MAX_SAMPLES) -> None:
+        """Initialize."""
+        self._updates: deque[datetime] = deque(maxlen=max_samples)
+
+    def observe(self, last_update: datetime | None) -> bool:
+        """Record an upstream timestamp; return True when it is new."""
+        if last_update is None:
+            return False
+        last_update = dt_util.as_utc(last_update)
+        if self._updates and last_update <= self._updates[-1]:
+            return False
+        self._updates.append(last_update)
+        return True
+
+    @property
+    def last_update(self) -> datetime | None:
+        """Return the newest upstream timestamp seen."""
+        return self._updates[-1] if self._updates else None
+
+    @property
+    def period(self) -> timedelta | None:
+        """Return the median gap between upstream refreshes, once learned."""
+        if len(self._updates) <= CADENCE_MIN_INTERVALS:
+            return None
+        gaps = [(later - earlier) for earlier, later in pairwise(self._updates)]
+        return median(gaps)
+
+    @property
+    def expected_next(self) -> datetime | None:
+        """Return when Ogero is expected to publish the next refresh."""
+        period = self.period
+        last_update = self.last_update
+        if period is None or last_update is None:
+            return None
+        return last_update + period
+
+
+class PollScheduler:
+    """Decide when a line should be polled next."""
+
+    def __init__(
+        self,
+        interval: timedelta,
+        *,
+        adaptive: bool = True,
+        priority: str = PRIORITY_NORMAL,
+        schedule: PollSchedule | None = None,
+    ) -> None:
+        """Initialize."""
+        self.interval = interval
+        self.adaptive = adaptive
+        self.priority = priority
+        self.schedule = schedule
+        self.cadence = UpstreamCadence()
+
+    def current_interval(self, now: datetime) -> timedelta:
+        """Return the interval the time-of-day schedule sets for now."""
+        if self.schedule is not None:
+            interval = self.schedule.interval_at(now)
+            if interval is not None:
+                return interval
+        return self.interval
+
+    def next_delay(self, now: datetime) -> timedelta:
+        """
+        Return the delay until the next poll.
+
+        Without a learned cadence this is the current interval. Once the
+        upstream period is known and longer than the interval, the next poll is
+        placed just after the expected upstream refresh; if Ogero is late, polls
+        fall back to the interval until new data appears. A quiet-hours delay is
+        cut short when a window with a shorter interval starts first.
+        """
+        interval = self.current_interval(now)
+        delay = self._cadence_delay(now, interval)
+        if self.schedule is None:
+            return delay
+        for boundary in self.schedule.boundaries_after(now):
+            if boundary - now >= delay:
+                break
+            if self.current_interval(boundary) < interval:
+                return boundary - now
+        return delay
+
+    def _cadence_delay(self, now: datetime, interval: timedelta) -> timedelta:
+        if not self.adaptive:
+            return interval
+        period = self.cadence.period
+        expected_next = self.cadence.expected_next
+        if period is None or expected_next is None or period <= interval:
+            return interval
+        target = expected_next + CADENCE_GRACE
+        if target <= now:
+            return interval
+        return max(MIN_SCAN_INTERVAL, min(target - now, MAX_SCAN_INTERVAL))
@@ -2,26 +2,31 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorEntityDescription,
 )
 from homeassistant.components.sensor.const import SensorDeviceClass
+from homeassistant.const import PERCENTAGE
 from homeassistant.helpers.entity import EntityCategory
 
-from .entity import OgeroEntity
+from .entity import OgeroEntity, OgeroLoginEntity
 
 PARALLEL_UPDATES = 0
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+    from .aggregate import OgeroLoginTotals
     from .api import Account
-    from .coordinator import OgeroDataUpdateCoordinator
+    from .coordinator import OgeroCoordinatorData, OgeroDataUpdateCoordinator
     from .data import OgeroConfigEntry
 
 OgeroSensorValue = int | float | str | datetime | None
@@ -32,45 +37,175 @@ EXTRA_CONSUMPTION = "extra_consumption"
 QUOTA = "quota"
 LAST_UPDATE = "last_update"
 OUTSTANDING_BALANCE = "outstanding_balance"
+USAGE_PERCENT = "usage_percent"
+USAGE_TODAY = "usage_today"
+USAGE_LAST_24H = "usage_last_24h"
+AVERAGE_DAILY_USAGE = "average_daily_usage"
+FORECAST_CONSUMPTION = "forecast_consumption"
+FORECAST_EXTRA_CONSUMPTION = "forecast_extra_consumption"
+DATA_FETCHED = "data_fetched"
+
+TOTAL_OUTSTANDING_BALANCE = "total_outstanding_balance"
+LOGIN_TOTAL_CONSUMPTION = "login_total_consumption"
+LINES_OVER_QUOTA = "lines_over_quota"
+LINES_WITH_UNPAID_BILLS = "lines_with_unpaid_bills"
+
+ATTR_UNPAID_BILLS = "unpaid_bills"
+
+
+def _no_attributes(_data: OgeroCoordinatorData) -> None:
+    return None
+
+
+def _unpaid_bills_attributes(
+    data: OgeroCoordinatorData,
+) -> dict[str, list[dict[str, str]]] | None:
+    if not data.unpaid_bills:
+        return None
+    return {ATTR_UNPAID_BILLS: [bill.as_dict() for bill in data.unpaid_bills]}
+
 
-ENTITY_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+@dataclass(frozen=True, kw_only=True)
+class OgeroSensorEntityDescription(SensorEntityDescription):  # type: ignore[misc]
+    """Sensor description with its value and attribute accessors."""
+
+    value_fn: Callable[[OgeroCoordinatorData], OgeroSensorValue]
+    attrs_fn: Callable[[OgeroCoordinatorData], dict[str, Any] | None] = _no_attributes
+    # Stay available when the data is older than the maximum data age.
+    available_when_stale: bool = False
+
+
+ENTITY_DESCRIPTIONS: tuple[OgeroSensorEntityDescription, ...] = (
+    OgeroSensorEntityDescription(
         key=QUOTA,
         translation_key=QUOTA,
+        value_fn=lambda data: data.quota,
         native_unit_of_measurement="GB",
         suggested_display_precision=0,
     ),
-    SensorEntityDescription(
+    OgeroSensorEntityDescription(
         key=SPEED,
         translation_key=SPEED,
+        value_fn=lambda data: data.speed,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    SensorEntityDescription(
+    OgeroSensorEntityDescription(
         key=TOTAL_CONSUMPTION,
         translation_key=TOTAL_CONSUMPTION,
+        value_fn=lambda data: data.total_consumption,
+        native_unit_of_measurement="GB",
+        suggested_display_precision=1,
+    ),
+    OgeroSensorEntityDescription(
+        key=USAGE_PERCENT,
+        translation_key=USAGE_PERCENT,
+        value_fn=lambda data: data.usage_percent,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+    ),
+    OgeroSensorEntityDescription(
+        key=USAGE_TODAY,
+        translation_key=USAGE_TODAY,
+        value_fn=lambda data: data.usage_today,
+        native_unit_of_measurement="GB",
+        suggested_display_precision=2,
+    ),
+    OgeroSensorEntityDescription(
+        key=USAGE_LAST_24H,
+        translation_key=USAGE_LAST_24H,
+        value_fn=lambda data: data.usage_last_24h,
+        native_unit_of_measurement="GB",
+        suggested_display_precision=2,
+    ),
+    OgeroSensorEntityDescription(
+        key=AVERAGE_DAILY_USAGE,
+        translation_key=AVERAGE_DAILY_USAGE,
+        value_fn=lambda data: data.average_daily_usage,
+        native_unit_of_measurement="GB/d",
+        suggested_display_precision=2,
+    ),
+    OgeroSensorEntityDescription(
+        key=FORECAST_CONSUMPTION,
+        translation_key=FORECAST_CONSUMPTION,
+        value_fn=lambda data: data.forecast_consumption,
         native_unit_of_measurement="GB",
         suggested_display_precision=1,
     ),
-    SensorEntityDescription(
+    OgeroSensorEntityDescription(
+        key=FORECAST_EXTRA_CONSUMPTION,
+        translation_key=FORECAST_EXTRA_CONSUMPTION,
+        value_fn=lambda data: data.forecast_extra_consumption,
+        native_unit_of_measurement="GB",
+        suggested_display_precision=1,
+    ),
+    OgeroSensorEntityDescription(
         key=EXTRA_CONSUMPTION,
         translation_key=EXTRA_CONSUMPTION,
+        value_fn=lambda data: data.extra_consumption,
         native_unit_of_measurement="GB",
         suggested_display_precision=1,
     ),
-    SensorEntityDescription(
+    OgeroSensorEntityDescription(
         key=LAST_UPDATE,
         translation_key=LAST_UPDATE,
+        value_fn=lambda data: data.last_update,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    SensorEntityDescription(
+    OgeroSensorEntityDescription(
+        key=DATA_FETCHED,
+        translation_key=DATA_FETCHED,
+        value_fn=lambda data: data.data_fetched,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        available_when_stale=True,
+    ),
+    OgeroSensorEntityDescription(
         key=OUTSTANDING_BALANCE,
         translation_key=OUTSTANDING_BALANCE,
+        value_fn=lambda data: data.outstanding_balance,
+        attrs_fn=_unpaid_bills_attributes,
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="LBP",
+        suggested_display_precision=0,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class OgeroLoginSensorEntityDescription(SensorEntityDescription):  # type: ignore[misc]
+    """Login total sensor description with its value accessor."""
+
+    value_fn: Callable[[OgeroLoginTotals], OgeroSensorValue]
+
+
+LOGIN_SENSOR_DESCRIPTIONS: tuple[OgeroLoginSensorEntityDescription, ...] = (
+    OgeroLoginSensorEntityDescription(
+        key=TOTAL_OUTSTANDING_BALANCE,
+        translation_key=TOTAL_OUTSTANDING_BALANCE,
         device_class=SensorDeviceClass.MONETARY,
         native_unit_of_measurement="LBP",
         suggested_display_precision=0,
+        value_fn=lambda totals: totals.outstanding_balance,
+    ),
+    OgeroLoginSensorEntityDescription(
+        key=LOGIN_TOTAL_CONSUMPTION,
+        translation_key=LOGIN_TOTAL_CONSUMPTION,
+        native_unit_of_measurement="GB",
+        suggested_display_precision=1,
+        value_fn=lambda totals: totals.total_consumption,
+    ),
+    OgeroLoginSensorEntityDescription(
+        key=LINES_OVER_QUOTA,
+        translation_key=LINES_OVER_QUOTA,
+        value_fn=lambda totals: totals.lines_over_quota,
+    ),
+    OgeroLoginSensorEntityDescription(
+        key=LINES_WITH_UNPAID_BILLS,
+        translation_key=LINES_WITH_UNPAID_BILLS,
+        value_fn=lambda totals: totals.lines_with_unpaid_bills,
     ),
 )
 
@@ -88,6 +223,10 @@ async def async_setup_entry(
                 for entity_description in ENTITY_DESCRIPTIONS
             ],
         )
+    async_add_entities(
+        OgeroLoginSensor(entry, entity_description)
+        for entity_description in LOGIN_SENSOR_DESCRIPTIONS
+    )
 
 
 class OgeroSensor(
@@ -96,32 +235,62 @@ class OgeroSensor(
 ):
     """Ogero sensor."""
 
-    entity_description: SensorEntityDescription
+    entity_description: OgeroSensorEntityDescription
+    # The bill list is served by the get_bills action; keep it out of history.
+    _unrecorded_attributes = frozenset({ATTR_UNPAID_BILLS})
 
     def __init__(
         self,
         coordinator: OgeroDataUpdateCoordinator,
         account: Account,
-        entity_description: SensorEntityDescription,
+        entity_description: OgeroSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, account, entity_description.key)
         self.entity_description = entity_description
 
+    @property
+    def available(self) -> bool:
+        """Return whether the sensor has data to show."""
+        if self.entity_description.available_when_stale:
+            return self.coordinator.data is not None
+        return super().available
+
     @property
     def native_value(self) -> OgeroSensorValue:
         """Return the native value of the sensor."""
         data = self.coordinator.data
         if data is None:
             return None
-        return cast("OgeroSensorValue", getattr(data, self.entity_description.key))
+        return self.entity_description.value_fn(data)
 
     @property
-    def extra_state_attributes(self) -> dict[str, list[dict[str, str]]] | None:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        if self.entity_description.key != OUTSTANDING_BALANCE:
-            return None
         data = self.coordinator.data
-        if data is None or not data.unpaid_bills:
+        if data is None:
             return None
-        return {"unpaid_bills": data.unpaid_bills}
+        return self.entity_description.attrs_fn(data)
+
+
+class OgeroLoginSensor(
+    OgeroLoginEntity,
+    SensorEntity,  # type: ignore[misc]
+):
+    """Total over every line of an Ogero login."""
+
+    entity_description: OgeroLoginSensorEntityDescription
+
+    def __init__(
+        self,
+        entry: OgeroConfigEntry,
+        entity_description: OgeroLoginSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, entity_description.key)
+        self.entity_description = entity_description
+
+    @property
+    def native_value(self) -> OgeroSensorValue:
+        """Return the login total."""
+        return self.entity_description.value_fn(self._totals)
@@ -0,0 +1,248 @@
+"""Service actions for Ogero."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .bills import OgeroBill
+from .const import DOMAIN, ENDPOINTS, MAX_PROFILE_CYCLES
+from .profiler import OgeroProfiler
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import OgeroDataUpdateCoordinator
+    from .data import OgeroConfigEntry
+
+SERVICE_GET_BILLS = "get_bills"
+SERVICE_GET_DATA = "get_data"
+SERVICE_REFRESH = "refresh"
+SERVICE_PROFILE = "profile"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_LINE = "line"
+ATTR_ENDPOINTS = "endpoints"
+ATTR_CYCLES = "cycles"
+
+LINE_SELECTION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LINE): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+REFRESH_SCHEMA = LINE_SELECTION_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_ENDPOINTS, default=list(ENDPOINTS)): vol.All(
+            cv.ensure_list, [vol.In(ENDPOINTS)]
+        ),
+    }
+)
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+    }
+)
+
+
+def _device_serials(call: ServiceCall, identifier: str) -> set[str]:
+    """Return the lines of a device; a login device stands for all its lines."""
+    entry: OgeroConfigEntry | None = call.hass.config_entries.async_get_entry(
+        identifier
+    )
+    if entry is None or entry.domain != DOMAIN:
+        return {identifier}
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": identifier},
+        )
+    return set(entry.runtime_data.coordinators)
+
+
+def _requested_serials(call: ServiceCall) -> set[str]:
+    """Return line serials named directly or through their devices."""
+    serials = set(call.data.get(ATTR_LINE, []))
+    device_registry = dr.async_get(call.hass)
+    for device_id in call.data.get(ATTR_DEVICE_ID, []):
+        device = device_registry.async_get(device_id)
+        identifiers = (
+            [serial for domain, serial in device.identifiers if domain == DOMAIN]
+            if device
+            else []
+        )
+        if not identifiers:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="device_not_found",
+                translation_placeholders={"device_id": device_id},
+            )
+        for identifier in identifiers:
+            serials.update(_device_serials(call, identifier))
+    return serials
+
+
+def _selected_entries(call: ServiceCall) -> list[OgeroConfigEntry]:
+    """Return loaded entries, narrowed to the requested one."""
+    entries: list[OgeroConfigEntry] = call.hass.config_entries.async_loaded_entries(
+        DOMAIN
+    )
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is not None:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+    return entries
+
+
+def _selected_coordinators(call: ServiceCall) -> list[OgeroDataUpdateCoordinator]:
+    """Return coordinators of loaded entries, narrowed by entry and line."""
+    entries = _selected_entries(call)
+    coordinators = [
+        coordinator
+        for entry in entries
+        for coordinator in entry.runtime_data.coordinators.values()
+    ]
+    serials = _requested_serials(call)
+    if serials:
+        coordinators = [c for c in coordinators if c.account_key in serials]
+        if missing := serials - {c.account_key for c in coordinators}:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="line_not_found",
+                translation_placeholders={"line": ", ".join(sorted(missing))},
+            )
+    return coordinators
+
+
+def _line_bills(coordinator: OgeroDataUpdateCoordinator) -> dict[str, Any]:
+    """Return the cached bill history of a line."""
+    state = coordinator.bills
+    bill_info = state.result
+    return {
+        "account": str(coordinator.account),
+        "outstanding_balance": (
+            int(bill_info.total_outstanding.amount) if bill_info else None
+        ),
+        "bills": (
+            [OgeroBill.from_pyogero(bill).as_dict() for bill in bill_info.bills]
+            if bill_info
+            else []
+        ),
+        "fetched_at": state.fetched_at.isoformat() if state.fetched_at else None,
+    }
+
+
+async def _async_get_bills(call: ServiceCall) -> ServiceResponse:
+    """Return bills from the coordinator cache without calling Ogero."""
+    return {
+        "lines": {
+            coordinator.account_key: _line_bills(coordinator)
+            for coordinator in _selected_coordinators(call)
+        }
+    }
+
+
+async def _async_get_data(call: ServiceCall) -> ServiceResponse:
+    """Return the cached data of each line without calling Ogero."""
+    return {
+        "lines": {
+            coordinator.account_key: {
+                "account": str(coordinator.account),
+                "last_update_success": coordinator.last_update_success,
+                "data": coordinator.data.as_dict() if coordinator.data else None,
+            }
+            for coordinator in _selected_coordinators(call)
+        }
+    }
+
+
+async def _async_refresh(call: ServiceCall) -> None:
+    """Fetch the selected endpoints of the selected lines and wait for them."""
+    coordinators = _selected_coordinators(call)
+    endpoints = call.data[ATTR_ENDPOINTS]
+    await asyncio.gather(
+        *(
+            coordinator.async_refresh_endpoints(endpoints)
+            for coordinator in coordinators
+        )
+    )
+    failed = [
+        coordinator.account_key
+        for coordinator in coordinators
+        if not coordinator.last_update_success
+        or any(coordinator.endpoints[endpoint].error for endpoint in endpoints)
+    ]
+    if failed:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="refresh_failed",
+            translation_placeholders={"lines": ", ".join(failed)},
+        )
+
+
+async def _async_profile(call: ServiceCall) -> ServiceResponse:
+    """Arm a cProfile capture of the next refresh cycles of a login."""
+    (entry,) = _selected_entries(call)
+    runtime = entry.runtime_data
+    if runtime.profiler is not None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="profile_in_progress",
+            translation_placeholders={"path": runtime.profiler.path},
+        )
+    path = call.hass.config.path(
+        f"{DOMAIN}_profile_{entry.entry_id}_{dt_util.utcnow():%Y%m%d%H%M%S}.prof"
+    )
+    runtime.profiler = OgeroProfiler(call.hass, entry, path, call.data[ATTR_CYCLES])
+    return {"path": path}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register Ogero service actions."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_BILLS,
+        _async_get_bills,
+        schema=LINE_SELECTION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DATA,
+        _async_get_data,
+        schema=LINE_SELECTION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        _async_refresh,
+        schema=REFRESH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,189 @@
+"""
+On-disk Ogero results shared by Home Assistant instances with the same login.
+
+Instances that point at the same directory (on one host or a shared volume)
+read and write one JSON file per login, under an exclusive file lock. An
+instance that finds a recent enough result uses it; otherwise it takes a
+short lease on that line's endpoint, fetches it and stores the result, while
+the other instances wait for the lease.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import secrets
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cassette import (
+    bill_info_from_dict,
+    bill_info_to_dict,
+    consumption_from_dict,
+    consumption_to_dict,
+)
+from .const import (
+    CONF_SHARED_CACHE,
+    ENDPOINT_BILLS,
+    ENDPOINT_CONSUMPTION,
+    LOGGER,
+    SHARED_CACHE_LEASE,
+    SHARED_CACHE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from homeassistant.core import HomeAssistant
+
+    from .data import OgeroConfigEntry
+
+_CODECS: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    ENDPOINT_CONSUMPTION: (consumption_to_dict, consumption_from_dict),
+    ENDPOINT_BILLS: (bill_info_to_dict, bill_info_from_dict),
+}
+
+
+def _parse_time(raw: str | None) -> datetime | None:
+    return datetime.fromisoformat(raw) if raw else None
+
+
+@dataclass(frozen=True, slots=True)
+class SharedLookup:
+    """
+    Outcome of looking up one endpoint of a line.
+
+    Either a result another instance fetched recently, a claim to fetch it
+    here, or neither: another instance is fetching it until retry_at.
+    """
+
+    result: Any = None
+    fetched_at: datetime | None = None
+    claimed: bool = False
+    retry_at: datetime | None = None
+
+
+class SharedResponseCache:
+    """Results of one login, shared through a locked JSON file."""
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.path = path
+        self._lock_path = path.with_name(f"{path.name}.lock")
+        # Leases name their owner so an instance can renew its own.
+        self._owner = secrets.token_hex(8)
+
+    async def async_lookup(
+        self, line: str, endpoint: str, now: datetime, not_before: datetime
+    ) -> SharedLookup:
+        """Return a result fetched since not_before, or whether to fetch here."""
+        try:
+            return await self._hass.async_add_executor_job(
+                self._lookup, line, endpoint, now, not_before
+            )
+        except (OSError, ValueError) as err:
+            LOGGER.warning("Cannot read the shared Ogero cache %s: %s", self.path, err)
+            return SharedLookup(claimed=True)
+
+    async def async_store(
+        self, line: str, endpoint: str, result: Any, now: datetime
+    ) -> None:
+        """Save a fetched result and end this instance's lease."""
+        encode = _CODECS[endpoint][0]
+        try:
+            await self._hass.async_add_executor_job(
+                self._store, line, endpoint, encode(result), now
+            )
+        except (OSError, ValueError) as err:
+            LOGGER.warning("Cannot write the shared Ogero cache %s: %s", self.path, err)
+
+    async def async_release(self, line: str, endpoint: str) -> None:
+        """End this instance's lease without a result (the fetch failed)."""
+        try:
+            await self._hass.async_add_executor_job(self._release, line, endpoint)
+        except (OSError, ValueError) as err:
+            LOGGER.warning("Cannot write the shared Ogero cache %s: %s", self.path, err)
+
+    def _lookup(
+        self, line: str, endpoint: str, now: datetime, not_before: datetime
+    ) -> SharedLookup:
+        with self._locked() as data:
+            entry = data["lines"].setdefault(line, {}).setdefault(endpoint, {})
+            fetched_at = _parse_time(entry.get("fetched_at"))
+            if fetched_at is not None and fetched_at >= not_before:
+                decode = _CODECS[endpoint][1]
+                return SharedLookup(decode(entry["result"]), fetched_at)
+            lease_until = _parse_time(entry.get("lease_until"))
+            if (
+                lease_until is not None
+                and lease_until > now
+                and entry.get("lease_owner") != self._owner
+            ):
+                return SharedLookup(retry_at=lease_until)
+            entry["lease_owner"] = self._owner
+            entry["lease_until"] = (now + SHARED_CACHE_LEASE).isoformat()
+            self._write(data)
+            return SharedLookup(claimed=True)
+
+    def _store(self, line: str, endpoint: str, result: Any, now: datetime) -> None:
+        with self._locked() as data:
+            data["lines"].setdefault(line, {})[endpoint] = {
+                "fetched_at": now.isoformat(),
+                "result": result,
+            }
+            self._write(data)
+
+    def _release(self, line: str, endpoint: str) -> None:
+        with self._locked() as data:
+            entry = data["lines"].get(line, {}).get(endpoint)
+            if entry is None or entry.get("lease_owner") != self._owner:
+                return
+            entry.pop("lease_owner", None)
+            entry.pop("lease_until", None)
+            self._write(data)
+
+    @contextmanager
+    def _locked(self) -> Iterator[dict[str, Any]]:
+        """Hold the login's file lock and yield the current file contents."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock_path.open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield self._read()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            data = None
+        except ValueError:
+            LOGGER.warning("Starting over from a corrupt shared cache %s", self.path)
+            data = None
+        if not isinstance(data, dict) or data.get("version") != SHARED_CACHE_VERSION:
+            return {"version": SHARED_CACHE_VERSION, "lines": {}}
+        return data
+
+    def _write(self, data: dict[str, Any]) -> None:
+        # Replace the file in one step so a crash never leaves half of it.
+        temporary = self.path.with_name(f"{self.path.name}.{self._owner}.tmp")
+        temporary.write_text(json.dumps(data), encoding="utf-8")
+        temporary.replace(self.path)
+
+
+def create_shared_cache(
+    hass: HomeAssistant, entry: OgeroConfigEntry
+) -> SharedResponseCache | None:
+    """Return the shared cache of a login, or None when it is off."""
+    directory = str(entry.options.get(CONF_SHARED_CACHE) or "").strip()
+    if not directory:
+        return None
+    # Relative directories are inside the configuration folder.
+    return SharedResponseCache(
+        hass, Path(hass.config.path(directory)) / f"ogero_{entry.unique_id}.json"
+    )
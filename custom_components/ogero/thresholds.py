@@ -0,0 +1,47 @@
+"""Quota usage thresholds that fire events when a line crosses them."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import CONF_QUOTA_THRESHOLDS, DEFAULT_QUOTA_THRESHOLDS, MAX_QUOTA_THRESHOLD
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def parse_quota_thresholds(raw: Any) -> tuple[int, ...]:
+    """
+    Parse thresholds given as a list or a comma-separated string of percents.
+
+    Returns them sorted and de-duplicated. Raises ValueError for anything that
+    is not a whole percent between 1 and MAX_QUOTA_THRESHOLD.
+    """
+    items = raw.split(",") if isinstance(raw, str) else raw
+    thresholds: set[int] = set()
+    for item in items:
+        text = str(item).strip().removesuffix("%").strip()
+        if not text:
+            continue
+        if not text.isdigit() or not 1 <= int(text) <= MAX_QUOTA_THRESHOLD:
+            msg = f"Invalid quota threshold: {item}"
+            raise ValueError(msg)
+        thresholds.add(int(text))
+    return tuple(sorted(thresholds))
+
+
+def get_quota_thresholds(options: Mapping[str, Any]) -> tuple[int, ...]:
+    """Return configured thresholds, or the defaults when unset or invalid."""
+    if CONF_QUOTA_THRESHOLDS not in options:
+        return DEFAULT_QUOTA_THRESHOLDS
+    try:
+        return parse_quota_thresholds(options[CONF_QUOTA_THRESHOLDS])
+    except TypeError, ValueError:
+        return DEFAULT_QUOTA_THRESHOLDS
+
+
+def reached_threshold(thresholds: tuple[int, ...], usage_percent: float | None) -> int:
+    """Return the highest threshold at or below the usage, or 0."""
+    if usage_percent is None:
+        return 0
+    return max((t for t in thresholds if usage_percent >= t), default=0)
@@ -0,0 +1,114 @@
+"""Bounded timeline of recent poll attempts for diagnostics."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .const import POLL_TIMELINE_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+    from types import SimpleNamespace
+
+# Byte counter of the request being made in the current task, if any.
+_received_bytes: ContextVar[list[int] | None] = ContextVar(
+    "ogero_received_bytes", default=None
+)
+
+
+async def _on_response_chunk_received(
+    _session: aiohttp.ClientSession,
+    _context: SimpleNamespace,
+    params: aiohttp.TraceResponseChunkReceivedParams,
+) -> None:
+    if (counter := _received_bytes.get()) is not None:
+        counter[0] += len(params.chunk)
+
+
+def received_bytes_trace_config() -> aiohttp.TraceConfig:
+    """Return a trace config that feeds count_received_bytes()."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+    return trace_config
+
+
+@contextmanager
+def count_received_bytes() -> Iterator[list[int]]:
+    """Count response body bytes received by this task; read counter[0]."""
+    counter = [0]
+    token = _received_bytes.set(counter)
+    try:
+        yield counter
+    finally:
+        _received_bytes.reset(token)
+
+
+@dataclass(slots=True)
+class EndpointAttempt:
+    """One endpoint call made during a poll."""
+
+    endpoint: str
+    duration: float
+    bytes_received: int
+    result: str
+    retry: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready mapping."""
+        return {
+            "endpoint": self.endpoint,
+            "duration_ms": round(self.duration * 1000, 1),
+            "bytes_received": self.bytes_received,
+            "result": self.result,
+            "retry": self.retry,
+        }
+
+
+@dataclass(slots=True)
+class PollAttempt:
+    """One coordinator update: the endpoints it called and how it ended."""
+
+    started: datetime
+    endpoints: list[EndpointAttempt] = field(default_factory=list)
+    duration: float | None = None
+    result: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready mapping."""
+        return {
+            "started": self.started.isoformat(),
+            "duration_ms": (
+                round(self.duration * 1000, 1) if self.duration is not None else None
+            ),
+            "result": self.result,
+            "endpoints": [endpoint.as_dict() for endpoint in self.endpoints],
+        }
+
+
+class PollTimeline:
+    """The last few poll attempts of a line, oldest first."""
+
+    def __init__(self, size: int = POLL_TIMELINE_SIZE) -> None:
+        """Initialize."""
+        self._attempts: deque[PollAttempt] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return how many attempts are kept."""
+        return len(self._attempts)
+
+    def record(self, attempt: PollAttempt, duration: float, result: str) -> None:
+        """Finish an attempt and keep it, dropping the oldest when full."""
+        attempt.duration = duration
+        attempt.result = result
+        self._attempts.append(attempt)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the attempts for diagnostics."""
+        return [attempt.as_dict() for attempt in self._attempts]
@@ -0,0 +1,184 @@
+"""Optional nested tracing spans for setup and refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from .const import (
+    CONF_TRACE_EXPORT,
+    TRACE_COLLECTOR_SIZE,
+    TRACE_EXPORT_FILE,
+    TRACE_EXPORT_MEMORY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from homeassistant.core import HomeAssistant
+
+_current_span: ContextVar[Span | None] = ContextVar("ogero_span", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed step; spans opened inside it become its children."""
+
+    name: str
+    trace_id: str
+    parent_id: str | None
+    start: float
+    tags: dict[str, Any]
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    duration: float | None = None
+    outcome: str | None = None
+    root: Span | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def trace_ended(self) -> bool:
+        """Whether the root span of this span's trace has already ended."""
+        return self.root is not None and self.root.duration is not None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready mapping."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": (
+                round(self.duration * 1000, 3) if self.duration is not None else None
+            ),
+            "outcome": self.outcome,
+            "tags": self.tags,
+        }
+
+
+class SpanExporter(Protocol):
+    """Receives every finished span."""
+
+    def export(self, span: Span) -> None:
+        """Handle a finished span; must not block the event loop."""
+
+
+class InMemoryCollector:
+    """Keep the most recent finished spans (a stand-in for a collector)."""
+
+    def __init__(self, size: int = TRACE_COLLECTOR_SIZE) -> None:
+        """Initialize."""
+        self._spans: deque[Span] = deque(maxlen=size)
+
+    def export(self, span: Span) -> None:
+        """Keep a finished span."""
+        self._spans.append(span)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the kept spans, oldest first."""
+        return [span.as_dict() for span in self._spans]
+
+
+class JsonLinesExporter:
+    """
+    Append finished spans to a JSON lines file, one write per trace.
+
+    Spans are buffered per trace until its root span ends. Writes run in the
+    executor one at a time, in the order the traces ended, so the lines of
+    concurrent traces never interleave. A span that outlives its root (work
+    started inside the trace that finishes after it) is written on its own.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.path = path
+        self._pending: dict[str, list[str]] = {}
+        self._write_lock = asyncio.Lock()
+
+    def export(self, span: Span) -> None:
+        """Buffer a span; write its trace once the root span ends."""
+        line = json.dumps(span.as_dict(), default=str)
+        if span.trace_ended:
+            # The trace was written already; buffering would keep it forever.
+            self._hass.async_create_task(self._async_write([line]))
+            return
+        lines = self._pending.setdefault(span.trace_id, [])
+        lines.append(line)
+        if span.parent_id is None:
+            del self._pending[span.trace_id]
+            self._hass.async_create_task(self._async_write(lines))
+
+    async def _async_write(self, lines: list[str]) -> None:
+        async with self._write_lock:
+            await self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        with Path(self.path).open("a", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in lines)
+
+
+class OgeroTracer:
+    """Open spans for one login; does nothing without an exporter."""
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        """Initialize."""
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, **tags: Any) -> Iterator[Span | None]:
+        """
+        Time the enclosed block as a child of the current span.
+
+        The outcome is "ok" or the name of the exception that left the block.
+        A span whose parent already ended (for example a refresh scheduled
+        from inside an earlier one) starts a new trace.
+        """
+        if self.exporter is None:
+            yield None
+            return
+        parent = _current_span.get()
+        if parent is not None and parent.duration is not None:
+            parent = None
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            tags=tags,
+            root=(parent.root or parent) if parent else None,
+        )
+        started = time.perf_counter()
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as err:
+            span.outcome = type(err).__name__
+            raise
+        else:
+            span.outcome = span.outcome or "ok"
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+            self.exporter.export(span)
+
+
+def create_tracer(
+    hass: HomeAssistant, entry_id: str, options: Mapping[str, Any]
+) -> OgeroTracer:
+    """Return a tracer for the export chosen in the login options."""
+    export = options.get(CONF_TRACE_EXPORT)
+    if export == TRACE_EXPORT_FILE:
+        return OgeroTracer(
+            JsonLinesExporter(hass, hass.config.path(f"ogero_traces_{entry_id}.jsonl"))
+        )
+    if export == TRACE_EXPORT_MEMORY:
+        return OgeroTracer(InMemoryCollector())
+    return OgeroTracer()
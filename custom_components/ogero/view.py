@@ -0,0 +1,41 @@
+"""HTTP view exposing Ogero metrics to Prometheus."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .data import get_domain_data
+from .metrics import CONTENT_TYPE
+
+if TYPE_CHECKING:
+    from .data import OgeroConfigEntry
+
+
+class OgeroMetricsView(HomeAssistantView):  # type: ignore[misc]
+    """Serve Ogero counters and per-line state in the Prometheus text format."""
+
+    url = "/api/ogero/metrics"
+    name = "api:ogero:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Format the current metrics; never contacts Ogero."""
+        hass = request.app[KEY_HASS]
+        entries: list[OgeroConfigEntry] = hass.config_entries.async_loaded_entries(
+            DOMAIN
+        )
+        domain_data = get_domain_data(hass)
+        body = domain_data.metrics.render(
+            (
+                coordinator
+                for entry in entries
+                for coordinator in entry.runtime_data.coordinators.values()
+            ),
+            domain_data.outage,
+            dt_util.utcnow(),
+        )
+        return web.Response(body=body.encode(), headers={"Content-Type": CONTENT_TYPE})
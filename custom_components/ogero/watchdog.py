@@ -0,0 +1,134 @@
+"""Opt-in measurement of time Ogero work spends blocking the event loop."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from .const import CONF_LOOP_WATCHDOG_THRESHOLD, LOGGER, MAX_LOOP_WATCHDOG_THRESHOLD
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Generator, Mapping
+
+
+def get_loop_watchdog_threshold(options: Mapping[str, Any]) -> float | None:
+    """Return the warning threshold in seconds, or None when it is off."""
+    try:
+        milliseconds = int(options.get(CONF_LOOP_WATCHDOG_THRESHOLD, 0))
+    except TypeError, ValueError:
+        return None
+    if milliseconds <= 0:
+        return None
+    return min(milliseconds, MAX_LOOP_WATCHDOG_THRESHOLD) / 1000
+
+
+@dataclass(slots=True)
+class PhaseCounters:
+    """Blocking time seen in one phase of a line's polls."""
+
+    calls: int = 0
+    blocked_total: float = 0.0
+    blocked_max: float = 0.0
+    over_threshold: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready mapping."""
+        return {
+            "calls": self.calls,
+            "blocked_total_ms": round(self.blocked_total * 1000, 1),
+            "blocked_max_ms": round(self.blocked_max * 1000, 1),
+            "over_threshold": self.over_threshold,
+        }
+
+
+class LoopWatchdog:
+    """
+    Time the synchronous steps of a line's coroutines.
+
+    A coroutine only blocks the loop between two awaits that suspend it, so
+    each resume of the wrapped coroutine is timed on its own. The longest
+    step of a call is compared with the threshold; waiting on the network is
+    never counted.
+    """
+
+    def __init__(
+        self,
+        line: str,
+        threshold: float,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize."""
+        self._line = line
+        self.threshold = threshold
+        self.phases: dict[str, PhaseCounters] = {}
+        self._clock = clock
+
+    async def async_track[T](self, phase: str, coro: Coroutine[Any, Any, T]) -> T:
+        """Await coro, recording how long its steps held the loop."""
+        return await _TimedCoroutine(self, phase, coro, self._clock)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the settings and counters for diagnostics."""
+        return {
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "phases": {name: c.as_dict() for name, c in self.phases.items()},
+        }
+
+    def _record(self, phase: str, total: float, longest: float) -> None:
+        counters = self.phases.setdefault(phase, PhaseCounters())
+        counters.calls += 1
+        counters.blocked_total += total
+        counters.blocked_max = max(counters.blocked_max, longest)
+        if longest >= self.threshold:
+            counters.over_threshold += 1
+            LOGGER.warning(
+                "Ogero %s for %s blocked the event loop for %.0f ms (%.0f ms in total)",
+                phase,
+                self._line,
+                longest * 1000,
+                total * 1000,
+            )
+
+
+class _TimedCoroutine[T]:
+    """Drive a coroutine step by step, timing each step."""
+
+    def __init__(
+        self,
+        watchdog: LoopWatchdog,
+        phase: str,
+        coro: Coroutine[Any, Any, T],
+        clock: Callable[[], float],
+    ) -> None:
+        self._watchdog = watchdog
+        self._phase = phase
+        self._coro = coro
+        self._clock = clock
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        coro = self._coro
+        clock = self._clock
+        total = longest = 0.0
+        value: Any = None
+        error: BaseException | None = None
+        try:
+            while True:
+                started = clock()
+                try:
+                    yielded = coro.send(value) if error is None else coro.throw(error)
+                except StopIteration as stop:
+                    return cast("T", stop.value)
+                finally:
+                    step = clock() - started
+                    total += step
+                    longest = max(longest, step)
+                try:
+                    value, error = (yield yielded), None
+                except GeneratorExit:
+                    coro.close()
+                    raise
+                except BaseException as err:  # noqa: BLE001
+                    value, error = None, err
+        finally:
+            self._watchdog._record(self._phase, total, longest)  # noqa: SLF001
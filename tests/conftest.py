@@ -16,8 +16,8 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.ogero.api import Account
 from custom_components.ogero.const import CONFIG_ENTRY_VERSION, DOMAIN
 from custom_components.ogero.coordinator import (
-    OgeroCoordinatorData,
     OgeroDataUpdateCoordinator,
+    build_coordinator_data,
 )
 
 pytest_plugins = ("pytest_homeassistant_custom_component",)
@@ -59,43 +59,13 @@ def consumption_info() -> ConsumptionInfo:
     )
 
 
-def _coordinator_data(
-    consumption_info: ConsumptionInfo,
-    bill_info: BillInfo,
-) -> OgeroCoordinatorData:
-    """Build coordinator data matching production mapping."""
-    unpaid_bills = [
-        {
-            "period": bill.date.strftime("%Y-%m"),
-            "amount": f"{bill.amount.currency} {int(bill.amount.amount)}",
-            "status": bill.status.name,
-        }
-        for bill in bill_info.bills
-        if bill.status == BillStatus.UNPAID
-    ]
-    extra_consumption = consumption_info.extra_consumption
-    return OgeroCoordinatorData(
-        quota=consumption_info.quota,
-        last_update=consumption_info.last_update,
-        speed=consumption_info.speed,
-        total_consumption=consumption_info.total_consumption,
-        extra_consumption=extra_consumption,
-        outstanding_balance=int(bill_info.total_outstanding.amount),
-        unpaid_bills=unpaid_bills,
-        has_unpaid_bills=any(
-            bill.status == BillStatus.UNPAID for bill in bill_info.bills
-        ),
-        has_extra_consumption=extra_consumption > 0,
-    )
-
-
 @pytest.fixture(autouse=True)
 def mock_coordinator_first_refresh(
     consumption_info: ConsumptionInfo,
     bill_info: BillInfo,
 ) -> Iterator[None]:
     """Avoid live API refresh during coordinator setup and entry reloads."""
-    coordinator_data = _coordinator_data(consumption_info, bill_info)
+    coordinator_data = build_coordinator_data(consumption_info, bill_info)
 
     async def _mock_first_refresh(
         coordinator: OgeroDataUpdateCoordinator,
@@ -150,6 +120,7 @@ def _build_mock_api_client(
     mock_client.async_get_accounts = AsyncMock(return_value=accounts)
     mock_client.async_get_consumption = AsyncMock(return_value=consumption_info)
     mock_client.async_get_bills = AsyncMock(return_value=bill_info)
+    mock_client.async_close = AsyncMock()
     return mock_client
 
 
@@ -0,0 +1,291 @@
+"""
+Run Ogero polling for days of virtual time against a fake backend.
+
+The harness sets up a real config entry, including the first refresh of
+each line, then advances a frozen clock in fixed steps and fires the due
+timers. The fake backend publishes new usage on a fixed cadence and can be
+taken offline, so scheduler changes can be compared in seconds by the
+requests they make and how stale they leave each line.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+from pyogero.types import Bill, BillAmount, BillInfo, BillStatus, ConsumptionInfo
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.ogero.api import Account, OgeroApiClientConnectionError
+from custom_components.ogero.const import CONFIG_ENTRY_VERSION, DOMAIN
+from custom_components.ogero.coordinator import OgeroDataUpdateCoordinator
+
+from .conftest import TEST_PASSWORD, TEST_USERNAME
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+SIMULATION_STEP = timedelta(minutes=5)
+UPSTREAM_PERIOD = timedelta(hours=6)
+
+
+@dataclass(slots=True)
+class Outage:
+    """A time range in which every backend call fails."""
+
+    start: datetime
+    end: datetime
+
+    def covers(self, moment: datetime) -> bool:
+        """Return whether the backend is down at a moment."""
+        return self.start <= moment < self.end
+
+
+class FakeOgeroBackend:
+    """
+    Stand-in for the API client with a deterministic upstream.
+
+    Each line publishes new usage every upstream period, starting at the
+    epoch (lines are offset from each other by an even share of the
+    period). Calls yield to the event loop once, so calls made from
+    concurrent refreshes overlap and count towards peak concurrency.
+    """
+
+    def __init__(
+        self,
+        epoch: datetime,
+        lines: int = 2,
+        *,
+        upstream_period: timedelta = UPSTREAM_PERIOD,
+    ) -> None:
+        """Initialize."""
+        self.epoch = epoch
+        self.upstream_period = upstream_period
+        self.accounts = [
+            Account(internet=f"{10000 + index}", phone=f"0{1000000 + index}")
+            for index in range(lines)
+        ]
+        self.outages: list[Outage] = []
+        self.requests: list[tuple[datetime, str, str]] = []
+        self.in_flight = 0
+        self.peak_concurrency = 0
+
+    def published_at(self, account: Account, moment: datetime) -> datetime | None:
+        """Return when a line last published usage, as of a moment."""
+        offset = self._offset(account)
+        if moment < self.epoch + offset:
+            return None
+        elapsed = moment - self.epoch - offset
+        return (
+            self.epoch
+            + offset
+            + (elapsed // self.upstream_period) * (self.upstream_period)
+        )
+
+    def next_publish_after(self, account: Account, moment: datetime | None) -> datetime:
+        """Return when a line publishes after a moment (None: its first usage)."""
+        published = self.published_at(account, moment) if moment else None
+        if published is None:
+            return self.epoch + self._offset(account)
+        return published + self.upstream_period
+
+    def _offset(self, account: Account) -> timedelta:
+        return self.upstream_period * self.accounts.index(account) / len(self.accounts)
+
+    async def _async_call(self, method: str, line: str) -> datetime:
+        now = dt_util.utcnow()
+        self.requests.append((now, method, line))
+        self.in_flight += 1
+        self.peak_concurrency = max(self.peak_concurrency, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        if any(outage.covers(now) for outage in self.outages):
+            msg = "Simulated outage"
+            raise OgeroApiClientConnectionError(msg)
+        return now
+
+    async def async_login(self) -> bool:
+        """Log in."""
+        await self._async_call("login", "")
+        return True
+
+    async def async_get_accounts(self) -> list[Account]:
+        """Return the simulated lines."""
+        await self._async_call("get_accounts", "")
+        return list(self.accounts)
+
+    async def async_get_consumption(self, account: Account) -> ConsumptionInfo:
+        """Return usage that grows by one GB per upstream refresh."""
+        now = await self._async_call("get_consumption", account.serial)
+        published = self.published_at(account, now)
+        refreshes = (published - self.epoch) // self.upstream_period if published else 0
+        return ConsumptionInfo(
+            speed="8 Mbps",
+            quota=500,
+            total_consumption=float(refreshes),
+            extra_consumption=0.0,
+            last_update=published,
+        )
+
+    async def async_get_bills(self, account: Account) -> BillInfo:
+        """Return one unpaid bill."""
+        await self._async_call("get_bills", account.serial)
+        return BillInfo(
+            total_outstanding=BillAmount(amount=75000, currency="LBP"),
+            bills=[
+                Bill(
+                    date=self.epoch,
+                    amount=BillAmount(amount=75000, currency="LBP"),
+                    status=BillStatus.UNPAID,
+                )
+            ],
+        )
+
+    async def async_close(self) -> None:
+        """Nothing to release."""
+
+
+@dataclass
+class LineStaleness:
+    """How long a line showed older usage than Ogero had published."""
+
+    samples: int = 0
+    total: timedelta = timedelta()
+    worst: timedelta = timedelta()
+
+    def add(self, staleness: timedelta) -> None:
+        """Record one sample."""
+        self.samples += 1
+        self.total += staleness
+        self.worst = max(self.worst, staleness)
+
+    @property
+    def mean(self) -> timedelta:
+        """Return the mean staleness over all samples."""
+        return self.total / self.samples if self.samples else timedelta()
+
+
+@dataclass
+class SimulationReport:
+    """What a simulated run did to Ogero and how fresh it kept each line."""
+
+    requests: list[tuple[datetime, str, str]]
+    peak_concurrency: int
+    staleness: dict[str, LineStaleness] = field(default_factory=dict)
+
+    @property
+    def total_requests(self) -> int:
+        """Return all backend calls, setup included."""
+        return len(self.requests)
+
+    @property
+    def by_method(self) -> Counter[str]:
+        """Return backend calls per API method."""
+        return Counter(method for _, method, _ in self.requests)
+
+    @property
+    def by_line(self) -> Counter[str]:
+        """Return data calls per line (login and account lookups excluded)."""
+        return Counter(line for _, _, line in self.requests if line)
+
+    @property
+    def per_hour(self) -> Counter[datetime]:
+        """Return backend calls per virtual clock hour."""
+        return Counter(
+            moment.replace(minute=0, second=0, microsecond=0)
+            for moment, _, _ in self.requests
+        )
+
+    @property
+    def by_local_hour(self) -> Counter[int]:
+        """Return backend calls per local hour of the day."""
+        return Counter(dt_util.as_local(moment).hour for moment, _, _ in self.requests)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary for printing or comparing runs."""
+        return {
+            "total_requests": self.total_requests,
+            "by_method": dict(self.by_method),
+            "peak_requests_per_hour": max(self.per_hour.values(), default=0),
+            "peak_concurrency": self.peak_concurrency,
+            "by_local_hour": dict(sorted(self.by_local_hour.items())),
+            "staleness": {
+                line: {
+                    "mean_minutes": round(stale.mean.total_seconds() / 60, 1),
+                    "worst_minutes": round(stale.worst.total_seconds() / 60, 1),
+                }
+                for line, stale in self.staleness.items()
+            },
+        }
+
+
+async def async_simulate(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    backend: FakeOgeroBackend,
+    duration: timedelta,
+    options: Mapping[str, Any] | None = None,
+) -> SimulationReport:
+    """
+    Set up a login backed by backend and run it for duration of virtual time.
+
+    The clock jumps to the backend epoch, so runs in one test need
+    increasing epochs. Staleness is sampled after every
+    step: a line is stale from the moment Ogero publishes usage it has not
+    picked up yet.
+    """
+    freezer.move_to(backend.epoch)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        source=SOURCE_USER,
+        data={"username": TEST_USERNAME, "password": TEST_PASSWORD},
+        options=dict(options or {}),
+        unique_id=slugify(TEST_USERNAME),
+        version=CONFIG_ENTRY_VERSION,
+    )
+    entry.add_to_hass(hass)
+    staleness = {account.serial: LineStaleness() for account in backend.accounts}
+    with (
+        patch("custom_components.ogero.api.create_api_client", return_value=backend),
+        # Undo the conftest shortcut: the first refresh is part of the run.
+        patch.object(
+            OgeroDataUpdateCoordinator,
+            "async_config_entry_first_refresh",
+            DataUpdateCoordinator.async_config_entry_first_refresh,
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinators = entry.runtime_data.coordinators
+        end = backend.epoch + duration
+        while (now := dt_util.utcnow()) < end:
+            freezer.tick(SIMULATION_STEP)
+            now += SIMULATION_STEP
+            async_fire_time_changed(hass, now)
+            # Scheduled refreshes run as background tasks.
+            await hass.async_block_till_done(wait_background_tasks=True)
+            for account in backend.accounts:
+                data = coordinators[account.serial].data
+                unseen = backend.next_publish_after(
+                    account, data.last_update if data is not None else None
+                )
+                staleness[account.serial].add(max(now - unseen, timedelta()))
+        await hass.config_entries.async_remove(entry.entry_id)
+        await hass.async_block_till_done()
+    return SimulationReport(list(backend.requests), backend.peak_concurrency, staleness)
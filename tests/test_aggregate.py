@@ -0,0 +1,79 @@
+"""Test Ogero login totals."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.ogero.aggregate import OgeroLoginTotals
+from custom_components.ogero.coordinator import build_coordinator_data
+from custom_components.ogero.sensor import TOTAL_OUTSTANDING_BALANCE
+from tests.conftest import MOCK_API_ACCOUNT_COUNT, TEST_ACCOUNT_SERIAL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pyogero.types import BillInfo, ConsumptionInfo
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+
+def test_totals_follow_line_updates(
+    consumption_info: ConsumptionInfo, bill_info: BillInfo
+) -> None:
+    """Updating or removing a line only moves that line's contribution."""
+    data = build_coordinator_data(consumption_info, bill_info)
+    totals = OgeroLoginTotals()
+    calls: list[None] = []
+    remove = totals.async_add_listener(lambda: calls.append(None))
+
+    totals.async_update_line("a", data)
+    totals.async_update_line("b", data)
+    assert totals.lines == MOCK_API_ACCOUNT_COUNT
+    assert totals.outstanding_balance == 2 * data.outstanding_balance
+    assert totals.total_consumption == 2 * data.total_consumption
+    assert totals.lines_over_quota == MOCK_API_ACCOUNT_COUNT
+    assert totals.lines_with_unpaid_bills == MOCK_API_ACCOUNT_COUNT
+
+    paid = replace(data, outstanding_balance=0, unpaid_bills=(), has_unpaid_bills=False)
+    totals.async_update_line("b", paid)
+    assert totals.outstanding_balance == data.outstanding_balance
+    assert totals.lines_with_unpaid_bills == 1
+
+    notified = len(calls)
+    totals.async_update_line("b", paid)
+    assert len(calls) == notified
+
+    totals.async_remove_line("a")
+    assert totals.lines == 1
+    assert totals.outstanding_balance == 0
+    assert totals.total_consumption == data.total_consumption
+
+    remove()
+    totals.async_remove_line("b")
+    assert len(calls) == notified + 1
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_login_sensor_tracks_line_updates(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """The login balance sensor updates when a single line changes."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", "ogero", f"{loaded_entry.entry_id}_{TOTAL_OUTSTANDING_BALANCE}"
+    )
+    assert entity_id is not None
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    line_balance = coordinator.data.outstanding_balance
+    assert hass.states.get(entity_id).state == str(
+        MOCK_API_ACCOUNT_COUNT * line_balance
+    )
+
+    coordinator.async_set_updated_data(replace(coordinator.data, outstanding_balance=0))
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == str(
+        (MOCK_API_ACCOUNT_COUNT - 1) * line_balance
+    )
@@ -12,13 +12,17 @@ if TYPE_CHECKING:
 
 
 async def test_create_api_client_injects_websession(hass: HomeAssistant) -> None:
-    """create_api_client uses Home Assistant shared aiohttp session."""
+    """create_api_client uses one metered session for every Ogero login."""
     mock_session = MagicMock()
     with patch(
-        "custom_components.ogero.api.async_get_clientsession",
+        "custom_components.ogero.api.async_create_clientsession",
         return_value=mock_session,
-    ) as get_session:
+    ) as create_session:
         client = create_api_client(hass, "user", "pass")
+        other = create_api_client(hass, "other", "pass")
 
-    get_session.assert_called_once_with(hass)
+    create_session.assert_called_once()
+    assert create_session.call_args.args == (hass,)
+    assert len(create_session.call_args.kwargs["trace_configs"]) == 1
     assert client.ogero_client.session is mock_session
+    assert other.ogero_client.session is mock_session
@@ -0,0 +1,119 @@
+"""Test Ogero bill change events."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pyogero.types import Bill, BillAmount, BillInfo, BillStatus
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.ogero.bills import OgeroBillIndex
+from custom_components.ogero.const import (
+    EVENT_BALANCE_CHANGED,
+    EVENT_BILL_ISSUED,
+    EVENT_BILL_PAID,
+)
+from tests.conftest import TEST_ACCOUNT_SERIAL
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+MAY_BILL = 75000
+JUNE_BILL = 80000
+
+
+def _bill_info(*, may_paid: bool, june: bool) -> BillInfo:
+    """Return bills for May and optionally June, with a matching balance."""
+    bills = [
+        Bill(
+            date=datetime(2024, 5, 1),  # noqa: DTZ001
+            amount=BillAmount(amount=MAY_BILL, currency="LBP"),
+            status=BillStatus.PAID if may_paid else BillStatus.UNPAID,
+        )
+    ]
+    if june:
+        bills.append(
+            Bill(
+                date=datetime(2024, 6, 1),  # noqa: DTZ001
+                amount=BillAmount(amount=JUNE_BILL, currency="LBP"),
+                status=BillStatus.UNPAID,
+            )
+        )
+    outstanding = (0 if may_paid else MAY_BILL) + (JUNE_BILL if june else 0)
+    return BillInfo(
+        total_outstanding=BillAmount(amount=outstanding, currency="LBP"),
+        bills=bills,
+    )
+
+
+def test_index_reports_only_changes() -> None:
+    """The first poll is a baseline; later polls report each change once."""
+    index = OgeroBillIndex()
+    assert index.update(_bill_info(may_paid=False, june=False)) == []
+    assert index.update(_bill_info(may_paid=False, june=False)) == []
+
+    changes = index.update(_bill_info(may_paid=True, june=True))
+    assert changes == [
+        (
+            EVENT_BILL_PAID,
+            {"bill": {"period": "2024-05", "amount": "LBP 75000", "status": "PAID"}},
+        ),
+        (
+            EVENT_BILL_ISSUED,
+            {"bill": {"period": "2024-06", "amount": "LBP 80000", "status": "UNPAID"}},
+        ),
+        (
+            EVENT_BALANCE_CHANGED,
+            {"previous_balance": MAY_BILL, "outstanding_balance": JUNE_BILL},
+        ),
+    ]
+
+
+async def test_coordinator_fires_bill_events(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """A poll with a new bill fires events carrying just that bill."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    mock_api_client.async_get_bills.return_value = _bill_info(
+        may_paid=False, june=False
+    )
+    await coordinator.async_refresh()
+    issued = async_capture_events(hass, EVENT_BILL_ISSUED)
+    balance = async_capture_events(hass, EVENT_BALANCE_CHANGED)
+
+    mock_api_client.async_get_bills.return_value = _bill_info(may_paid=False, june=True)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(issued) == 1
+    assert issued[0].data["line"] == TEST_ACCOUNT_SERIAL
+    assert issued[0].data["bill"]["period"] == "2024-06"
+    assert balance[0].data["outstanding_balance"] == MAY_BILL + JUNE_BILL
+
+
+async def test_bill_index_survives_reload(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """A bill issued while the login reloads is still reported once."""
+    mock_api_client.async_get_bills.return_value = _bill_info(
+        may_paid=False, june=False
+    )
+    await loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+    assert await hass.config_entries.async_reload(loaded_entry.entry_id)
+    await hass.async_block_till_done()
+    issued = async_capture_events(hass, EVENT_BILL_ISSUED)
+
+    mock_api_client.async_get_bills.return_value = _bill_info(may_paid=False, june=True)
+    await loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+    await hass.async_block_till_done()
+
+    assert [event.data["bill"]["period"] for event in issued] == ["2024-06"]
@@ -0,0 +1,94 @@
+"""Test the domain-wide Ogero request budget."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from custom_components.ogero.budget import OgeroRequestBudget
+from custom_components.ogero.const import (
+    DEFAULT_REQUEST_BUDGET,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    PRIORITY_WEIGHTS,
+    REQUEST_BUDGET_WINDOW,
+)
+
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
+CAPACITY = 12
+
+
+def _budget() -> OgeroRequestBudget:
+    """Return a budget with two logins: one with two lines, one with one."""
+    budget = OgeroRequestBudget()
+    budget.register_login("a", CAPACITY)
+    budget.register_login("b", CAPACITY * 2)
+    budget.register_line("a", "a1", PRIORITY_WEIGHTS[PRIORITY_HIGH])
+    budget.register_line("a", "a2", PRIORITY_WEIGHTS[PRIORITY_LOW])
+    budget.register_line("b", "b1", PRIORITY_WEIGHTS[PRIORITY_NORMAL])
+    return budget
+
+
+def test_capacity_uses_strictest_login() -> None:
+    """The lowest configured allowance applies to the whole domain."""
+    budget = OgeroRequestBudget()
+    assert budget.capacity == DEFAULT_REQUEST_BUDGET
+    budget = _budget()
+    assert budget.capacity == CAPACITY
+    budget.unregister_login("a")
+    assert budget.capacity == CAPACITY * 2
+
+
+def test_shares_split_by_login_then_priority() -> None:
+    """Logins share equally; lines within a login share by weight."""
+    budget = _budget()
+    assert budget.share("b", "b1") == pytest.approx(CAPACITY / 2)
+    assert budget.share("a", "a1") == pytest.approx(CAPACITY / 2 * 4 / 5)
+    assert budget.share("a", "a2") == pytest.approx(CAPACITY / 2 * 1 / 5)
+    assert budget.share("a", "unknown") == 0.0
+
+
+def test_line_over_share_cannot_take_reserved_slots() -> None:
+    """A busy line stops once the rest of the budget is reserved for others."""
+    budget = _budget()
+    granted = 0
+    while budget.try_acquire("a", "a1", NOW):
+        granted += 1
+    # a1 keeps its own share and nothing reserved for a2 or b1.
+    assert granted == round(budget.share("a", "a1"))
+    assert budget.try_acquire("b", "b1", NOW)
+    assert budget.try_acquire("a", "a2", NOW)
+
+
+def test_unclaimed_capacity_can_be_borrowed() -> None:
+    """Without competing lines, one line may use the whole budget."""
+    budget = OgeroRequestBudget()
+    budget.register_login("a", CAPACITY)
+    budget.register_line("a", "a1", PRIORITY_WEIGHTS[PRIORITY_NORMAL])
+    for _ in range(CAPACITY):
+        assert budget.try_acquire("a", "a1", NOW)
+    assert not budget.try_acquire("a", "a1", NOW)
+    assert budget.used == CAPACITY
+
+
+def test_forced_requests_always_proceed_and_count() -> None:
+    """Setup requests are never blocked but use up budget."""
+    budget = _budget()
+    for _ in range(CAPACITY):
+        assert budget.try_acquire("a", "", NOW, force=True)
+    assert budget.try_acquire("a", "", NOW, force=True)
+    assert not budget.try_acquire("b", "b1", NOW)
+
+
+def test_window_expiry_frees_slots() -> None:
+    """Requests leave the budget after the window passes."""
+    budget = _budget()
+    for _ in range(CAPACITY):
+        budget.try_acquire("a", "", NOW, force=True)
+    assert budget.next_slot(NOW) == NOW + REQUEST_BUDGET_WINDOW
+    later = NOW + REQUEST_BUDGET_WINDOW
+    assert budget.try_acquire("b", "b1", later)
+    assert budget.usage("a", "") == 0
+    assert budget.usage("b", "b1") == 1
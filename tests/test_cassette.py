@@ -0,0 +1,141 @@
+"""Test recording and replaying Ogero API results."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pyogero.asyncio import Account as OgeroAccount
+from pyogero.exceptions import OgeroCommunicationError
+
+from custom_components.ogero.api import (
+    OgeroApiClientCommunicationError,
+    RecordingOgeroApiClient,
+    ReplayOgeroApiClient,
+    create_api_client,
+)
+from custom_components.ogero.cassette import (
+    REDACTED,
+    bill_info_from_dict,
+    bill_info_to_dict,
+    consumption_from_dict,
+    consumption_to_dict,
+)
+from custom_components.ogero.const import (
+    ENV_CASSETTE_LATENCY,
+    ENV_CASSETTE_MODE,
+    ENV_CASSETTE_PATH,
+)
+
+from .conftest import TEST_ACCOUNT_SERIAL, TEST_PASSWORD, TEST_USERNAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+    from pyogero.types import BillInfo, ConsumptionInfo
+
+    from custom_components.ogero.api import Account
+
+
+def test_serialization_round_trip(
+    consumption_info: ConsumptionInfo, bill_info: BillInfo
+) -> None:
+    """Parsed results survive a trip through JSON unchanged."""
+    consumption = json.loads(json.dumps(consumption_to_dict(consumption_info)))
+    bills = json.loads(json.dumps(bill_info_to_dict(bill_info)))
+    assert consumption_from_dict(consumption) == consumption_info
+    assert bill_info_from_dict(bills) == bill_info
+
+
+async def test_record_then_replay(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    account: Account,
+    consumption_info: ConsumptionInfo,
+    bill_info: BillInfo,
+) -> None:
+    """A recorded session replays the same results and errors offline."""
+    path = str(tmp_path / "cassette.json")
+    with (
+        patch.dict(
+            "os.environ", {ENV_CASSETTE_MODE: "record", ENV_CASSETTE_PATH: path}
+        ),
+        patch(
+            "custom_components.ogero.api.async_create_clientsession",
+            return_value=MagicMock(),
+        ),
+    ):
+        recorder = create_api_client(hass, TEST_USERNAME, TEST_PASSWORD)
+    assert isinstance(recorder, RecordingOgeroApiClient)
+    recorder.ogero_client = MagicMock(
+        login=AsyncMock(return_value=True),
+        get_accounts=AsyncMock(
+            return_value=[OgeroAccount(phone=account.phone, internet=account.internet)]
+        ),
+        get_consumption_info=AsyncMock(
+            side_effect=[consumption_info, OgeroCommunicationError("timeout")]
+        ),
+        get_bill_info=AsyncMock(return_value=bill_info),
+    )
+
+    assert await recorder.async_login() is True
+    assert await recorder.async_get_accounts() == [account]
+    assert await recorder.async_get_consumption(account) == consumption_info
+    with pytest.raises(OgeroApiClientCommunicationError):
+        await recorder.async_get_consumption(account)
+    assert await recorder.async_get_bills(account) == bill_info
+    await hass.async_block_till_done()
+
+    # Calls made within the save delay are written together on close.
+    saved = await hass.async_add_executor_job(
+        tmp_path.joinpath("cassette.json").read_text
+    )
+    assert len(json.loads(saved)["interactions"]) == 1
+    recorded = len(recorder.cassette.interactions)
+    await recorder.async_close()
+    saved = await hass.async_add_executor_job(
+        tmp_path.joinpath("cassette.json").read_text
+    )
+    assert f'"{TEST_PASSWORD}"' not in saved
+    assert json.loads(saved)["credentials"]["password"] == REDACTED
+    assert len(json.loads(saved)["interactions"]) == recorded
+
+    with patch.dict(
+        "os.environ",
+        {
+            ENV_CASSETTE_MODE: "replay",
+            ENV_CASSETTE_PATH: path,
+            ENV_CASSETTE_LATENCY: "0",
+        },
+    ):
+        replayer = create_api_client(hass, TEST_USERNAME, TEST_PASSWORD)
+    assert isinstance(replayer, ReplayOgeroApiClient)
+    assert replayer.latency == 0.0
+
+    assert await replayer.async_login() is True
+    assert [a.serial for a in await replayer.async_get_accounts()] == [
+        TEST_ACCOUNT_SERIAL
+    ]
+    assert await replayer.async_get_consumption(account) == consumption_info
+    with pytest.raises(OgeroApiClientCommunicationError, match="timeout"):
+        await replayer.async_get_consumption(account)
+    # Once a call's recordings run out, replay starts over from the first one.
+    assert await replayer.async_get_consumption(account) == consumption_info
+    assert await replayer.async_get_bills(account) == bill_info
+
+
+async def test_replay_unrecorded_call(
+    hass: HomeAssistant, tmp_path: Path, account: Account
+) -> None:
+    """Replaying a call that was never recorded fails loudly."""
+    path = tmp_path / "cassette.json"
+    await hass.async_add_executor_job(
+        path.write_text, json.dumps({"version": 1, "interactions": []})
+    )
+    replayer = ReplayOgeroApiClient(hass, str(path), latency=0)
+
+    with pytest.raises(LookupError):
+        await replayer.async_get_bills(account)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
@@ -20,14 +21,23 @@ from custom_components.ogero.api import (
     OgeroApiClientCommunicationError,
 )
 from custom_components.ogero.const import (
+    CONF_CONFIGURE_LINE,
     CONF_DISABLED_ACCOUNTS,
+    CONF_LINE_OPTIONS,
+    CONF_POLL_SCHEDULE,
+    CONF_PRIORITY,
     CONF_SCAN_INTERVAL,
     CONFIG_ENTRY_VERSION,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MIN_SCAN_INTERVAL,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+)
+from custom_components.ogero.sensor import (
+    ENTITY_DESCRIPTIONS,
+    LOGIN_SENSOR_DESCRIPTIONS,
 )
-from custom_components.ogero.sensor import ENTITY_DESCRIPTIONS
 from tests.conftest import (
     TEST_ACCOUNT_SERIAL,
     TEST_ACCOUNT_SERIAL_2,
@@ -223,6 +233,72 @@ async def test_options_flow_clamps_below_minimum(
     assert coordinator.update_interval.total_seconds() == min_seconds
 
 
+@pytest.mark.usefixtures("mock_api_client")
+async def test_options_flow_line_overrides(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """Per-line interval and priority are stored by serial and applied on reload."""
+    result = await hass.config_entries.options.async_init(loaded_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_CONFIGURE_LINE: TEST_ACCOUNT_SERIAL_2},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "line"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_SCAN_INTERVAL: {"hours": 6}, CONF_PRIORITY: PRIORITY_LOW},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_LINE_OPTIONS] == {
+        TEST_ACCOUNT_SERIAL_2: {
+            CONF_PRIORITY: PRIORITY_LOW,
+            CONF_SCAN_INTERVAL: 6 * 3600,
+        }
+    }
+
+    await hass.async_block_till_done()
+
+    entry = hass.config_entries.async_get_entry(loaded_entry.entry_id)
+    assert entry is not None
+    idle = entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL_2]
+    assert idle.update_interval == timedelta(hours=6)
+    assert idle.scheduler.priority == PRIORITY_LOW
+    busy = entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    assert busy.update_interval == DEFAULT_SCAN_INTERVAL
+    assert busy.scheduler.priority == PRIORITY_NORMAL
+
+
+async def test_options_flow_poll_schedule(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """An invalid poll schedule is refused; a valid one reaches the schedulers."""
+    result = await hass.config_entries.options.async_init(loaded_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_POLL_SCHEDULE: "08:00-20:00"},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_POLL_SCHEDULE: "invalid_poll_schedule"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_POLL_SCHEDULE: " 08:00-20:00=30m; *=6h "},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_POLL_SCHEDULE] == "08:00-20:00=30m; *=6h"
+
+    await hass.async_block_till_done()
+
+    entry = hass.config_entries.async_get_entry(loaded_entry.entry_id)
+    assert entry is not None
+    for coordinator in entry.runtime_data.coordinators.values():
+        schedule = coordinator.scheduler.schedule
+        assert schedule is not None
+        assert schedule.default == timedelta(hours=6)
+
+
 @pytest.mark.usefixtures("mock_api_client", "mock_setup_entry")
 async def test_reauth_flow(
     hass: HomeAssistant,
@@ -272,7 +348,9 @@ async def test_all_api_accounts_have_coordinators_and_entities(
         if entity.config_entry_id == entry.entry_id and entity.domain == "sensor"
     ]
     account_count = len(entry.runtime_data.coordinators)
-    assert len(sensor_entities) == len(ENTITY_DESCRIPTIONS) * account_count
+    assert len(sensor_entities) == len(ENTITY_DESCRIPTIONS) * account_count + len(
+        LOGIN_SENSOR_DESCRIPTIONS
+    )
 
 
 @pytest.mark.usefixtures("mock_api_client")
@@ -292,3 +370,16 @@ async def test_remove_device_adds_disabled_account(
     assert entry is not None
     disabled = entry.options.get(CONF_DISABLED_ACCOUNTS, [])
     assert TEST_ACCOUNT_SERIAL in disabled
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_login_device_cannot_be_removed(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """The login totals device is not treated as a line."""
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, loaded_entry.entry_id)}
+    )
+    assert device is not None
+    assert not await async_remove_config_entry_device(hass, loaded_entry, device)
+    assert CONF_DISABLED_ACCOUNTS not in loaded_entry.options
@@ -0,0 +1,205 @@
+"""Test the Ogero data update coordinator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import call
+from zoneinfo import ZoneInfo
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pyogero.types import ConsumptionInfo
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.ogero.api import (
+    OgeroApiClientCommunicationError,
+    OgeroApiClientConnectionError,
+    OgeroApiClientError,
+)
+from custom_components.ogero.const import ENDPOINT_CONSUMPTION, RETRY_BACKOFF_BASE
+from custom_components.ogero.data import get_domain_data
+from tests.conftest import TEST_ACCOUNT_SERIAL, TEST_ACCOUNT_SERIAL_2
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+UPDATED_CONSUMPTION = 140.0
+
+
+def _updated_consumption() -> ConsumptionInfo:
+    """Return consumption data newer than the fixture."""
+    return ConsumptionInfo(
+        speed="8 Mbps",
+        quota=500,
+        total_consumption=UPDATED_CONSUMPTION,
+        extra_consumption=5.0,
+        last_update=datetime(2024, 6, 1, 18, 0, tzinfo=ZoneInfo("Asia/Beirut")),
+    )
+
+
+async def test_partial_failure_publishes_fresh_endpoint(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A failed bills call keeps fresh consumption and retries only bills."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+    mock_api_client.async_get_consumption.return_value = _updated_consumption()
+    mock_api_client.async_get_bills.side_effect = OgeroApiClientCommunicationError(
+        "offline"
+    )
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.total_consumption == UPDATED_CONSUMPTION
+    assert coordinator.data.has_unpaid_bills
+    assert coordinator.bills.failures == 1
+    assert coordinator.update_interval == RETRY_BACKOFF_BASE
+
+    mock_api_client.async_get_consumption.reset_mock()
+    mock_api_client.async_get_bills.reset_mock(side_effect=True)
+    freezer.tick(RETRY_BACKOFF_BASE + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    # The second line, never refreshed, polls as well; count this line only.
+    line_call = call(coordinator.account)
+    assert mock_api_client.async_get_bills.await_args_list.count(line_call) == 1
+    assert line_call not in mock_api_client.async_get_consumption.await_args_list
+    assert coordinator.bills.failures == 0
+
+
+async def test_all_endpoints_failing_keeps_last_snapshot(
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """When every due endpoint fails, the poll fails but data is kept."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    snapshot = coordinator.data
+
+    # Not a connection error, so the portal is not treated as unreachable.
+    error = OgeroApiClientError("unexpected response")
+    mock_api_client.async_get_consumption.side_effect = error
+    mock_api_client.async_get_bills.side_effect = error
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.data is snapshot
+    assert coordinator.consumption.failures == 1
+    assert coordinator.bills.failures == 1
+
+
+async def test_exhausted_budget_defers_requests(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """Lines with data wait for a budget slot instead of calling Ogero."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    snapshot = coordinator.data
+
+    budget = get_domain_data(hass).budget
+    while budget.used < budget.capacity:
+        budget.try_acquire("other", "", dt_util.utcnow(), force=True)
+    mock_api_client.async_get_consumption.reset_mock()
+    mock_api_client.async_get_bills.reset_mock()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data is snapshot
+    assert mock_api_client.async_get_consumption.await_count == 0
+    assert mock_api_client.async_get_bills.await_count == 0
+    assert coordinator.consumption.next_attempt == budget.next_slot(dt_util.utcnow())
+
+
+def _sensor_state(hass: HomeAssistant, key: str) -> str:
+    """Return the state of a sensor of the first test line."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", "ogero", f"{TEST_ACCOUNT_SERIAL}_{key}"
+    )
+    assert entity_id is not None
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state.state
+
+
+async def test_stale_data_becomes_unavailable(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Past the maximum data age, only the data fetched sensor stays available."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    coordinator.max_data_age = timedelta(hours=2)
+    await coordinator.async_refresh()
+    assert coordinator.data.data_fetched is not None
+    assert _sensor_state(hass, "total_consumption") != STATE_UNAVAILABLE
+
+    mock_api_client.async_get_consumption.side_effect = (
+        OgeroApiClientCommunicationError("offline")
+    )
+    freezer.tick(timedelta(hours=1))
+    await coordinator.async_refresh()
+    assert _sensor_state(hass, "total_consumption") != STATE_UNAVAILABLE
+
+    freezer.tick(timedelta(hours=1, seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert coordinator.is_stale()
+    assert _sensor_state(hass, "total_consumption") == STATE_UNAVAILABLE
+    assert _sensor_state(hass, "data_fetched") != STATE_UNAVAILABLE
+
+
+async def test_portal_outage_defers_other_lines(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """Once Ogero is unreachable, other lines wait and recover with the portal."""
+    coordinators = loaded_entry.runtime_data.coordinators
+    await coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+    await coordinators[TEST_ACCOUNT_SERIAL_2].async_refresh()
+
+    error = OgeroApiClientConnectionError("offline")
+    mock_api_client.async_get_consumption.reset_mock()
+    mock_api_client.async_get_bills.reset_mock()
+    mock_api_client.async_get_consumption.side_effect = error
+    mock_api_client.async_get_bills.side_effect = error
+    await coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+    # The first failure opens the outage, so bills are not even tried.
+    assert mock_api_client.async_get_consumption.await_count == 1
+    assert mock_api_client.async_get_bills.await_count == 0
+
+    await coordinators[TEST_ACCOUNT_SERIAL_2].async_refresh()
+    assert mock_api_client.async_get_consumption.await_count == 1
+    assert mock_api_client.async_get_bills.await_count == 0
+    retry_at = get_domain_data(hass).outage.retry_at
+    assert retry_at is not None
+    assert coordinators[TEST_ACCOUNT_SERIAL_2].consumption.next_attempt == retry_at
+
+    # A refresh that reaches Ogero ends the outage and wakes the other line.
+    mock_api_client.async_get_consumption.side_effect = None
+    mock_api_client.async_get_bills.side_effect = None
+    await coordinators[TEST_ACCOUNT_SERIAL].async_refresh_endpoints(
+        [ENDPOINT_CONSUMPTION]
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert get_domain_data(hass).outage.retry_at is None
+    assert mock_api_client.async_get_consumption.await_count == len(coordinators) + 1
+    assert mock_api_client.async_get_bills.await_count == len(coordinators)
+    assert coordinators[TEST_ACCOUNT_SERIAL_2].consumption.failures == 0
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 
+from custom_components.ogero.api import OgeroApiClientCommunicationError
+from custom_components.ogero.const import ENDPOINT_BILLS, ENDPOINT_CONSUMPTION
 from custom_components.ogero.diagnostics import async_get_config_entry_diagnostics
+from custom_components.ogero.timeline import (
+    count_received_bytes,
+    received_bytes_trace_config,
+)
 from tests.conftest import (
     MOCK_API_ACCOUNT_COUNT,
     TEST_ACCOUNT_SERIAL,
@@ -32,3 +39,44 @@ async def test_diagnostics(hass: HomeAssistant, loaded_entry: OgeroConfigEntry)
     assert len(result["accounts"]) == MOCK_API_ACCOUNT_COUNT
     serials = {acc["account_serial"] for acc in result["accounts"]}
     assert serials == {TEST_ACCOUNT_SERIAL, TEST_ACCOUNT_SERIAL_2}
+
+
+async def test_diagnostics_poll_timeline(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """Each line reports its recent poll attempts, endpoint by endpoint."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    mock_api_client.async_get_bills.side_effect = OgeroApiClientCommunicationError(
+        "down"
+    )
+    await coordinator.async_refresh()
+
+    result = await async_get_config_entry_diagnostics(hass, loaded_entry)
+    account = next(
+        acc
+        for acc in result["accounts"]
+        if acc["account_serial"] == TEST_ACCOUNT_SERIAL
+    )
+    last = account["poll_timeline"][-1]
+    assert last["result"] == "UpdateFailed"
+    assert last["duration_ms"] is not None
+    assert {(e["endpoint"], e["result"], e["retry"]) for e in last["endpoints"]} == {
+        (ENDPOINT_CONSUMPTION, "ok", 0),
+        (ENDPOINT_BILLS, "OgeroApiClientCommunicationError", 0),
+    }
+
+
+async def test_received_bytes_are_counted_per_task() -> None:
+    """Response chunks count toward the request made in the current task."""
+    trace_config = received_bytes_trace_config()
+    params = MagicMock(chunk=b"abcd")
+    with count_received_bytes() as received:
+        for handler in trace_config.on_response_chunk_received:
+            await handler(MagicMock(), MagicMock(), params)
+    assert received[0] == len(params.chunk)
+    # Chunks outside a counted request are ignored.
+    for handler in trace_config.on_response_chunk_received:
+        await handler(MagicMock(), MagicMock(), params)
+    assert received[0] == len(params.chunk)
@@ -0,0 +1,75 @@
+"""Test the end-of-cycle consumption forecast."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.ogero.forecast import CycleForecast
+
+QUOTA = 100
+# 2 GB a day from the first of a 30-day month ends the cycle at 60 GB.
+DAILY_USAGE = 2.0
+CYCLE_DAYS = 30
+
+
+def _day(day: int, month: int = 6) -> datetime:
+    """Return local midnight of a day in 2024."""
+    return datetime(2024, month, day, tzinfo=dt_util.get_default_time_zone())
+
+
+def _steady(days: int) -> CycleForecast:
+    """Return a forecast fed a steady daily usage since the first."""
+    forecast = CycleForecast()
+    for day in range(1, days + 1):
+        forecast.add(_day(day), DAILY_USAGE * (day - 1))
+    return forecast
+
+
+def test_projects_trend_to_cycle_end() -> None:
+    """A steady trend is extended to the start of the next month."""
+    forecast = _steady(10)
+    assert forecast.consumption_at_cycle_end(_day(10)) == pytest.approx(
+        DAILY_USAGE * CYCLE_DAYS
+    )
+    assert forecast.derived(_day(10), QUOTA // 2) == {
+        "forecast_consumption": pytest.approx(DAILY_USAGE * CYCLE_DAYS),
+        "forecast_extra_consumption": pytest.approx(
+            DAILY_USAGE * CYCLE_DAYS - QUOTA // 2
+        ),
+    }
+    assert forecast.derived(_day(10), 0)["forecast_extra_consumption"] is None
+    # No forecast once the cycle is over.
+    assert forecast.consumption_at_cycle_end(_day(1, month=7)) is None
+
+
+def test_not_enough_samples() -> None:
+    """A single sample or a short span gives no forecast."""
+    forecast = CycleForecast()
+    forecast.add(_day(1), 0.0)
+    assert forecast.consumption_at_cycle_end(_day(1)) is None
+    forecast.add(_day(1) + timedelta(hours=1), 1.0)
+    assert forecast.consumption_at_cycle_end(_day(1)) is None
+
+
+def test_new_cycle_resets_fit() -> None:
+    """A new month or a drop in total consumption starts over."""
+    forecast = _steady(CYCLE_DAYS)
+    forecast.add(_day(1, month=7), 0.5)
+    assert forecast.consumption_at_cycle_end(_day(1, month=7)) is None
+
+    forecast = _steady(10)
+    forecast.add(_day(10) + timedelta(hours=1), 1.0)
+    forecast.add(_day(11), 1.0)
+    # The flat trend since the drop never projects below the current total.
+    assert forecast.consumption_at_cycle_end(_day(11)) == pytest.approx(1.0)
+
+
+def test_rebuilds_from_history_samples() -> None:
+    """Stored (epoch, total) samples rebuild the same fit."""
+    samples = [(_day(day).timestamp(), DAILY_USAGE * (day - 1)) for day in range(1, 11)]
+    assert CycleForecast.from_samples(samples).consumption_at_cycle_end(
+        _day(10)
+    ) == pytest.approx(_steady(10).consumption_at_cycle_end(_day(10)))
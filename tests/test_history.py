@@ -0,0 +1,108 @@
+"""Test the per-line consumption history."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.ogero.const import CADENCE_MIN_INTERVALS, DOMAIN
+from custom_components.ogero.history import ConsumptionHistory
+
+from .conftest import TEST_ACCOUNT_SERIAL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+DAY = date(2024, 6, 2)
+
+
+def _at(hour: int, day: date = DAY) -> datetime:
+    """Return a local time on the test day."""
+    return datetime.combine(day, time(hour), dt_util.get_default_time_zone())
+
+
+def _history() -> ConsumptionHistory:
+    """Return a history with a day of samples before the test day."""
+    history = ConsumptionHistory()
+    yesterday = DAY - timedelta(days=1)
+    for hour, total in ((0, 10.0), (12, 12.0), (18, 13.0)):
+        history.append(_at(hour, yesterday), total)
+    for hour, total in ((6, 14.0), (12, 16.0)):
+        history.append(_at(hour), total)
+    return history
+
+
+def test_derived_usage() -> None:
+    """Usage today, over 24 hours and per day come from the running sums."""
+    history = _history()
+    assert history.usage_today(_at(13)) == pytest.approx(3.0)
+    assert history.usage_last_24h(_at(13)) == pytest.approx(4.0)
+    assert history.average_daily_usage() == pytest.approx(6.0 / 36 * 24)
+    # Later, the window slides and a new day starts at zero.
+    assert history.usage_last_24h(_at(6) + timedelta(days=1)) == pytest.approx(2.0)
+    assert history.usage_today(_at(1) + timedelta(days=1)) == 0.0
+
+
+def test_older_samples_and_cycle_reset() -> None:
+    """Stale samples are ignored; a drop in total starts a new cycle."""
+    history = _history()
+    assert not history.append(_at(12), 20.0)
+    assert history.append(_at(18), 1.5)
+    assert history.usage_today(_at(19)) == pytest.approx(4.5)
+
+
+def test_ring_buffer_wraps_and_round_trips() -> None:
+    """Only the newest samples are kept, and storage rebuilds the sums."""
+    history = ConsumptionHistory(capacity=3)
+    start = _at(0)
+    for step in range(5):
+        history.append(start + timedelta(hours=step * 6), float(step))
+    assert [value for _, value in history] == [2.0, 3.0, 4.0]
+    assert history.average_daily_usage() == pytest.approx(4.0)
+
+    restored = ConsumptionHistory.from_dict(history.as_dict())
+    assert list(restored) == list(history)
+    now = start + timedelta(hours=24)
+    assert restored.derived(now) == history.derived(now)
+    assert ConsumptionHistory().derived(now) == {
+        "usage_today": None,
+        "usage_last_24h": None,
+        "average_daily_usage": None,
+    }
+
+
+async def test_unload_saves_pending_history(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    loaded_entry: OgeroConfigEntry,
+) -> None:
+    """Samples waiting for the delayed save are written when the login unloads."""
+    await loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+    key = f"{DOMAIN}.{loaded_entry.entry_id}.history"
+    assert key not in hass_storage
+
+    assert await hass.config_entries.async_unload(loaded_entry.entry_id)
+
+    assert len(hass_storage[key]["data"][TEST_ACCOUNT_SERIAL]["times"]) == 1
+
+
+async def test_reload_keeps_learned_cadence(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """A line's upstream cadence is learned again from its stored samples."""
+    history = loaded_entry.runtime_data.history
+    period = timedelta(hours=6)
+    for step in range(CADENCE_MIN_INTERVALS + 1):
+        history.line(TEST_ACCOUNT_SERIAL).append(_at(0) + step * period, float(step))
+    await history.async_save()
+
+    assert await hass.config_entries.async_reload(loaded_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    assert coordinator.scheduler.cadence.period == period
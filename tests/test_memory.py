@@ -0,0 +1,206 @@
+"""Per-line memory benchmarks for the coordinator models and full setup."""
+
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import SOURCE_USER
+from pyogero.types import BillStatus
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ogero.api import Account
+from custom_components.ogero.const import CONFIG_ENTRY_VERSION, DOMAIN
+from custom_components.ogero.coordinator import build_coordinator_data
+
+from .conftest import TEST_PASSWORD
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+    from unittest.mock import MagicMock
+
+    from homeassistant.core import HomeAssistant
+    from pyogero.types import BillInfo, ConsumptionInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+LINES = 1000
+# Bytes retained per line (account and coordinator data with one unpaid bill).
+LINE_MEMORY_BUDGET = 1024
+SETUP_LINES = 50
+# Bytes retained per line set up through async_setup_entry: the coordinator
+# and its history, the line device, every entity with its registry entry and
+# state, and the shared bill and totals bookkeeping. Measured at about
+# 141 KiB per line with Home Assistant 2026.2.3 on Python 3.13, one release
+# behind the pinned versions (most of it Home Assistant's entity, registry,
+# state and timer objects for the 15 entities, and about 15 KiB of log
+# records kept by the test's log capture); the budget leaves 1.35x headroom.
+# The breakdown is logged on every run (pytest -rP shows it).
+SETUP_LINE_MEMORY_BUDGET = 192 * 1024
+BREAKDOWN_SIZE = 10
+
+
+@dataclass
+class _LegacyAccount:
+    """Account shape before the models were slotted."""
+
+    internet: str
+    phone: str
+
+
+@dataclass
+class _LegacyCoordinatorData:
+    """Coordinator data shape before the models were slotted."""
+
+    quota: int
+    speed: str
+    total_consumption: float
+    extra_consumption: float
+    last_update: datetime | None
+    outstanding_balance: int
+    unpaid_bills: list[dict[str, str]]
+    has_unpaid_bills: bool
+    has_extra_consumption: bool
+
+
+def _legacy_line(
+    index: int, consumption: ConsumptionInfo, bill_info: BillInfo
+) -> tuple[object, object]:
+    unpaid_bills = [
+        {
+            "period": bill.date.strftime("%Y-%m"),
+            "amount": f"{bill.amount.currency} {int(bill.amount.amount)}",
+            "status": bill.status.name,
+        }
+        for bill in bill_info.bills
+        if bill.status == BillStatus.UNPAID
+    ]
+    data = _LegacyCoordinatorData(
+        quota=consumption.quota,
+        speed=consumption.speed,
+        total_consumption=consumption.total_consumption,
+        extra_consumption=consumption.extra_consumption,
+        last_update=consumption.last_update,
+        outstanding_balance=int(bill_info.total_outstanding.amount),
+        unpaid_bills=unpaid_bills,
+        has_unpaid_bills=bool(unpaid_bills),
+        has_extra_consumption=consumption.extra_consumption > 0,
+    )
+    return _LegacyAccount(internet=str(index), phone=f"0{index}"), data
+
+
+def _line(
+    index: int, consumption: ConsumptionInfo, bill_info: BillInfo
+) -> tuple[object, object]:
+    account = Account(internet=str(index), phone=f"0{index}")
+    return account, build_coordinator_data(consumption, bill_info)
+
+
+def _bytes_per_line(
+    build: Callable[[int, ConsumptionInfo, BillInfo], tuple[object, object]],
+    consumption: ConsumptionInfo,
+    bill_info: BillInfo,
+) -> float:
+    """Return memory retained per line after building LINES lines."""
+    tracemalloc.start()
+    try:
+        lines = [build(index, consumption, bill_info) for index in range(LINES)]
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(lines) == LINES
+    return retained / LINES
+
+
+def test_line_models_are_compact(
+    consumption_info: ConsumptionInfo, bill_info: BillInfo
+) -> None:
+    """Slotted models stay within budget and beat the dict-based shape."""
+    current = _bytes_per_line(_line, consumption_info, bill_info)
+    legacy = _bytes_per_line(_legacy_line, consumption_info, bill_info)
+    assert current < LINE_MEMORY_BUDGET
+    assert current < legacy
+
+
+def test_account_serial_is_cached() -> None:
+    """The serial is built once and not part of equality."""
+    account = Account(internet="12345", phone="01234567")
+    assert account.serial is account.serial
+    assert account == Account.deserialize(account.serial)
+    assert not hasattr(account, "__dict__")
+
+
+async def _async_setup_lines(
+    hass: HomeAssistant, client: MagicMock, login: str, first: int, lines: int
+) -> MockConfigEntry:
+    """Set up a login whose account lookup returns the given number of lines."""
+    client.async_get_accounts.return_value = [
+        Account(internet=str(first + index), phone=f"0{first + index}")
+        for index in range(lines)
+    ]
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        source=SOURCE_USER,
+        data={"username": login, "password": TEST_PASSWORD},
+        unique_id=login,
+        version=CONFIG_ENTRY_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert len(entry.runtime_data.coordinators) == lines
+    return entry
+
+
+def _new_objects_by_type(known: set[int]) -> Counter[str]:
+    """Return shallow bytes of GC-tracked objects not in known, by type."""
+    sizes: Counter[str] = Counter()
+    for obj in gc.get_objects():
+        if id(obj) not in known:
+            sizes[type(obj).__qualname__] += sys.getsizeof(obj)
+    return sizes
+
+
+async def test_setup_memory_per_line(
+    hass: HomeAssistant, mock_api_client: MagicMock
+) -> None:
+    """Lines set up through the config entry stay within the memory budget."""
+    # Platforms, translations and services load with the first login; keep
+    # them out of the measurement.
+    await _async_setup_lines(hass, mock_api_client, "warmup", 100000, 1)
+    gc.collect()
+    known = {id(obj) for obj in gc.get_objects()}
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        await _async_setup_lines(hass, mock_api_client, "bench", 200000, SETUP_LINES)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    by_file = after.compare_to(before, "filename")
+    per_line = sum(stat.size_diff for stat in by_file) / SETUP_LINES
+    by_type = _new_objects_by_type(known)
+    report = "\n".join(
+        [
+            f"{per_line:.0f} bytes retained per line; largest sources per line:",
+            *(
+                f"  {stat.traceback[0].filename}: {stat.size_diff / SETUP_LINES:.0f}"
+                for stat in by_file[:BREAKDOWN_SIZE]
+            ),
+            "largest new object types per line (shallow):",
+            *(
+                f"  {name}: {size / SETUP_LINES:.0f}"
+                for name, size in by_type.most_common(BREAKDOWN_SIZE)
+            ),
+        ]
+    )
+    _LOGGER.info("Setup memory per line:\n%s", report)
+    assert per_line < SETUP_LINE_MEMORY_BUDGET, report
@@ -0,0 +1,101 @@
+"""Test Prometheus metrics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.ogero.const import ENDPOINT_BILLS, ENDPOINT_CONSUMPTION
+from custom_components.ogero.metrics import OgeroMetrics
+from custom_components.ogero.scheduler import PortalOutage
+from custom_components.ogero.timeline import EndpointAttempt, PollAttempt
+from tests.conftest import TEST_ACCOUNT_SERIAL
+
+if TYPE_CHECKING:
+    from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+NOW = datetime(2024, 6, 1, 12, tzinfo=UTC)
+
+
+def _poll(*attempts: tuple[str, str], duration: float) -> PollAttempt:
+    poll = PollAttempt(
+        started=NOW,
+        endpoints=[
+            EndpointAttempt(endpoint, 0.1, 100, result, 0)
+            for endpoint, result in attempts
+        ],
+    )
+    poll.duration = duration
+    return poll
+
+
+def test_render_counters_and_histogram() -> None:
+    """Requests, cache lookups and poll durations accumulate across polls."""
+    metrics = OgeroMetrics()
+    metrics.observe_poll(
+        _poll((ENDPOINT_CONSUMPTION, "ok"), (ENDPOINT_BILLS, "ok"), duration=0.3)
+    )
+    metrics.observe_poll(
+        _poll(
+            (ENDPOINT_CONSUMPTION, "shared_cache"),
+            (ENDPOINT_BILLS, "deferred"),
+            duration=0.1,
+        )
+    )
+    # Bills were not due in this poll, so they are not a lookup at all.
+    metrics.observe_poll(
+        _poll((ENDPOINT_CONSUMPTION, "OgeroApiClientError"), duration=90.0)
+    )
+
+    outage = PortalOutage()
+    outage.record_failure(NOW, "a", timedelta(hours=1), connection=True)
+    text = metrics.render([], outage, NOW)
+
+    assert 'ogero_requests_total{endpoint="consumption",status="ok"} 1' in text
+    assert (
+        'ogero_requests_total{endpoint="consumption",status="OgeroApiClientError"} 1'
+        in text
+    )
+    assert 'status="shared_cache"' not in text
+    assert 'ogero_cache_lookups_total{result="hit"} 1' in text
+    assert 'ogero_cache_lookups_total{result="miss"} 3' in text
+    assert 'ogero_cache_lookups_total{result="deferred"} 1' in text
+    assert "ogero_portal_outage 1" in text
+    assert "ogero_portal_outage_failures 1" in text
+    assert 'ogero_poll_duration_seconds_bucket{le="0.25"} 1' in text
+    assert 'ogero_poll_duration_seconds_bucket{le="0.5"} 2' in text
+    assert 'ogero_poll_duration_seconds_bucket{le="60.0"} 2' in text
+    assert 'ogero_poll_duration_seconds_bucket{le="+Inf"} 3' in text
+    assert "ogero_poll_duration_seconds_count 3" in text
+    assert text.endswith("\n")
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_metrics_view(
+    hass_client: ClientSessionGenerator,
+    loaded_entry: OgeroConfigEntry,
+) -> None:
+    """The view reports per-line state from the coordinators."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    coordinator.bills.record_failure(
+        RuntimeError("down"), coordinator.bills.fetched_at + timedelta(seconds=1)
+    )
+    client = await hass_client()
+
+    response = await client.get("/api/ogero/metrics")
+
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"].startswith("text/plain")
+    text = await response.text()
+    line = f'line="{TEST_ACCOUNT_SERIAL}"'
+    assert f"ogero_last_update_success{{{line}}} 1" in text
+    assert f'ogero_data_age_seconds{{{line},endpoint="bills"}}' in text
+    assert f'ogero_endpoint_failures{{{line},endpoint="bills"}} 1' in text
+    assert f'ogero_endpoint_failures{{{line},endpoint="consumption"}} 0' in text
+    assert 'ogero_requests_total{endpoint="bills",status="ok"}' in text
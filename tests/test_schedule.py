@@ -0,0 +1,102 @@
+"""Test Ogero time-of-day poll schedules."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ogero.const import (
+    CONF_POLL_SCHEDULE,
+    CONFIG_ENTRY_VERSION,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.ogero.schedule import PollSchedule
+from custom_components.ogero.scheduler import PollScheduler
+
+from .conftest import TEST_ACCOUNT_SERIAL, TEST_USERNAME
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DAY = date(2024, 6, 1)
+DAY_RULES = "08:00-20:00=30m; *=6h"
+
+
+def _at(hour: int, minute: int = 0, day: date = DAY) -> datetime:
+    """Return a local time of day on the test day."""
+    return datetime.combine(day, time(hour, minute), dt_util.get_default_time_zone())
+
+
+def test_parse_windows_and_default() -> None:
+    """Windows apply inside their hours and the '*' rule everywhere else."""
+    schedule = PollSchedule.parse(DAY_RULES)
+    assert schedule.interval_at(_at(8)) == timedelta(minutes=30)
+    assert schedule.interval_at(_at(19, 59)) == timedelta(minutes=30)
+    assert schedule.interval_at(_at(20)) == timedelta(hours=6)
+    assert schedule.interval_at(_at(3)) == timedelta(hours=6)
+
+
+def test_window_wrapping_midnight_without_default() -> None:
+    """Overnight windows wrap; outside every window the interval is unset."""
+    schedule = PollSchedule.parse("22:00-06:00=12h")
+    assert schedule.interval_at(_at(23)) == timedelta(hours=12)
+    assert schedule.interval_at(_at(5)) == timedelta(hours=12)
+    assert schedule.interval_at(_at(12)) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "08:00-20:00", "08:00-20:00=5m", "25:00-20:00=1h", "*=1h; *=2h", "9-5=1h"],
+)
+def test_parse_rejects_invalid_rules(text: str) -> None:
+    """Malformed rules and out-of-range intervals are refused."""
+    with pytest.raises(ValueError, match=r"[Pp]oll|time"):
+        PollSchedule.parse(text)
+
+
+def test_scheduler_uses_window_interval() -> None:
+    """The schedule replaces the configured interval when a rule matches."""
+    scheduler = PollScheduler(
+        DEFAULT_SCAN_INTERVAL, schedule=PollSchedule.parse("08:00-20:00=30m")
+    )
+    assert scheduler.next_delay(_at(10)) == timedelta(minutes=30)
+    assert scheduler.next_delay(_at(21)) == DEFAULT_SCAN_INTERVAL
+
+
+def test_quiet_hours_wake_when_busy_window_starts() -> None:
+    """A long overnight delay is cut short at the start of the busy window."""
+    scheduler = PollScheduler(
+        DEFAULT_SCAN_INTERVAL, schedule=PollSchedule.parse(DAY_RULES)
+    )
+    assert scheduler.next_delay(_at(23)) == timedelta(hours=6)
+    assert scheduler.next_delay(_at(5)) == timedelta(hours=3)
+    # Entering the quiet hours does not trigger an extra poll.
+    assert scheduler.next_delay(_at(19, 50)) == timedelta(minutes=30)
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_first_poll_uses_schedule_interval(
+    hass: HomeAssistant, parent_config_data: dict[str, str]
+) -> None:
+    """Lines set up during a schedule window wait that window's interval."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        source=SOURCE_USER,
+        data=parent_config_data,
+        options={CONF_POLL_SCHEDULE: "*=6h"},
+        unique_id=slugify(TEST_USERNAME),
+        version=CONFIG_ENTRY_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    assert coordinator.update_interval == timedelta(hours=6)
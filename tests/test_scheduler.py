@@ -0,0 +1,177 @@
+"""Test Ogero adaptive poll scheduling."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.ogero.const import (
+    CADENCE_GRACE,
+    CADENCE_MIN_INTERVALS,
+    CONF_MAX_DATA_AGE,
+    DEFAULT_SCAN_INTERVAL,
+    MAX_DATA_AGE_HOURS,
+    OUTAGE_BACKOFF_MAX,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+from custom_components.ogero.scheduler import (
+    PollScheduler,
+    PortalOutage,
+    UpstreamCadence,
+    get_max_data_age,
+    retry_backoff,
+)
+
+UPSTREAM_PERIOD = timedelta(hours=6)
+START = datetime(2024, 6, 1, 0, 0, tzinfo=UTC)
+
+
+def _learned_scheduler(*, adaptive: bool = True) -> PollScheduler:
+    """Return a scheduler that has seen a steady 6 hour upstream cadence."""
+    scheduler = PollScheduler(DEFAULT_SCAN_INTERVAL, adaptive=adaptive)
+    for step in range(CADENCE_MIN_INTERVALS + 1):
+        assert scheduler.cadence.observe(START + step * UPSTREAM_PERIOD)
+    return scheduler
+
+
+def test_cadence_ignores_repeated_and_missing_values() -> None:
+    """Only newer last_update values count as upstream refreshes."""
+    cadence = UpstreamCadence()
+    assert not cadence.observe(None)
+    assert cadence.observe(START)
+    assert not cadence.observe(START)
+    assert not cadence.observe(START - timedelta(hours=1))
+    assert cadence.last_update == START
+    assert cadence.period is None
+
+
+def test_cadence_learns_median_period() -> None:
+    """An outlier gap does not move the learned period."""
+    cadence = UpstreamCadence()
+    stamps = [START, START + UPSTREAM_PERIOD, START + 2 * UPSTREAM_PERIOD]
+    stamps += [stamps[-1] + timedelta(hours=30), stamps[-1] + timedelta(hours=36)]
+    for stamp in stamps:
+        cadence.observe(stamp)
+    assert cadence.period == UPSTREAM_PERIOD
+    assert cadence.expected_next == stamps[-1] + UPSTREAM_PERIOD
+
+
+def test_scheduler_uses_interval_until_cadence_is_learned() -> None:
+    """Without enough history the configured interval applies."""
+    scheduler = PollScheduler(DEFAULT_SCAN_INTERVAL)
+    scheduler.cadence.observe(START)
+    assert scheduler.next_delay(START) == DEFAULT_SCAN_INTERVAL
+
+
+def test_scheduler_polls_just_after_expected_update() -> None:
+    """Once learned, the next poll lands shortly after the next upstream refresh."""
+    scheduler = _learned_scheduler()
+    last = scheduler.cadence.last_update
+    assert last is not None
+    now = last + timedelta(minutes=10)
+    expected = last + UPSTREAM_PERIOD + CADENCE_GRACE - now
+    assert scheduler.next_delay(now) == expected
+    assert expected > DEFAULT_SCAN_INTERVAL
+
+
+def test_scheduler_falls_back_when_upstream_is_late() -> None:
+    """If the expected refresh has passed, poll at the configured interval."""
+    scheduler = _learned_scheduler()
+    last = scheduler.cadence.last_update
+    assert last is not None
+    now = last + UPSTREAM_PERIOD + timedelta(hours=1)
+    assert scheduler.next_delay(now) == DEFAULT_SCAN_INTERVAL
+
+
+def test_scheduler_disabled_keeps_fixed_interval() -> None:
+    """Adaptive polling can be turned off."""
+    scheduler = _learned_scheduler(adaptive=False)
+    last = scheduler.cadence.last_update
+    assert last is not None
+    assert scheduler.next_delay(last) == DEFAULT_SCAN_INTERVAL
+
+
+def test_scheduler_never_polls_faster_than_interval_for_fast_upstream() -> None:
+    """An upstream cadence shorter than the interval keeps the interval."""
+    scheduler = PollScheduler(timedelta(hours=2))
+    for step in range(CADENCE_MIN_INTERVALS + 1):
+        scheduler.cadence.observe(START + step * timedelta(minutes=30))
+    assert scheduler.next_delay(START) == timedelta(hours=2)
+
+
+def test_retry_backoff_doubles_up_to_cap() -> None:
+    """Failed endpoints back off exponentially with an upper bound."""
+    assert retry_backoff(1) == RETRY_BACKOFF_BASE
+    assert retry_backoff(2) == 2 * RETRY_BACKOFF_BASE
+    assert retry_backoff(3) == 4 * RETRY_BACKOFF_BASE
+    assert retry_backoff(100) == RETRY_BACKOFF_MAX
+
+
+def test_portal_outage_escalates_shared_backoff() -> None:
+    """Each failure pushes the shared retry further, up to the poll interval."""
+    outage = PortalOutage()
+    day = timedelta(days=1)
+    assert outage.try_acquire(START, day)
+
+    outage.record_failure(START, "a", day, connection=True)
+    assert not outage.try_acquire(START, day)
+    # One request probes the portal at the retry time; the rest keep waiting.
+    assert outage.try_acquire(START + RETRY_BACKOFF_BASE, day)
+    assert not outage.try_acquire(START + RETRY_BACKOFF_BASE, day)
+
+    now = START
+    for _ in range(10):
+        now += timedelta(hours=1)
+        outage.record_failure(now, "a", day, connection=True)
+    assert outage.retry_at == now + OUTAGE_BACKOFF_MAX
+    assert OUTAGE_BACKOFF_MAX > RETRY_BACKOFF_MAX
+    assert outage.since == START
+    # A line polling more often than that probes on its own interval.
+    outage.record_failure(now, "a", DEFAULT_SCAN_INTERVAL, connection=True)
+    assert outage.retry_at == now + DEFAULT_SCAN_INTERVAL
+
+    outage.record_success()
+    assert outage.try_acquire(now, day)
+    assert outage.as_dict() == {
+        "failures": 0,
+        "since": None,
+        "retry_at": None,
+        "failing_lines": [],
+        "waiting": 0,
+    }
+
+
+def test_portal_outage_needs_several_lines_or_a_connection_failure() -> None:
+    """One line's errors are its own problem unless the portal is unreachable."""
+    outage = PortalOutage()
+    outage.record_failure(START, "a", DEFAULT_SCAN_INTERVAL, connection=False)
+    outage.record_failure(START, "a", DEFAULT_SCAN_INTERVAL, connection=False)
+    assert outage.retry_at is None
+
+    outage.record_failure(START, "b", DEFAULT_SCAN_INTERVAL, connection=False)
+    assert outage.retry_at == START + RETRY_BACKOFF_BASE
+
+
+def test_portal_outage_wakes_waiters_when_it_ends() -> None:
+    """Lines held back by the outage are told as soon as the portal answers."""
+    outage = PortalOutage()
+    woken: list[str] = []
+    outage.record_failure(START, "a", DEFAULT_SCAN_INTERVAL, connection=True)
+    outage.add_waiter(lambda: woken.append("a"))
+    outage.add_waiter(waiter := lambda: woken.append("b"))
+    outage.remove_waiter(waiter)
+
+    outage.record_success()
+    outage.record_success()
+    assert woken == ["a"]
+
+
+def test_max_data_age_option() -> None:
+    """The staleness policy is off unless a positive number of hours is set."""
+    assert get_max_data_age({}) is None
+    assert get_max_data_age({CONF_MAX_DATA_AGE: 0}) is None
+    assert get_max_data_age({CONF_MAX_DATA_AGE: "bad"}) is None
+    assert get_max_data_age({CONF_MAX_DATA_AGE: 12}) == timedelta(hours=12)
+    assert get_max_data_age({CONF_MAX_DATA_AGE: 10**6}) == timedelta(
+        hours=MAX_DATA_AGE_HOURS
+    )
@@ -8,11 +8,18 @@ from unittest.mock import MagicMock
 import pytest
 from homeassistant.helpers import entity_registry as er
 
-from custom_components.ogero.sensor import ENTITY_DESCRIPTIONS, QUOTA, OgeroSensor
+from custom_components.ogero.coordinator import build_coordinator_data
+from custom_components.ogero.sensor import (
+    ENTITY_DESCRIPTIONS,
+    OUTSTANDING_BALANCE,
+    QUOTA,
+    OgeroSensor,
+)
 from tests.conftest import TEST_ACCOUNT_SERIAL
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from pyogero.types import BillInfo, ConsumptionInfo
 
     from custom_components.ogero.data import OgeroConfigEntry
 
@@ -72,3 +79,18 @@ async def test_sensor_unavailable_when_coordinator_has_no_data(
     empty_coordinator.data = None
     sensor = OgeroSensor(empty_coordinator, coordinator.account, desc)
     assert sensor.available is False
+
+
+def test_value_fn_reads_matching_field(
+    consumption_info: ConsumptionInfo, bill_info: BillInfo
+) -> None:
+    """Each description's accessor returns the coordinator field of its key."""
+    data = build_coordinator_data(consumption_info, bill_info)
+    for description in ENTITY_DESCRIPTIONS:
+        assert description.value_fn(data) == getattr(data, description.key)
+    balance = next(d for d in ENTITY_DESCRIPTIONS if d.key == OUTSTANDING_BALANCE)
+    assert balance.attrs_fn(data) == {
+        "unpaid_bills": [bill.as_dict() for bill in data.unpaid_bills]
+    }
+    quota = next(d for d in ENTITY_DESCRIPTIONS if d.key == QUOTA)
+    assert quota.attrs_fn(data) is None
@@ -0,0 +1,268 @@
+"""Test Ogero service actions."""
+
+from __future__ import annotations
+
+import asyncio
+import pstats
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+from pyogero.types import Bill, BillAmount, BillInfo, BillStatus
+
+from custom_components.ogero.api import OgeroApiClientCommunicationError
+from custom_components.ogero.const import DOMAIN, ENDPOINT_BILLS
+from custom_components.ogero.data import get_domain_data
+from custom_components.ogero.services import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ENDPOINTS,
+    ATTR_LINE,
+    SERVICE_GET_BILLS,
+    SERVICE_GET_DATA,
+    SERVICE_PROFILE,
+    SERVICE_REFRESH,
+)
+from tests.conftest import TEST_ACCOUNT_SERIAL, TEST_ACCOUNT_SERIAL_2
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+COALESCED_FETCHES = 2
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_get_bills_reads_cache(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry, bill_info: BillInfo
+) -> None:
+    """The action returns cached bills per line and never calls Ogero."""
+    client = loaded_entry.runtime_data.client
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    coordinator.bills.record_success(bill_info, dt_util.utcnow())
+    paid = BillInfo(
+        total_outstanding=BillAmount(amount=0, currency="LBP"),
+        bills=[
+            Bill(
+                date=datetime(2024, 4, 1),  # noqa: DTZ001
+                amount=BillAmount(amount=60000, currency="LBP"),
+                status=BillStatus.PAID,
+            )
+        ],
+    )
+    loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL_2].bills.record_success(
+        paid, dt_util.utcnow()
+    )
+    client.async_get_bills.reset_mock()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_BILLS,
+        {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+
+    lines = response["lines"]
+    assert set(lines) == {TEST_ACCOUNT_SERIAL, TEST_ACCOUNT_SERIAL_2}
+    assert lines[TEST_ACCOUNT_SERIAL]["outstanding_balance"] == int(
+        bill_info.total_outstanding.amount
+    )
+    assert lines[TEST_ACCOUNT_SERIAL]["bills"] == [
+        {"period": "2024-05", "amount": "LBP 75000", "status": "UNPAID"}
+    ]
+    assert lines[TEST_ACCOUNT_SERIAL_2]["outstanding_balance"] == 0
+    assert lines[TEST_ACCOUNT_SERIAL_2]["bills"] == [
+        {"period": "2024-04", "amount": "LBP 60000", "status": "PAID"}
+    ]
+    client.async_get_bills.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_api_client", "loaded_entry")
+async def test_get_bills_unknown_line(hass: HomeAssistant) -> None:
+    """Asking for a line that is not loaded is a validation error."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_BILLS,
+            {ATTR_LINE: "missing|line"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_get_data_returns_cached_lines(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """The action returns every line's cached data in one payload."""
+    client = loaded_entry.runtime_data.client
+    client.async_get_consumption.reset_mock()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_DATA,
+        {ATTR_LINE: TEST_ACCOUNT_SERIAL_2},
+        blocking=True,
+        return_response=True,
+    )
+
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL_2]
+    assert response["lines"] == {
+        TEST_ACCOUNT_SERIAL_2: {
+            "account": str(coordinator.account),
+            "last_update_success": True,
+            "data": coordinator.data.as_dict(),
+        }
+    }
+    client.async_get_consumption.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_login_device_selects_its_lines(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """Targeting the login device (the totals) selects every line of the login."""
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, loaded_entry.entry_id)}
+    )
+    assert device is not None
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_DATA,
+        {ATTR_DEVICE_ID: device.id},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert set(response["lines"]) == {TEST_ACCOUNT_SERIAL, TEST_ACCOUNT_SERIAL_2}
+
+
+async def test_refresh_fetches_only_requested_endpoints(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """The refresh action fetches the chosen endpoints of the chosen lines."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    mock_api_client.async_get_consumption.reset_mock()
+    mock_api_client.async_get_bills.reset_mock()
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REFRESH,
+        {ATTR_LINE: [TEST_ACCOUNT_SERIAL], ATTR_ENDPOINTS: [ENDPOINT_BILLS]},
+        blocking=True,
+    )
+
+    mock_api_client.async_get_bills.assert_awaited_once()
+    mock_api_client.async_get_consumption.assert_not_called()
+
+
+async def test_refresh_ignores_spent_budget(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """The refresh action fetches past the budget and reports failed calls."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    budget = get_domain_data(hass).budget
+    while budget.used < budget.capacity:
+        budget.try_acquire("other", "", dt_util.utcnow(), force=True)
+    mock_api_client.async_get_bills.reset_mock()
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REFRESH,
+        {ATTR_LINE: [TEST_ACCOUNT_SERIAL], ATTR_ENDPOINTS: [ENDPOINT_BILLS]},
+        blocking=True,
+    )
+    mock_api_client.async_get_bills.assert_awaited_once()
+
+    # Only bills fail, so the line still updates, but the action must not
+    # claim the bills were refreshed.
+    mock_api_client.async_get_bills.side_effect = OgeroApiClientCommunicationError(
+        "offline"
+    )
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_REFRESH,
+            {ATTR_LINE: [TEST_ACCOUNT_SERIAL]},
+            blocking=True,
+        )
+
+
+async def test_refresh_requests_are_coalesced(
+    hass: HomeAssistant,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+    bill_info: BillInfo,
+) -> None:
+    """Requests made during a refresh share one follow-up fetch."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    mock_api_client.async_get_bills.reset_mock()
+    release = asyncio.Event()
+
+    async def _slow_bills(*_args: object) -> BillInfo:
+        await release.wait()
+        return bill_info
+
+    mock_api_client.async_get_bills.side_effect = _slow_bills
+    first = hass.async_create_task(
+        coordinator.async_refresh_endpoints([ENDPOINT_BILLS])
+    )
+    await asyncio.sleep(0)
+    waiting = [
+        hass.async_create_task(coordinator.async_refresh_endpoints([ENDPOINT_BILLS]))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    # One fetch for the first request, one shared by the three that followed.
+    assert mock_api_client.async_get_bills.await_count == COALESCED_FETCHES
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_profile_captures_next_refresh(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry, tmp_path: Path
+) -> None:
+    """The profile action saves stats once the armed cycles have run."""
+    hass.config.config_dir = str(tmp_path)
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROFILE,
+        {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    path = Path(response["path"])
+    assert path.parent == tmp_path
+
+    # Only one capture per login at a time.
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id},
+            blocking=True,
+        )
+
+    await loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert loaded_entry.runtime_data.profiler is None
+    assert pstats.Stats(str(path)).total_calls > 0
@@ -0,0 +1,282 @@
+"""Test the response cache shared by Home Assistant instances."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.ogero.api import Account
+from custom_components.ogero.const import (
+    CONFIG_ENTRY_VERSION,
+    DOMAIN,
+    ENDPOINT_BILLS,
+    ENDPOINT_CONSUMPTION,
+    SHARED_CACHE_LEASE,
+)
+from custom_components.ogero.shared_cache import SharedLookup, SharedResponseCache
+
+from .conftest import TEST_ACCOUNT_SERIAL, TEST_PASSWORD, TEST_USERNAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pyogero.types import BillInfo, ConsumptionInfo
+
+    from custom_components.ogero.coordinator import OgeroDataUpdateCoordinator
+    from custom_components.ogero.data import OgeroConfigEntry
+
+POLL_CYCLES = 3
+
+
+def _client(consumption_info: ConsumptionInfo, bill_info: BillInfo) -> MagicMock:
+    """Return the API client of one instance."""
+    client = MagicMock()
+    client.async_login = AsyncMock(return_value=True)
+    client.async_get_accounts = AsyncMock(
+        return_value=[Account(internet="12345", phone="01234567")]
+    )
+    client.async_get_consumption = AsyncMock(return_value=consumption_info)
+    client.async_get_bills = AsyncMock(return_value=bill_info)
+    client.async_close = AsyncMock()
+    return client
+
+
+async def test_one_instance_fetches_for_all(
+    hass: HomeAssistant, tmp_path: Path, consumption_info: ConsumptionInfo
+) -> None:
+    """The first instance leases the endpoint; the others wait, then reuse it."""
+    path = tmp_path / "ogero_user.json"
+    primary = SharedResponseCache(hass, path)
+    standby = SharedResponseCache(hass, path)
+    now = dt_util.utcnow()
+    due = now - timedelta(minutes=1)
+
+    lookup = await primary.async_lookup(
+        TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, now, due
+    )
+    assert lookup.claimed
+    lookup = await standby.async_lookup(
+        TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, now, due
+    )
+    assert not lookup.claimed
+    assert lookup.result is None
+    assert lookup.retry_at == now + SHARED_CACHE_LEASE
+
+    await primary.async_store(
+        TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, consumption_info, now
+    )
+    lookup = await standby.async_lookup(
+        TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, now, due
+    )
+    assert lookup.result == consumption_info
+    assert lookup.fetched_at == now
+
+    # A result from before the endpoint fell due again is fetched anew.
+    later = now + timedelta(hours=1)
+    lookup = await standby.async_lookup(
+        TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, later, later
+    )
+    assert lookup.claimed
+
+
+async def test_failed_fetch_releases_the_lease(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Another instance may fetch at once when the leaseholder fails."""
+    path = tmp_path / "ogero_user.json"
+    primary = SharedResponseCache(hass, path)
+    standby = SharedResponseCache(hass, path)
+    now = dt_util.utcnow()
+
+    assert (
+        await primary.async_lookup(TEST_ACCOUNT_SERIAL, ENDPOINT_BILLS, now, now)
+    ).claimed
+    await primary.async_release(TEST_ACCOUNT_SERIAL, ENDPOINT_BILLS)
+
+    assert (
+        await standby.async_lookup(TEST_ACCOUNT_SERIAL, ENDPOINT_BILLS, now, now)
+    ).claimed
+
+
+async def test_coordinator_uses_result_of_another_instance(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+    consumption_info: ConsumptionInfo,
+) -> None:
+    """A line fetched by another instance is not requested from Ogero again."""
+    path = tmp_path / "ogero_user.json"
+    other = SharedResponseCache(hass, path)
+    fetched = dt_util.utcnow() - timedelta(minutes=5)
+    await other.async_store(
+        TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, consumption_info, fetched
+    )
+    await other.async_store(
+        TEST_ACCOUNT_SERIAL,
+        ENDPOINT_BILLS,
+        mock_api_client.async_get_bills.return_value,
+        fetched,
+    )
+    loaded_entry.runtime_data.shared_cache = SharedResponseCache(hass, path)
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    mock_api_client.async_get_consumption.reset_mock()
+    mock_api_client.async_get_bills.reset_mock()
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert mock_api_client.async_get_consumption.await_count == 0
+    assert mock_api_client.async_get_bills.await_count == 0
+    assert coordinator.data.total_consumption == consumption_info.total_consumption
+    assert coordinator.data.data_fetched == fetched
+
+
+async def test_manual_refresh_skips_older_shared_result(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+) -> None:
+    """A refresh asked for by the user does not settle for a cached result."""
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    path = tmp_path / "ogero_user.json"
+    other = SharedResponseCache(hass, path)
+    fetched = dt_util.utcnow() - timedelta(minutes=5)
+    for endpoint, fetch in (
+        (ENDPOINT_CONSUMPTION, mock_api_client.async_get_consumption),
+        (ENDPOINT_BILLS, mock_api_client.async_get_bills),
+    ):
+        await other.async_store(
+            TEST_ACCOUNT_SERIAL, endpoint, fetch.return_value, fetched
+        )
+    loaded_entry.runtime_data.shared_cache = SharedResponseCache(hass, path)
+    mock_api_client.async_get_consumption.reset_mock()
+    mock_api_client.async_get_bills.reset_mock()
+
+    await coordinator.async_refresh()
+
+    assert mock_api_client.async_get_consumption.await_count == 1
+    assert mock_api_client.async_get_bills.await_count == 1
+    assert coordinator.data.data_fetched > fetched
+
+
+async def test_manual_refresh_waits_for_other_instance(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    loaded_entry: OgeroConfigEntry,
+    mock_api_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A refresh waits for the lease holder's result instead of deferring."""
+    monkeypatch.setattr(
+        "custom_components.ogero.coordinator.SHARED_CACHE_WAIT",
+        timedelta(milliseconds=10),
+    )
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    await coordinator.async_refresh()
+    path = tmp_path / "ogero_user.json"
+    other = SharedResponseCache(hass, path)
+    leased = dt_util.utcnow()
+    assert (
+        await other.async_lookup(
+            TEST_ACCOUNT_SERIAL, ENDPOINT_CONSUMPTION, leased, leased
+        )
+    ).claimed
+    cache = SharedResponseCache(hass, path)
+    looked_up = asyncio.Event()
+    lookup = cache.async_lookup
+
+    async def _lookup(*args: Any) -> SharedLookup:
+        result = await lookup(*args)
+        looked_up.set()
+        return result
+
+    monkeypatch.setattr(cache, "async_lookup", _lookup)
+    loaded_entry.runtime_data.shared_cache = cache
+    mock_api_client.async_get_consumption.reset_mock()
+
+    refresh = hass.async_create_task(
+        coordinator.async_refresh_endpoints([ENDPOINT_CONSUMPTION])
+    )
+    await looked_up.wait()
+    await other.async_store(
+        TEST_ACCOUNT_SERIAL,
+        ENDPOINT_CONSUMPTION,
+        mock_api_client.async_get_consumption.return_value,
+        leased,
+    )
+    await refresh
+
+    assert coordinator.last_update_success
+    assert mock_api_client.async_get_consumption.await_count == 0
+    assert coordinator.consumption.fetched_at == leased
+
+
+async def _async_setup_instance(
+    hass: HomeAssistant, path: Path, client: MagicMock, name: str
+) -> OgeroDataUpdateCoordinator:
+    """Set up the login as one instance would and return its line coordinator."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        source=SOURCE_USER,
+        data={"username": TEST_USERNAME, "password": TEST_PASSWORD},
+        unique_id=name,
+        version=CONFIG_ENTRY_VERSION,
+    )
+    entry.add_to_hass(hass)
+    # Entities would clash between the instances; a listener keeps polls going.
+    with (
+        patch("custom_components.ogero.api.create_api_client", return_value=client),
+        patch("custom_components.ogero.PLATFORMS", []),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    entry.runtime_data.shared_cache = SharedResponseCache(hass, path)
+    coordinator = entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    entry.async_on_unload(coordinator.async_add_listener(lambda: None))
+    return coordinator
+
+
+async def test_instances_out_of_phase_take_turns(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    consumption_info: ConsumptionInfo,
+    bill_info: BillInfo,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Of two instances polling a line at different times, only one asks Ogero."""
+    path = tmp_path / "ogero_user.json"
+    clients = [_client(consumption_info, bill_info) for _ in range(2)]
+    coordinators = []
+    for index, client in enumerate(clients):
+        coordinators.append(
+            await _async_setup_instance(hass, path, client, f"instance_{index}")
+        )
+        # The second instance starts, and so polls, 20 minutes later.
+        freezer.tick(timedelta(minutes=20))
+
+    interval = coordinators[0].scheduler.current_interval(dt_util.utcnow())
+    for _ in range(POLL_CYCLES * 3):
+        freezer.tick(interval / 3)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    fetches = [client.async_get_consumption.await_count for client in clients]
+    assert fetches == [POLL_CYCLES, 0]
+    assert coordinators[1].consumption.fetched_at == (
+        coordinators[0].consumption.fetched_at
+    )
@@ -0,0 +1,175 @@
+"""Scheduler behaviour over days of simulated time."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from custom_components.ogero.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_POLL_SCHEDULE,
+    CONF_REQUEST_BUDGET,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    ENDPOINTS,
+    MIN_REQUEST_BUDGET,
+    MIN_SCAN_INTERVAL,
+)
+
+from .simulation import (
+    SIMULATION_STEP,
+    FakeOgeroBackend,
+    Outage,
+    SimulationReport,
+    async_simulate,
+)
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+EPOCH = datetime(2024, 6, 3, tzinfo=UTC)
+THREE_DAYS = timedelta(days=3)
+# While Ogero is down, one probe per poll interval is shared by every line,
+# plus the few the backoff makes on its way up from 15 minutes.
+OUTAGE_EXTRA_PROBES = 3
+# The cadence is learned from a few upstream updates, within the first day.
+CADENCE_LEARNING = timedelta(days=1)
+ORDER_OF_MAGNITUDE = 10
+BUSY_START = 8
+BUSY_END = 20
+
+
+async def test_adaptive_polling_follows_upstream_cadence(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Once the cadence is learned, an order of magnitude fewer polls keep lines fresh.
+
+    Both runs poll at the shortest interval, so that Ogero's 6 hour period
+    leaves room for a tenfold cut (an hourly interval allows at most 6x).
+    Learning takes the first day; the days after it are compared.
+    """
+    interval = {CONF_SCAN_INTERVAL: int(MIN_SCAN_INTERVAL.total_seconds())}
+    fixed = await async_simulate(
+        hass,
+        freezer,
+        FakeOgeroBackend(EPOCH),
+        THREE_DAYS,
+        {**interval, CONF_ADAPTIVE_POLLING: False},
+    )
+    # The clock only moves forward, so the second run starts where the first ended.
+    adaptive = await async_simulate(
+        hass, freezer, FakeOgeroBackend(EPOCH + THREE_DAYS), THREE_DAYS, interval
+    )
+
+    learned = _requests_after(adaptive, EPOCH + THREE_DAYS + CADENCE_LEARNING)
+    assert learned * ORDER_OF_MAGNITUDE <= _requests_after(
+        fixed, EPOCH + CADENCE_LEARNING
+    )
+    for report in (fixed, adaptive):
+        assert report.peak_concurrency <= len(report.staleness)
+        for stale in report.staleness.values():
+            assert stale.worst <= MIN_SCAN_INTERVAL + SIMULATION_STEP
+
+
+def _requests_after(report: SimulationReport, start: datetime) -> int:
+    """Return the backend calls made from start on."""
+    return sum(1 for moment, _, _ in report.requests if moment >= start)
+
+
+def _outage_probes(outage: Outage) -> float:
+    """Return the most requests a shared probe makes during an outage."""
+    return (outage.end - outage.start) / DEFAULT_SCAN_INTERVAL + OUTAGE_EXTRA_PROBES
+
+
+def _recovered_in_time(report: SimulationReport, outage: Outage) -> bool:
+    """
+    Return whether every line caught up within about one interval of Ogero.
+
+    At worst, usage was published just after a line's last poll before the
+    outage, and the next probe comes one interval after Ogero is back.
+    """
+    bound = (outage.end - outage.start) + 2 * DEFAULT_SCAN_INTERVAL + SIMULATION_STEP
+    return all(stale.worst <= bound for stale in report.staleness.values())
+
+
+async def test_outage_backs_off(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A day-long outage costs one probe per interval and lines recover after."""
+    backend = FakeOgeroBackend(EPOCH, lines=1)
+    outage = Outage(EPOCH + timedelta(days=1), EPOCH + timedelta(days=2))
+    backend.outages.append(outage)
+    report = await async_simulate(
+        hass, freezer, backend, THREE_DAYS, {CONF_ADAPTIVE_POLLING: False}
+    )
+
+    during = [method for moment, method, _ in report.requests if outage.covers(moment)]
+    # Without the shared probe, both endpoints would keep retrying.
+    assert 0 < len(during) <= _outage_probes(outage)
+    assert _recovered_in_time(report, outage)
+
+
+async def test_outage_is_probed_once_for_all_lines(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Lines share one probe while Ogero is down and all recover with it."""
+    backend = FakeOgeroBackend(EPOCH, lines=4)
+    outage = Outage(EPOCH + timedelta(days=1), EPOCH + timedelta(days=2))
+    backend.outages.append(outage)
+    report = await async_simulate(
+        hass, freezer, backend, THREE_DAYS, {CONF_ADAPTIVE_POLLING: False}
+    )
+
+    during = [moment for moment, _, _ in report.requests if outage.covers(moment)]
+    # Lines already polling when Ogero went down may each fail once.
+    assert len(during) <= _outage_probes(outage) + len(backend.accounts)
+    assert _recovered_in_time(report, outage)
+
+
+async def test_request_budget_caps_every_hour(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Lines that want more than the budget share it without exceeding it."""
+    backend = FakeOgeroBackend(EPOCH, lines=4)
+    report = await async_simulate(
+        hass,
+        freezer,
+        backend,
+        timedelta(days=1),
+        {
+            CONF_ADAPTIVE_POLLING: False,
+            CONF_SCAN_INTERVAL: int(MIN_SCAN_INTERVAL.total_seconds()),
+            CONF_REQUEST_BUDGET: MIN_REQUEST_BUDGET,
+        },
+    )
+
+    assert max(report.per_hour.values()) <= MIN_REQUEST_BUDGET
+    # Every line keeps being polled after its first refresh.
+    for account in backend.accounts:
+        assert report.by_line[account.serial] > len(ENDPOINTS)
+
+
+async def test_quiet_hours_thin_out_night_polls(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A time-of-day schedule moves requests into its busy window."""
+    report = await async_simulate(
+        hass,
+        freezer,
+        FakeOgeroBackend(EPOCH, lines=1, upstream_period=DEFAULT_SCAN_INTERVAL),
+        THREE_DAYS,
+        {
+            CONF_ADAPTIVE_POLLING: False,
+            CONF_POLL_SCHEDULE: f"{BUSY_START:02}:00-{BUSY_END:02}:00=30m; *=6h",
+        },
+    )
+
+    day = sum(
+        count
+        for hour, count in report.by_local_hour.items()
+        if BUSY_START <= hour < BUSY_END
+    )
+    night = report.total_requests - day
+    assert night * 4 < day
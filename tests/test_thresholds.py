@@ -0,0 +1,67 @@
+"""Test Ogero quota thresholds."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.ogero.const import (
+    CONF_QUOTA_THRESHOLDS,
+    DEFAULT_QUOTA_THRESHOLDS,
+    EVENT_QUOTA_THRESHOLD,
+)
+from custom_components.ogero.thresholds import (
+    get_quota_thresholds,
+    parse_quota_thresholds,
+    reached_threshold,
+)
+from tests.conftest import TEST_ACCOUNT_SERIAL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ogero.data import OgeroConfigEntry
+
+
+def test_parse_quota_thresholds() -> None:
+    """Thresholds are sorted and de-duplicated; bad values are refused."""
+    assert parse_quota_thresholds("80, 50%,100, 80,") == (50, 80, 100)
+    assert parse_quota_thresholds([90]) == (90,)
+    for raw in ("0", "abc", "50.5", "2000"):
+        with pytest.raises(ValueError, match="Invalid quota threshold"):
+            parse_quota_thresholds(raw)
+    assert get_quota_thresholds({}) == DEFAULT_QUOTA_THRESHOLDS
+    assert get_quota_thresholds({CONF_QUOTA_THRESHOLDS: "x"}) == (
+        DEFAULT_QUOTA_THRESHOLDS
+    )
+
+
+def test_reached_threshold() -> None:
+    """The highest threshold at or below the usage is reached."""
+    assert reached_threshold((50, 80, 100), None) == 0
+    assert reached_threshold((50, 80, 100), 49.9) == 0
+    assert reached_threshold((50, 80, 100), 80.0) == 80  # noqa: PLR2004
+    assert reached_threshold((50, 80, 100), 250.0) == 100  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_threshold_event_fires_once_per_crossing(
+    hass: HomeAssistant, loaded_entry: OgeroConfigEntry
+) -> None:
+    """Only climbing past a threshold fires, with the highest one crossed."""
+    events = async_capture_events(hass, EVENT_QUOTA_THRESHOLD)
+    coordinator = loaded_entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL]
+    data = coordinator.data
+    assert data.usage_percent is not None
+    assert data.usage_percent < DEFAULT_QUOTA_THRESHOLDS[0]
+
+    for usage_percent in (85.0, 90.0, 20.0, 120.0):
+        coordinator.async_set_updated_data(replace(data, usage_percent=usage_percent))
+    await hass.async_block_till_done()
+
+    assert [event.data["threshold"] for event in events] == [80, 100]
+    assert events[0].data["line"] == TEST_ACCOUNT_SERIAL
+    assert events[1].data["usage_percent"] == 120.0  # noqa: PLR2004
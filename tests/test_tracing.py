@@ -0,0 +1,176 @@
+"""Test tracing spans."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.util import slugify
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ogero.const import (
+    CONF_TRACE_EXPORT,
+    CONFIG_ENTRY_VERSION,
+    DOMAIN,
+    TRACE_EXPORT_MEMORY,
+)
+from custom_components.ogero.tracing import (
+    InMemoryCollector,
+    JsonLinesExporter,
+    OgeroTracer,
+    Span,
+)
+from tests.conftest import TEST_ACCOUNT_SERIAL, TEST_USERNAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+
+def test_spans_nest_and_record_outcome() -> None:
+    """Children share the trace of their parent; errors become the outcome."""
+    collector = InMemoryCollector()
+    tracer = OgeroTracer(collector)
+
+    with tracer.span("refresh", line="a") as refresh:
+        with tracer.span("fetch", endpoint="bills"):
+            pass
+        with pytest.raises(KeyError), tracer.span("fetch", endpoint="consumption"):
+            raise KeyError
+
+    fetch_bills, fetch_consumption, root = collector.as_list()
+    assert refresh is not None
+    assert root["parent_id"] is None
+    assert root["tags"] == {"line": "a"}
+    assert root["outcome"] == "ok"
+    assert {fetch_bills["parent_id"], fetch_consumption["parent_id"]} == {
+        refresh.span_id
+    }
+    assert fetch_bills["trace_id"] == root["trace_id"]
+    assert fetch_consumption["outcome"] == "KeyError"
+
+
+def test_span_after_parent_ended_starts_new_trace() -> None:
+    """Work scheduled from inside a finished span is not attached to it."""
+    collector = InMemoryCollector()
+    tracer = OgeroTracer(collector)
+    with tracer.span("setup_entry") as setup:
+        assert setup is not None
+        # Simulate a task that copied the context while setup was running.
+        setup.duration = 0.0
+        with tracer.span("refresh"):
+            pass
+    refresh = collector.as_list()[0]
+    assert refresh["parent_id"] is None
+    assert refresh["trace_id"] != setup.trace_id
+
+
+def test_disabled_tracer_yields_nothing() -> None:
+    """Without an exporter no span is created."""
+    with OgeroTracer().span("refresh") as span:
+        assert span is None
+
+
+async def test_json_lines_exporter(hass: HomeAssistant, tmp_path: Path) -> None:
+    """A finished trace is appended to the file, one span per line."""
+    path = tmp_path / "traces.jsonl"
+    tracer = OgeroTracer(JsonLinesExporter(hass, str(path)))
+    with tracer.span("setup_entry"), tracer.span("login"):
+        pass
+    await hass.async_block_till_done()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["login", "setup_entry"]
+
+
+async def test_json_lines_exporter_keeps_traces_apart(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Spans of traces that overlap are written grouped by trace."""
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonLinesExporter(hass, str(path))
+    first = Span("refresh", "a", None, 0.0, {})
+    second = Span("refresh", "b", None, 0.0, {})
+    for span in (
+        Span("fetch", "a", first.span_id, 0.0, {}),
+        Span("fetch", "b", second.span_id, 0.0, {}),
+        first,
+        second,
+    ):
+        exporter.export(span)
+    await hass.async_block_till_done()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(line["trace_id"], line["name"]) for line in lines] == [
+        ("a", "fetch"),
+        ("a", "refresh"),
+        ("b", "fetch"),
+        ("b", "refresh"),
+    ]
+
+
+async def test_json_lines_exporter_writes_late_spans(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """A span that ends after its root is written, not buffered forever."""
+    path = tmp_path / "traces.jsonl"
+    tracer = OgeroTracer(JsonLinesExporter(hass, str(path)))
+    release = asyncio.Event()
+
+    async def _background() -> None:
+        with tracer.span("refresh"):
+            await release.wait()
+
+    # The task starts eagerly, inside the fetch span, like a refresh woken up
+    # by another line's request.
+    with tracer.span("refresh"), tracer.span("fetch"):
+        task = hass.async_create_task(_background())
+    release.set()
+    await task
+    await hass.async_block_till_done()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["fetch", "refresh", "refresh"]
+    assert len({line["trace_id"] for line in lines}) == 1
+
+
+@pytest.mark.usefixtures("mock_api_client")
+async def test_setup_and_refresh_are_traced(
+    hass: HomeAssistant, parent_config_data: dict[str, str]
+) -> None:
+    """The in-memory collector sees setup, discovery and line refreshes."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        source=SOURCE_USER,
+        data=parent_config_data,
+        options={CONF_TRACE_EXPORT: TRACE_EXPORT_MEMORY},
+        unique_id=slugify(TEST_USERNAME),
+        version=CONFIG_ENTRY_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    await entry.runtime_data.coordinators[TEST_ACCOUNT_SERIAL].async_refresh()
+
+    collector = entry.runtime_data.tracer.exporter
+    assert isinstance(collector, InMemoryCollector)
+    spans = collector.as_list()
+    by_id = {span["span_id"]: span for span in spans}
+    parents = {
+        span["name"]: by_id[span["parent_id"]]["name"]
+        for span in spans
+        if span["parent_id"] in by_id and span["name"] in {"login", "fetch_accounts"}
+    }
+    assert parents == {"login": "fetch_accounts", "fetch_accounts": "setup_entry"}
+    fetches = [
+        span
+        for span in spans
+        if span["name"] == "fetch" and span["tags"]["line"] == TEST_ACCOUNT_SERIAL
+    ]
+    assert {span["tags"]["endpoint"] for span in fetches} == {"consumption", "bills"}
+    assert all(by_id[span["parent_id"]]["name"] == "refresh" for span in fetches)
+    assert all(span["outcome"] == "ok" for span in fetches)
@@ -0,0 +1,83 @@
+"""Test the event loop blocking watchdog."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.ogero.const import CONF_LOOP_WATCHDOG_THRESHOLD
+from custom_components.ogero.watchdog import LoopWatchdog, get_loop_watchdog_threshold
+
+# Binary fractions, so the recorded sums are exact.
+THRESHOLD = 0.25
+BLOCK = 0.5
+WAIT = 4.0
+
+
+class _FakeClock:
+    """A clock that only moves when the test says so."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+async def _parse(clock: _FakeClock) -> str:
+    """Block, wait while the clock moves on, then block briefly again."""
+    clock.advance(BLOCK)
+    asyncio.get_running_loop().call_soon(clock.advance, WAIT)
+    await asyncio.sleep(0)
+    clock.advance(BLOCK / 4)
+    return "parsed"
+
+
+async def _fail() -> None:
+    await asyncio.sleep(0)
+    raise KeyError
+
+
+async def test_records_longest_step(caplog: pytest.LogCaptureFixture) -> None:
+    """Waiting is not counted; the longest step is compared with the threshold."""
+    clock = _FakeClock()
+    watchdog = LoopWatchdog("12345|01234567", THRESHOLD, clock)
+
+    assert await watchdog.async_track("bills", _parse(clock)) == "parsed"
+
+    counters = watchdog.phases["bills"]
+    assert counters.calls == 1
+    assert counters.over_threshold == 1
+    assert counters.blocked_max == BLOCK
+    assert counters.blocked_total == BLOCK + BLOCK / 4
+    assert "Ogero bills for 12345|01234567 blocked the event loop" in caplog.text
+
+
+async def test_counts_failed_calls() -> None:
+    """Calls that raise are still counted, and the error propagates."""
+    watchdog = LoopWatchdog("line", THRESHOLD, _FakeClock())
+    with pytest.raises(KeyError):
+        await watchdog.async_track("consumption", _fail())
+    assert watchdog.as_dict() == {
+        "threshold_ms": THRESHOLD * 1000,
+        "phases": {
+            "consumption": {
+                "calls": 1,
+                "blocked_total_ms": 0.0,
+                "blocked_max_ms": 0.0,
+                "over_threshold": 0,
+            }
+        },
+    }
+
+
+def test_threshold_option() -> None:
+    """The option is in milliseconds; zero or junk turns the watchdog off."""
+    assert get_loop_watchdog_threshold({}) is None
+    assert get_loop_watchdog_threshold({CONF_LOOP_WATCHDOG_THRESHOLD: 0}) is None
+    assert get_loop_watchdog_threshold({CONF_LOOP_WATCHDOG_THRESHOLD: "x"}) is None
+    assert get_loop_watchdog_threshold({CONF_LOOP_WATCHDOG_THRESHOLD: 250}) == 0.25  # noqa: PLR2004